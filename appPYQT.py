@@ -6,6 +6,7 @@ from pyqtTabs.ViewAll import ViewAllTab
 from pyqtTabs.CourseTab import AddCourseTab
 from pyqtTabs.AssignInstructor import AssignInstructorTab
 from pyqtTabs.RegisterCourse import RegisterCourseTab
+from crud.storageBackend import select_backend_from_args
 
 class SchoolManagementSystem(QMainWindow):
     def __init__(self):
@@ -30,10 +31,11 @@ class SchoolManagementSystem(QMainWindow):
 
 def main():
     """
-    Initializes the QApplication, creates an instance of the SchoolManagementSystem window,
-    displays it, and starts the event loop.
+    Selects the storage backend from the command line (--backend, --data), initializes the QApplication,
+    creates an instance of the SchoolManagementSystem window, displays it, and starts the event loop.
     """
-    app = QApplication(sys.argv)
+    argv = select_backend_from_args(sys.argv)
+    app = QApplication(argv)
     window = SchoolManagementSystem()
     window.show()
     sys.exit(app.exec_())
@@ -1,3 +1,4 @@
+import sys
 import tkinter as tk
 from tkinter import ttk
 from tkinterTabs.StudentTab import AddStudentTab
@@ -6,6 +7,7 @@ from tkinterTabs.CourseTab import AddCourseTab
 from tkinterTabs.AssignInstructor import AssignInstructorTab
 from tkinterTabs.RegisterCourse import RegisterCourseTab
 from tkinterTabs.ViewAll import ViewAllTab
+from crud.storageBackend import select_backend_from_args
 
 class SchoolManagementSystem:
     def __init__(self, root):
@@ -41,6 +43,7 @@ class SchoolManagementSystem:
 
 
 if __name__ == "__main__":
+    select_backend_from_args(sys.argv)
     root = tk.Tk()
     
     app = SchoolManagementSystem(root)
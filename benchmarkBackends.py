@@ -0,0 +1,111 @@
+"""
+This module benchmarks the storage backends against each other through the StorageBackend interface.
+
+Each run works on a copy of the backend's data file in a temporary directory, so the real data is never changed. It
+times the operations the tabs perform: loading every entity set, then adding, editing, registering to a course and
+deleting a number of students, and finally closing the backend, which saves anything it held back.
+
+Usage:
+    python benchmarkBackends.py --backend json --count 500
+    python benchmarkBackends.py --backend database --data ./database.db --count 500
+    python benchmarkBackends.py --backend memory --count 500
+
+Functions:
+    run_benchmark(backend, count): Times the operations on a backend and returns the durations.
+    main(): Parses the command line, runs the benchmark on a copy of the data and prints the results.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from classes.Course import Student
+from crud.storageBackend import backends, select_backend, get_backend
+
+# Data file used by each backend when --data is not given
+default_data = {"database": "./database.db", "memory": "./database.db", "json": "./data.json"}
+
+def run_benchmark(backend, count: int):
+    """
+    Times the operations of the tabs on a backend.
+
+    Args:
+        backend (StorageBackend): The backend to benchmark, working on data that may be changed.
+        count (int): The number of students added, edited, registered and deleted.
+
+    Returns:
+        dict: The duration in seconds of each operation, keyed by its name, and the number of entities loaded
+            under "rows".
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    courses = list(backend.iter_courses())
+    rows = len(courses) + len(list(backend.iter_instructors())) + len(list(backend.iter_students()))
+    timings["load"] = time.perf_counter() - start
+    timings["rows"] = rows
+
+    students = [Student("Benchmark Student", 20, "bench@mail.com", f"9{index:04x}", []) for index in range(count)]
+
+    start = time.perf_counter()
+    for student in students:
+        backend.add_student(student)
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for student in students:
+        student.age = 21
+        backend.edit_student(student)
+    timings["edit"] = time.perf_counter() - start
+
+    if courses:
+        course = courses[0]
+        start = time.perf_counter()
+        for student in students:
+            student.register_course(course)
+            course.enroll_student(student)
+            backend.register_course(student, course)
+        timings["register"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for student in students:
+        backend.delete_student(student)
+    timings["delete"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    backend.close()
+    timings["close"] = time.perf_counter() - start
+
+    return timings
+
+def main():
+    """
+    Parses the command line, runs the benchmark on a copy of the backend's data and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark a storage backend on a copy of its data.")
+    parser.add_argument("--backend", choices=list(backends), default="database", help="Storage backend to benchmark")
+    parser.add_argument("--data", help="Data file to copy and benchmark on")
+    parser.add_argument("--count", type=int, default=200, help="Number of students to add, edit, register and delete")
+    args = parser.parse_args()
+
+    source = args.data or default_data[args.backend]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, os.path.basename(source))
+        shutil.copyfile(source, path)
+        select_backend(args.backend, path=path)
+        timings = run_benchmark(get_backend(), args.count)
+
+    rows = timings.pop("rows")
+    print(f"{args.backend} backend, {args.count} students, data copied from {source}")
+    for operation, duration in timings.items():
+        if operation == "load":
+            per_item = f" ({rows} rows, {rows / duration:.0f} rows/s)" if duration else f" ({rows} rows)"
+        elif operation == "close":
+            per_item = ""
+        else:
+            per_item = f" ({duration / args.count * 1e6:.0f} us each)"
+        print(f"  {operation:<9}{duration:9.3f} s{per_item}")
+
+if __name__ == "__main__":
+    main()
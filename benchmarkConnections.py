@@ -0,0 +1,107 @@
+"""
+This module benchmarks the pooled SQLite connection of crud.databaseCRUD against opening a connection per call.
+
+The databaseCRUD functions used to open a connection, run their statement and close it again on every call; they now
+reuse one connection per thread, opened once and tuned with `connection_pragmas`. The benchmark builds a database
+with a given number of students in a temporary directory, then times the same databaseCRUD functions, editing a
+student and reading a page of students, first with `connect_db` replaced by a plain `sqlite3.connect` (the
+connection is closed when the function returns and drops it), then with the pool. The database is migrated first, so
+both runs use the same indexes, and the per call run goes first, so it sees the file in its original rollback journal
+mode, as it did before the pool switched it to WAL.
+
+Usage:
+    python benchmarkConnections.py
+    python benchmarkConnections.py --students 100000 --count 2000
+
+Functions:
+    run_benchmark(path, count): Times the calls with a connection per call and pooled, and returns the durations.
+    main(): Parses the command line, runs the benchmark in a temporary directory and prints the results.
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import mock
+from benchmarkStartup import make_database
+from classes.Course import Student
+from crud import databaseCRUD
+
+def _connect_per_call():
+    """
+    Opens a new connection, the way connect_db did before the pool.
+    """
+    return sqlite3.connect(databaseCRUD.database_path)
+
+def _time_calls(student: Student, count: int):
+    """
+    Returns the average duration in seconds of `edit_student` on `student` and of `fetch_students_page` over
+    `count` calls each.
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    for number in range(count):
+        student.age = 20 + number % 10
+        valid, errors = databaseCRUD.edit_student(student)
+        if not valid:
+            raise AssertionError("\n".join(errors))
+    timings["edit"] = (time.perf_counter() - start) / count
+
+    start = time.perf_counter()
+    for number in range(count):
+        if not databaseCRUD.fetch_students_page(f"s{number * 37 % 90000:07d}", 50):
+            raise AssertionError("The page of students is empty")
+    timings["page"] = (time.perf_counter() - start) / count
+    return timings
+
+def run_benchmark(path: str, count: int):
+    """
+    Times `count` edits and page reads on the database at `path`, with a connection per call and then pooled.
+
+    Args:
+        path (str): The database to run on, which is changed.
+        count (int): The number of calls of each function.
+
+    Returns:
+        dict: For "per call" and "pooled", the average duration in seconds of one "edit" and one "page" read.
+    """
+    student = Student("Benchmark Student", 20, "bench@mail.com", "bench", [])
+    previous = databaseCRUD.database_path
+    databaseCRUD.database_path = path
+    conn = _connect_per_call()
+    databaseCRUD.migrate_db(conn)
+    conn.close()
+    try:
+        with mock.patch.object(databaseCRUD, "connect_db", _connect_per_call):
+            valid, errors = databaseCRUD.add_student(student)
+            if not valid:
+                raise AssertionError("\n".join(errors))
+            per_call = _time_calls(student, count)
+        pooled = _time_calls(student, count)
+    finally:
+        databaseCRUD.close_db()
+        databaseCRUD.database_path = previous
+    return {"per call": per_call, "pooled": pooled}
+
+def main():
+    """
+    Parses the command line, runs the benchmark in a temporary directory and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the pooled connection against a connection per call.")
+    parser.add_argument("--students", type=int, default=100_000, help="Number of students in the database")
+    parser.add_argument("--count", type=int, default=1_000, help="Number of calls of each function")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "database.db")
+        make_database(path, args.students, max(args.students // 100, 2), max(args.students // 500, 1))
+        results = run_benchmark(path, args.count)
+
+    print(f"{args.students} students, {args.count} calls, average per call")
+    for name, timings in results.items():
+        print(f"  {name:<9}edit {timings['edit'] * 1e6:9.1f} us  page {timings['page'] * 1e6:9.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+This module benchmarks looking up and deleting entities in a shared Registry against the list scans it replaced.
+
+The tab handlers used to find an entity with `next(...)` over the shared list and delete it with `list.remove`, both
+O(n); the registries of shared.py look entities up and remove them by id in O(1). For each size, the same randomly
+chosen students are looked up and then deleted in a plain list and in a loaded Registry, and the average cost of one
+operation is printed.
+
+Usage:
+    python benchmarkRegistry.py
+    python benchmarkRegistry.py --sizes 10000 100000 --count 200
+
+Functions:
+    make_students(size): Builds the students the benchmark runs on.
+    run_benchmark(size, count): Times the lookups and deletes at one size and returns the durations.
+    main(): Parses the command line, runs the benchmark at each size and prints the results.
+"""
+
+import argparse
+import random
+import time
+from classes.Student import Student
+from shared import Registry
+
+def make_students(size: int):
+    """
+    Builds `size` students with distinct ids.
+
+    Returns:
+        list: The students.
+    """
+    return [Student("Benchmark Student", 20, "bench@mail.com", f"{index:07d}", []) for index in range(size)]
+
+def run_benchmark(size: int, count: int):
+    """
+    Times `count` lookups and deletes of random students in a list and in a Registry of `size` students.
+
+    Args:
+        size (int): The number of students.
+        count (int): The number of students looked up, then deleted.
+
+    Returns:
+        dict: The average duration in seconds of one operation, keyed by "list lookup", "list delete",
+            "registry lookup" and "registry delete".
+    """
+    students = make_students(size)
+    ids = [student.student_id for student in random.Random(size).sample(students, count)]
+    timings = {}
+
+    start = time.perf_counter()
+    for student_id in ids:
+        next(student for student in students if student.student_id == student_id)
+    timings["list lookup"] = (time.perf_counter() - start) / count
+
+    start = time.perf_counter()
+    for student_id in ids:
+        students.remove(next(student for student in students if student.student_id == student_id))
+    timings["list delete"] = (time.perf_counter() - start) / count
+
+    registry = Registry("student_id", lambda: make_students(size))
+    registry.load()
+
+    start = time.perf_counter()
+    for student_id in ids:
+        registry.get(student_id)
+    timings["registry lookup"] = (time.perf_counter() - start) / count
+
+    start = time.perf_counter()
+    for student_id in ids:
+        registry.remove(registry.get(student_id))
+    timings["registry delete"] = (time.perf_counter() - start) / count
+
+    return timings
+
+def main():
+    """
+    Parses the command line, runs the benchmark at each size and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Registry lookups and deletes against list scans.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Numbers of students to benchmark with")
+    parser.add_argument("--count", type=int, default=100, help="Number of students to look up and delete")
+    args = parser.parse_args()
+
+    print(f"{args.count} lookups and deletes, average per operation")
+    for size in args.sizes:
+        timings = run_benchmark(size, min(args.count, size))
+        results = "  ".join(f"{operation} {duration * 1e6:9.1f} us" for operation, duration in timings.items())
+        print(f"  {size:>9,}  {results}")
+
+if __name__ == "__main__":
+    main()
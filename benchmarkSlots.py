@@ -0,0 +1,93 @@
+"""
+This module measures the memory the entity classes take per million students, with and without __slots__.
+
+Person, Student, Instructor and Course declare __slots__, so their instances carry no per-instance __dict__. The
+benchmark builds the same students as slotted `Student` objects and as instances of `DictStudent`, a copy of the class
+without __slots__ as the entities were before, and measures each list with tracemalloc. The names, emails and ids
+are counted too; they are the same for both classes, so the difference is the overhead of the objects. The size of
+one object, with its __dict__ but not its attributes, is also printed.
+
+Usage:
+    python benchmarkSlots.py
+    python benchmarkSlots.py --students 1000000 --courses 2
+
+Classes:
+    DictStudent: A student stored in a per-instance __dict__, with the attributes of Student.
+
+Functions:
+    make_students(cls, count, courses): Builds students of the given class.
+    measure(cls, count, courses): Returns the memory traced while building the students.
+    main(): Parses the command line, measures both classes and prints the results.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from classes.Course import Student
+from classes.IdSet import IdSet
+
+class DictStudent:
+    def __init__(self, name: str, age: int, email: str, student_id: str, registered_courses: list):
+        """
+        Initializes a DictStudent with the same attributes as Student, stored in the instance __dict__.
+
+        Attributes:
+            name (str): The name of the student.
+            age (int): The age of the student.
+            _email (str): The email of the student.
+            student_id (str): The unique identifier for the student.
+            registered_courses (IdSet): The IDs of the courses the student is registered in.
+        """
+        self.name = name
+        self.age = age
+        self._email = email
+        self.student_id = student_id
+        self.registered_courses = IdSet.fromkeys(registered_courses)
+
+def make_students(cls, count: int, courses: int):
+    """
+    Builds `count` students of class `cls`, each registered in `courses` courses whose ids are shared.
+
+    Returns:
+        list: The students.
+    """
+    course_ids = [f"c{index:04d}" for index in range(courses)]
+    return [cls(f"Student {index}", 18 + index % 10, f"student{index}@mail.com", f"{index:07d}", course_ids)
+            for index in range(count)]
+
+def measure(cls, count: int, courses: int):
+    """
+    Builds the students under tracemalloc.
+
+    Returns:
+        tuple: The bytes still allocated once the students are built, and the size of one student object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    students = make_students(cls, count, courses)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    object_size = sys.getsizeof(students[0])
+    if hasattr(students[0], "__dict__"):
+        object_size += sys.getsizeof(students[0].__dict__)
+    del students
+    return size, object_size
+
+def main():
+    """
+    Parses the command line, measures both classes and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Measure the memory of slotted and dict-backed students.")
+    parser.add_argument("--students", type=int, default=1_000_000, help="Number of students")
+    parser.add_argument("--courses", type=int, default=0, help="Number of courses each student is registered in")
+    args = parser.parse_args()
+
+    print(f"{args.students} students, {args.courses} courses each, Python {sys.version.split()[0]}")
+    for name, cls in (("dict-backed", DictStudent), ("slotted", Student)):
+        size, object_size = measure(cls, args.students, args.courses)
+        print(f"  {name:<12}{size / 1e6:8.1f} MB  {size / args.students:6.0f} B per student  "
+              f"object {object_size} B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+This module benchmarks the binary snapshot format of the JSON backend (crud.binarySnapshot) against data.json.
+
+It builds a document shaped like data.json with a given number of students, then times saving it and loading it back
+in each format, the way crud.jsonCRUD writes and reads its snapshots: indented JSON with `json.dump` and `json.load`,
+or `binarySnapshot.dumps` and `binarySnapshot.loads`, including the file I/O. The best of a few runs is kept, the
+file sizes are compared and the binary snapshot is checked to load back equal to the JSON document.
+
+Usage:
+    python benchmarkSnapshot.py
+    python benchmarkSnapshot.py --students 1000000 --repeat 3
+
+Functions:
+    make_document(students): Builds a document shaped like data.json.
+    run_benchmark(data, directory, repeat): Times saving and loading in both formats and returns the results.
+    main(): Parses the command line, runs the benchmark in a temporary directory and prints the results.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from crud import binarySnapshot
+
+def make_document(students: int):
+    """
+    Builds a document shaped like data.json: `students` students registered to two courses each, one course per
+    hundred students and one instructor per five courses.
+
+    Returns:
+        dict: The document.
+    """
+    courses = max(students // 100, 2)
+    instructors = max(courses // 5, 1)
+    return {
+        "Student": [{"name": f"Student {index}", "age": 18 + index % 10, "_email": f"student{index}@mail.com",
+                     "student_id": f"{index:07d}",
+                     "registered_courses": [f"c{index % courses:06d}", f"c{(index + 1) % courses:06d}"]}
+                    for index in range(students)],
+        "Instructor": [{"name": f"Instructor {index}", "age": 40, "_email": f"instructor{index}@mail.com",
+                        "instructor_id": f"i{index:06d}",
+                        "assigned_courses": [f"c{course:06d}" for course in range(index, courses, instructors)]}
+                       for index in range(instructors)],
+        "Course": [{"course_id": f"c{index:06d}", "course_name": f"Course {index}",
+                    "instructor_id": f"i{index % instructors:06d}",
+                    "enrolled_students": [f"{student:07d}" for student in (index - 1, index) if student >= 0]}
+                   for index in range(courses)],
+    }
+
+def _best(function, repeat):
+    """
+    Returns the shortest duration of `repeat` calls of `function`, and the result of the last one.
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best, result
+
+def run_benchmark(data: dict, directory: str, repeat: int = 3):
+    """
+    Times saving and loading `data` as indented JSON and as a binary snapshot.
+
+    Args:
+        data (dict): The document to save and load.
+        directory (str): The directory the files are written to.
+        repeat (int): The number of runs of each operation; the shortest is kept.
+
+    Returns:
+        dict: For each format ("json" and "binary"), a dict with the "save" and "load" durations in seconds and the
+            file "size" in bytes.
+    """
+    json_path = os.path.join(directory, "data.json")
+    binary_path = os.path.join(directory, "data.bin")
+
+    def save_json():
+        with open(json_path, 'w') as f:
+            json.dump(data, f, indent=4)
+
+    def load_json():
+        with open(json_path) as f:
+            return json.load(f)
+
+    def save_binary():
+        with open(binary_path, 'wb') as f:
+            f.write(binarySnapshot.dumps(data))
+
+    def load_binary():
+        with open(binary_path, 'rb') as f:
+            return binarySnapshot.loads(f.read())
+
+    results = {}
+    for name, path, save, load in (("json", json_path, save_json, load_json),
+                                   ("binary", binary_path, save_binary, load_binary)):
+        save_time, _ = _best(save, repeat)
+        load_time, loaded = _best(load, repeat)
+        if loaded != data:
+            raise AssertionError(f"The {name} file did not load back equal to the document")
+        results[name] = {"save": save_time, "load": load_time, "size": os.path.getsize(path)}
+    return results
+
+def main():
+    """
+    Parses the command line, runs the benchmark in a temporary directory and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark binary snapshots against data.json.")
+    parser.add_argument("--students", type=int, default=100_000, help="Number of students in the document")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each operation")
+    args = parser.parse_args()
+
+    data = make_document(args.students)
+    with tempfile.TemporaryDirectory() as directory:
+        results = run_benchmark(data, directory, args.repeat)
+
+    print(f"{args.students} students, best of {args.repeat}")
+    print(f"  {'':<7}{'save':>9}{'load':>11}{'size':>12}")
+    for name, result in results.items():
+        print(f"  {name:<7}{result['save']:9.3f} s{result['load']:9.3f} s{result['size'] / 1e6:9.1f} MB")
+
+if __name__ == "__main__":
+    main()
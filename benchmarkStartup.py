@@ -0,0 +1,146 @@
+"""
+This module benchmarks the startup of the PyQt application: constructing and showing the main window.
+
+The tabs used to fill their dropdowns and the View All tables while they were constructed, so every entity set was
+loaded from the backend, and the View All tables formatted, before the first window appeared. They now start empty
+and load their data through their TaskRunner once the window is up. The benchmark builds a database with a given
+number of students in a temporary directory, then measures in a fresh process for each way of starting:
+
+    - eager: loading every entity set and formatting the View All tables on the GUI thread, as the constructors did,
+      then constructing and showing the window
+    - first window: constructing and showing the window as the application does now
+    - all loaded: the time until the dropdowns and the View All tables are filled after that
+
+The window is created with the offscreen Qt platform, so no display is needed.
+
+Usage:
+    python benchmarkStartup.py
+    python benchmarkStartup.py --students 100000 --courses 1000 --instructors 200
+
+Functions:
+    make_database(path, students, courses, instructors): Builds a database of generated entities.
+    measure_startup(path, eager): Starts the application on a database and returns the durations.
+    run_benchmark(path): Measures each way of starting in a fresh process and returns the durations.
+    main(): Parses the command line, runs the benchmark in a temporary directory and prints the results.
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+REPO_DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database.db")
+
+def make_database(path: str, students: int, courses: int, instructors: int):
+    """
+    Copies the repository database to `path` and adds `students` students registered to two courses each, `courses`
+    courses and `instructors` instructors, each course being assigned to one of them.
+    """
+    shutil.copyfile(REPO_DATABASE, path)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.executemany("INSERT INTO Instructor VALUES (?, ?, ?, ?)",
+                               ((f"i{index:06d}", f"Instructor {index}", 40, f"instructor{index}@mail.com")
+                                for index in range(instructors)))
+        connection.executemany("INSERT INTO Course VALUES (?, ?, ?)",
+                               ((f"c{index:06d}", f"Course {index}", f"i{index % instructors:06d}")
+                                for index in range(courses)))
+        connection.executemany("INSERT INTO Student VALUES (?, ?, ?, ?)",
+                               ((f"s{index:07d}", f"Student {index}", 18 + index % 10, f"student{index}@mail.com")
+                                for index in range(students)))
+        connection.executemany("INSERT INTO Enrollment VALUES (?, ?)",
+                               ((f"c{(index + offset) % courses:06d}", f"s{index:07d}")
+                                for index in range(students) for offset in (0, 1)))
+    connection.close()
+
+def _wait_until(app, condition, timeout: float = 600):
+    """
+    Processes the Qt events until `condition()` is true.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("The tabs did not finish loading their data")
+        app.processEvents()
+        time.sleep(0.001)
+
+def measure_startup(path: str, eager: bool):
+    """
+    Starts the application on the database at `path`, in the current process, and times it.
+
+    Args:
+        path (str): The database to start on.
+        eager (bool): Whether to load and format everything on the GUI thread before constructing the window.
+
+    Returns:
+        dict: The duration in seconds until the window is shown, under "first window", and until every tab has
+            its data, under "all loaded".
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from crud.storageBackend import select_backend
+    select_backend("database", path=path)
+    import shared
+    from appPYQT import SchoolManagementSystem
+
+    app = QApplication([])
+    start = time.perf_counter()
+    if eager:
+        for registry in (shared.students, shared.instructors, shared.courses):
+            registry.load()
+    window = SchoolManagementSystem()
+    tabs = window.centralWidget()
+    view_all = tabs.widget(tabs.count() - 1)
+    if eager:
+        view_all.show_table_data(view_all.load_table_data(view_all.snapshot_table_data()))
+    window.show()
+    app.processEvents()
+    timings = {"first window": time.perf_counter() - start}
+
+    student_dropdown = tabs.widget(0).student_dropdown
+    _wait_until(app, lambda: len(view_all.students_data) == len(shared.students) > 0
+                and student_dropdown.count() == len(shared.students))
+    timings["all loaded"] = time.perf_counter() - start
+    window.close()
+    return timings
+
+def run_benchmark(path: str):
+    """
+    Measures starting eagerly and starting as the application does, each in a fresh process so nothing is loaded yet.
+
+    Args:
+        path (str): The database to start on.
+
+    Returns:
+        dict: The "eager", "first window" and "all loaded" durations in seconds.
+    """
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        eager = pool.apply(measure_startup, (path, True))
+        lazy = pool.apply(measure_startup, (path, False))
+    return {"eager": eager["first window"], "first window": lazy["first window"], "all loaded": lazy["all loaded"]}
+
+def main():
+    """
+    Parses the command line, runs the benchmark in a temporary directory and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the construction of the main window.")
+    parser.add_argument("--students", type=int, default=100_000, help="Number of students in the database")
+    parser.add_argument("--courses", type=int, default=1_000, help="Number of courses in the database")
+    parser.add_argument("--instructors", type=int, default=200, help="Number of instructors in the database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "database.db")
+        make_database(path, args.students, args.courses, args.instructors)
+        timings = run_benchmark(path)
+
+    print(f"{args.students} students, {args.courses} courses, {args.instructors} instructors")
+    for name, duration in timings.items():
+        print(f"  {name:<13}{duration:9.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+This module benchmarks the batch validation of entities (validate_many) against calling validate on each one.
+
+It builds students and courses of which a small share is invalid (too young, too short a name, a malformed email, a
+wrong id or course name length), then validates them with a loop over `validate`, as bulk imports used to, and with
+`validate_many`, which checks one column at a time. The best of a few runs is kept and both error reports are
+checked to be identical.
+
+Usage:
+    python benchmarkValidation.py
+    python benchmarkValidation.py --count 100000 --repeat 3
+
+Functions:
+    make_students(count): Builds students, about 7% of them invalid.
+    make_courses(count): Builds courses, about 3% of them invalid.
+    loop_report(entities): Validates each entity with `validate` and returns the report `validate_many` returns.
+    run_benchmark(entities, repeat): Times both ways of validating and returns the durations.
+    main(): Parses the command line, runs the benchmark on students and courses and prints the results.
+"""
+
+import argparse
+import time
+from classes.Course import Course, Student
+
+def make_students(count: int):
+    """
+    Builds `count` students; one in 40 is too young, one in 50 has a one letter name and one in 40 a malformed
+    email, about 7% being invalid in all.
+
+    Returns:
+        list: The students.
+    """
+    return [Student("S" if index % 50 == 1 else f"Student {index}",
+                    16 if index % 40 == 0 else 20,
+                    f"student{index}.mail.com" if index % 40 == 3 else f"student{index}@mail.com",
+                    f"{index % 100000:05d}", [])
+            for index in range(count)]
+
+def make_courses(count: int):
+    """
+    Builds `count` courses; one in 50 has a course name that is not 7 characters long and one in 100 an id that is
+    not 5 characters long, about 3% being invalid in all.
+
+    Returns:
+        list: The courses.
+    """
+    return [Course(f"{index:06d}" if index % 100 == 7 else f"{index % 100000:05d}",
+                   "COURSE" if index % 50 == 0 else "EECE435", "", [])
+            for index in range(count)]
+
+def loop_report(entities):
+    """
+    Validates each entity with `validate`, the way bulk imports did before `validate_many`.
+
+    Returns:
+        tuple: The same report as `validate_many`: whether all are valid and the errors keyed by position.
+    """
+    errors = {}
+    for position, entity in enumerate(entities):
+        valid, messages = entity.validate()
+        if not valid:
+            errors[position] = messages
+    return not errors, errors
+
+def _best(function, repeat):
+    """
+    Returns the shortest duration of `repeat` calls of `function`, and the result of the last one.
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best, result
+
+def run_benchmark(entities, repeat: int = 2):
+    """
+    Times validating `entities` with a loop over `validate` and with `validate_many`.
+
+    Args:
+        entities (list): The entities to validate, all of one class.
+        repeat (int): The number of runs of each; the shortest is kept.
+
+    Returns:
+        dict: The "loop" and "batch" durations in seconds, and the number of "invalid" entities.
+    """
+    loop_time, expected = _best(lambda: loop_report(entities), repeat)
+    batch_time, report = _best(lambda: type(entities[0]).validate_many(entities), repeat)
+    if report != expected:
+        raise AssertionError("validate_many and the loop over validate produced different reports")
+    return {"loop": loop_time, "batch": batch_time, "invalid": len(report[1])}
+
+def main():
+    """
+    Parses the command line, runs the benchmark on students and courses and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark validate_many against a loop over validate.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Number of students and of courses")
+    parser.add_argument("--repeat", type=int, default=2, help="Number of runs of each")
+    args = parser.parse_args()
+
+    print(f"{args.count} records, best of {args.repeat}")
+    for name, make in (("students", make_students), ("courses", make_courses)):
+        result = run_benchmark(make(args.count), args.repeat)
+        print(f"  {name:<9}{result['invalid'] / args.count:6.1%} invalid  "
+              f"loop {result['loop']:6.2f} s  validate_many {result['batch']:6.2f} s")
+    print("  reports identical")
+
+if __name__ == "__main__":
+    main()
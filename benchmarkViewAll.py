@@ -0,0 +1,146 @@
+"""
+This module benchmarks the View All refresh: formatting every student, instructor and course into table rows.
+
+The formatters of the ViewAll tabs resolve the course, student and instructor names through lookup tables built once
+per refresh; they used to scan the entity lists for every id, which is O(courses x enrollments x students). The
+benchmark builds random entities, then times the tkinter tab's refresh as it runs: copying the fields shown on the
+main loop (snapshot_table_data) and formatting the copy with the search indexes (load_table_data). With --scan it
+also times the original scanning formatters and checks that both produce the same rows.
+
+Usage:
+    python benchmarkViewAll.py
+    python benchmarkViewAll.py --students 5000 --courses 200 --enrollments 50000 --scan
+
+Functions:
+    make_data(students, courses, instructors, enrollments): Builds random entities enrolled in random courses.
+    scan_table_data(students, instructors, courses): Formats the rows with the original list scans.
+    run_benchmark(students, instructors, courses, scan): Times the refresh and returns the durations.
+    main(): Parses the command line, runs the benchmark and prints the results.
+"""
+
+import argparse
+import random
+import time
+from classes.Course import Course, Student, Instructor
+from tkinterTabs.ViewAll import ViewAllTab
+
+def make_data(students: int, courses: int, instructors: int, enrollments: int):
+    """
+    Builds random entities: every course is assigned to a random instructor, and `enrollments` distinct random
+    (student, course) pairs are registered on both sides.
+
+    Returns:
+        tuple: The lists of students, instructors and courses.
+    """
+    generator = random.Random(0)
+    student_list = [Student(f"Student {index}", 20, "student@mail.com", f"{index:07d}", []) for index in range(students)]
+    instructor_list = [Instructor(f"Instructor {index}", 40, "instructor@mail.com", f"i{index:06d}", [])
+                       for index in range(instructors)]
+    course_list = [Course(f"c{index:06d}", f"Course {index}", "", []) for index in range(courses)]
+    for course in course_list:
+        instructor = generator.choice(instructor_list)
+        course.assign_instructor(instructor)
+        instructor.assign_course(course)
+
+    pairs = set()
+    while len(pairs) < min(enrollments, students * courses):
+        pairs.add((generator.randrange(students), generator.randrange(courses)))
+    for student_index, course_index in pairs:
+        student, course = student_list[student_index], course_list[course_index]
+        student.register_course(course)
+        course.enroll_student(student)
+    return student_list, instructor_list, course_list
+
+def scan_table_data(students, instructors, courses):
+    """
+    Formats the rows of every table the way the tkinter ViewAll tab did before its lookup tables, scanning the
+    entity lists for every id.
+
+    Returns:
+        tuple: The students, instructors and courses rows.
+    """
+    students_data = []
+    for student in students:
+        course_names = [
+            next(course.course_name for course in courses if course.course_id == course_id)
+            for course_id in student.registered_courses
+        ] if student.registered_courses else ['No Courses']
+        students_data.append((student.student_id, student.name, student.age, student._email, " ".join(course_names)))
+
+    instructors_data = []
+    for instructor in instructors:
+        course_names = [
+            next(course.course_name for course in courses if course.course_id == course_id)
+            for course_id in instructor.assigned_courses
+        ] if instructor.assigned_courses else ['No Courses']
+        instructors_data.append((instructor.instructor_id, instructor.name, instructor.age, instructor._email,
+                                 " ".join(course_names)))
+
+    courses_data = []
+    for course in courses:
+        instructor_id = course.instructor_id
+        instructor_name = list(filter(lambda instructor: instructor.instructor_id == instructor_id, instructors))[0].name if instructor_id else 'No Instructor'
+        student_names = [
+            next(student.name for student in students if student.student_id == student_id)
+            for student_id in course.enrolled_students
+        ] if course.enrolled_students else ['No Students']
+        courses_data.append((course.course_id, course.course_name, instructor_name, " ".join(student_names)))
+    return students_data, instructors_data, courses_data
+
+def run_benchmark(students, instructors, courses, scan: bool = False):
+    """
+    Times the refresh of the tkinter ViewAll tab on the given entities, without creating its widgets.
+
+    Args:
+        students (list): The students.
+        instructors (list): The instructors.
+        courses (list): The courses.
+        scan (bool): Whether to also time the original scanning formatters and compare their rows.
+
+    Returns:
+        dict: The duration in seconds of "snapshot" and "format", and of "scan" if requested.
+    """
+    tab = ViewAllTab.__new__(ViewAllTab)
+    tab.students, tab.instructors, tab.courses = students, instructors, courses
+    timings = {}
+
+    start = time.perf_counter()
+    snapshot = tab.snapshot_table_data()
+    timings["snapshot"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table_data = tab.load_table_data(snapshot)
+    timings["format"] = time.perf_counter() - start
+
+    if scan:
+        start = time.perf_counter()
+        scanned = scan_table_data(students, instructors, courses)
+        timings["scan"] = time.perf_counter() - start
+        if scanned != table_data[:3]:
+            raise AssertionError("The formatters and the original scans produced different rows")
+    return timings
+
+def main():
+    """
+    Parses the command line, runs the benchmark and prints the results.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the View All refresh.")
+    parser.add_argument("--students", type=int, default=50_000, help="Number of students")
+    parser.add_argument("--courses", type=int, default=2_000, help="Number of courses")
+    parser.add_argument("--instructors", type=int, default=500, help="Number of instructors")
+    parser.add_argument("--enrollments", type=int, default=500_000, help="Number of enrollments")
+    parser.add_argument("--scan", action="store_true", help="Also time the original scans (slow at large sizes)")
+    args = parser.parse_args()
+
+    students, instructors, courses = make_data(args.students, args.courses, args.instructors, args.enrollments)
+    timings = run_benchmark(students, instructors, courses, args.scan)
+
+    print(f"{args.students} students, {args.courses} courses, {args.instructors} instructors, "
+          f"{args.enrollments} enrollments")
+    for operation, duration in timings.items():
+        print(f"  {operation:<9}{duration:9.3f} s")
+    if args.scan:
+        print("  rows identical")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,36 @@
 from .Instructor import Instructor
 from .Student import Student
+from .IdSet import IdSet
+from .batchBuild import build_many
+from .Person import error_report
+
+def _fill_from_db(course, row, intern):
+    """
+    Fills in a Course built by `Course.from_db_many` from a database tuple, interning its ids.
+    """
+    course_id, course_name, instructor_id, enrolled_students = row
+    course.course_id = intern(course_id, course_id)
+    course.course_name = course_name
+    course.instructor_id = intern(instructor_id, instructor_id)
+    ids = enrolled_students.split(",") if enrolled_students is not None else ()
+    course.enrolled_students = IdSet.fromkeys(map(intern, ids, ids))
+
+def _fill_from_json(course, row, intern):
+    """
+    Fills in a Course built by `Course.from_json_many` from a JSON object, interning its ids.
+    """
+    course_id = row.get("course_id")
+    course.course_id = intern(course_id, course_id)
+    course.course_name = row.get("course_name")
+    instructor_id = row.get("instructor_id")
+    course.instructor_id = intern(instructor_id, instructor_id)
+    ids = row.get("enrolled_students", [])
+    course.enrolled_students = IdSet.fromkeys(map(intern, ids, ids))
 
 class Course:
+    # Attributes are kept in slots instead of a per-instance __dict__, which keeps each entity small
+    __slots__ = ("course_id", "course_name", "instructor_id", "enrolled_students")
+
     def __init__(self,course_id : str, course_name: str, instructor_id : str, enrolled_students: list ):
         """
         Initializes a Course instance
@@ -11,11 +40,14 @@ class Course:
             course_name (str): The name of the course.
             instructor_id (str): The ID of the instructor assigned to the course.
             enrolled_students (list): A list of student IDs enrolled in the course.
+
+        Attributes:
+            enrolled_students (IdSet): The IDs of the students enrolled in the course, in enrollment order.
         """
         self.course_id = course_id
         self.course_name = course_name
         self.instructor_id = instructor_id
-        self.enrolled_students = enrolled_students
+        self.enrolled_students = IdSet.fromkeys(enrolled_students)
 
     def __str__(self):
         """
@@ -74,8 +106,7 @@ class Course:
                 - bool: True if the student was enrolled, False if already enrolled.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if student.student_id not in self.enrolled_students:
-            self.enrolled_students.append(student.student_id)
+        if self.enrolled_students.add(student.student_id):
             return True, ["Student assigned to course"]
         else: 
             return False, ["Student already in course"]
@@ -92,12 +123,35 @@ class Course:
                 - bool: True if the student was enrolled, False if already enrolled.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if student.student_id not in self.enrolled_students:
+        if not self.enrolled_students.discard(student.student_id):
             return False, ["Student not in course"]
         else: 
-            self.enrolled_students.remove(student.student_id)
             return True, ["Student unregistered to course"]
 
+    def enroll_students(self, students):
+        """
+        Enrolls many students to the course at once.
+
+        Args:
+            students (iterable): Instances of the Student class to enroll.
+
+        Returns:
+            list: A list with one tuple per student, in input order, as returned by `enroll_student`.
+        """
+        return [self.enroll_student(student) for student in students]
+
+    def unenroll_students(self, students):
+        """
+        Unenrolls many students from the course at once.
+
+        Args:
+            students (iterable): Instances of the Student class to unenroll.
+
+        Returns:
+            list: A list with one tuple per student, in input order, as returned by `unenroll_student`.
+        """
+        return [self.unenroll_student(student) for student in students]
+
     def validate(self):
         """
         Validates the course details.
@@ -122,9 +176,45 @@ class Course:
             return True, ["Validation Passed!"]
         
     @classmethod
-    def from_json(cls, json_object : dict):
+    def validate_many(cls, courses):
         """
-        Creates a Course instance from a JSON object.
+        Validates many courses at once, with the same checks and messages as `validate`, one column at a time.
+
+        Args:
+            courses (list): The Course objects to validate.
+
+        Returns:
+            tuple: A tuple containing:
+                - bool: True if every course passed validation, False otherwise.
+                - dict: The list of error messages of each invalid course, keyed by its position in `courses`.
+        """
+        names = [course.course_name for course in courses]
+        ids = [course.course_id for course in courses]
+        return error_report((
+            ("Not a valid course name", [position for position, name in enumerate(names) if len(name) != 7]),
+            ("Not a valid course id", [position for position, id in enumerate(ids) if len(id) != 5]),
+        ))
+
+    def to_dict(self):
+        """
+        Returns the course's details as a dictionary, in the layout of the JSON file.
+
+        The list of enrolled students is copied, so later changes to the course do not change the dictionary.
+
+        Returns:
+            dict: A dictionary with the course_id, course_name, instructor_id and enrolled_students of the course.
+        """
+        return {
+            "course_id": self.course_id,
+            "course_name": self.course_name,
+            "instructor_id": self.instructor_id,
+            "enrolled_students": list(self.enrolled_students),
+        }
+
+    @classmethod
+    def from_dict(cls, json_object : dict):
+        """
+        Creates a Course instance from a dictionary as returned by `to_dict`.
 
         Args:
             json_object (dict): A dictionary representing course data.
@@ -138,6 +228,19 @@ class Course:
         enrolled_students = json_object.get("enrolled_students",[])
         return cls(course_id,course_name,instructor_id,enrolled_students) 
 
+    @classmethod
+    def from_json(cls, json_object : dict):
+        """
+        Creates a Course instance from a JSON object.
+
+        Args:
+            json_object (dict): A dictionary representing course data.
+
+        Returns:
+            Course: An instance of the Course class.
+        """
+        return cls.from_dict(json_object)
+
     @classmethod
     def from_db(cls, db_object : tuple):
         """
@@ -153,4 +256,37 @@ class Course:
         course_name = db_object[1]
         instructor_id = db_object[2]
         enrolled_students = db_object[3].split(",") if db_object[3] is not None else []
-        return cls(course_id,course_name,instructor_id,enrolled_students)
\ No newline at end of file
+        return cls(course_id,course_name,instructor_id,enrolled_students)
+
+    @classmethod
+    def from_db_many(cls, db_objects, interned: dict = None):
+        """
+        Creates Course instances from many database tuples at once.
+
+        The objects are filled in directly instead of going through `from_db` and `__init__` for every row, with
+        the garbage collector paused, and every id is interned through `interned`, so the ids in the
+        enrolled_students of all the courses share one string per distinct id.
+
+        Args:
+            db_objects (iterable): Tuples representing course data from the database.
+            interned (dict): The canonical string of each id seen so far, shared between calls to reuse the
+                same strings across batches. A new one is used if not given.
+
+        Returns:
+            list: The Course instances, in row order.
+        """
+        return build_many(cls, db_objects, _fill_from_db, interned)
+
+    @classmethod
+    def from_json_many(cls, json_objects, interned: dict = None):
+        """
+        Creates Course instances from many JSON objects at once, as `from_db_many` does for database tuples.
+
+        Args:
+            json_objects (iterable): Dictionaries representing course data.
+            interned (dict): The canonical string of each id seen so far, see `from_db_many`.
+
+        Returns:
+            list: The Course instances, in input order.
+        """
+        return build_many(cls, json_objects, _fill_from_json, interned)
@@ -0,0 +1,44 @@
+class IdSet(dict):
+    """
+    An insertion-ordered set of ids, used for the registered courses of a student, the assigned courses of an
+    instructor and the enrolled students of a course.
+
+    The ids are the keys of a dict (with None values), so membership, adding and removing take constant time
+    while iteration still yields the ids in the order they were added, which the View All rows and the JSON
+    file show. Create one from a list of ids with `IdSet.fromkeys(ids)`.
+    """
+
+    __slots__ = ()
+
+    def add(self, id: str):
+        """
+        Adds an id at the end of the set if it is not in it already.
+
+        Args:
+            id (str): The id to add.
+
+        Returns:
+            bool: True if the id was added, False if it was already in the set.
+        """
+        if id in self:
+            return False
+        self[id] = None
+        return True
+
+    def discard(self, id: str):
+        """
+        Removes an id from the set if it is in it.
+
+        Args:
+            id (str): The id to remove.
+
+        Returns:
+            bool: True if the id was removed, False if it was not in the set.
+        """
+        if id not in self:
+            return False
+        del self[id]
+        return True
+
+    def __repr__(self):
+        return f"IdSet({list(self)!r})"
@@ -1,6 +1,34 @@
 from .Person import Person
+from .IdSet import IdSet
+from .batchBuild import build_many
+
+def _fill_from_db(instructor, row, intern):
+    """
+    Fills in a Instructor built by `Instructor.from_db_many` from a database tuple, interning its ids.
+    """
+    instructor_id, name, age, email, assigned_courses = row
+    instructor.name = name
+    instructor.age = age
+    instructor._email = email
+    instructor.instructor_id = intern(instructor_id, instructor_id)
+    ids = assigned_courses.split(',') if assigned_courses is not None else ()
+    instructor.assigned_courses = IdSet.fromkeys(map(intern, ids, ids))
+
+def _fill_from_json(instructor, row, intern):
+    """
+    Fills in a Instructor built by `Instructor.from_json_many` from a JSON object, interning its ids.
+    """
+    instructor.name = row.get("name")
+    instructor.age = row.get("age")
+    instructor._email = row.get("_email")
+    instructor_id = row.get("instructor_id")
+    instructor.instructor_id = intern(instructor_id, instructor_id)
+    ids = row.get("assigned_courses", [])
+    instructor.assigned_courses = IdSet.fromkeys(map(intern, ids, ids))
 
 class Instructor(Person):
+    __slots__ = ("instructor_id", "assigned_courses")
+
     def __init__(self, name: str, age: int, email: str, instructor_id: str, assigned_courses: list):
         """
         Initializes an Instructor instance with the provided details.
@@ -11,10 +39,13 @@ class Instructor(Person):
             email (str): The email of the instructor.
             instructor_id (str): The unique identifier for the instructor.
             assigned_courses (list): A list of course IDs that the instructor is assigned to.
+
+        Attributes:
+            assigned_courses (IdSet): The IDs of the courses the instructor is assigned to, in assignment order.
         """
         super().__init__(name, age, email)
         self.instructor_id = instructor_id
-        self.assigned_courses = assigned_courses
+        self.assigned_courses = IdSet.fromkeys(assigned_courses)
 
     def assign_course(self, course):
         """
@@ -28,8 +59,7 @@ class Instructor(Person):
                 - bool: True if the instructor was successfully assigned, False if already assigned.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if course.course_id not in self.assigned_courses:
-            self.assigned_courses.append(course.course_id)
+        if self.assigned_courses.add(course.course_id):
             return True, ["Assigned to course"]
         else: 
             return False, ["Already assigned to course"]
@@ -46,10 +76,9 @@ class Instructor(Person):
                 - bool: True if the instructor was successfully unassigned, False if not assigned to course.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if course.course_id not in self.assigned_courses:
+        if not self.assigned_courses.discard(course.course_id):
             return False, ["Course not assigned course"]
         else: 
-            self.assigned_courses.remove(course.course_id)
             return True, ["Instructor uassigned to course"]
 
     def validate(self):
@@ -75,22 +104,58 @@ class Instructor(Person):
                 errors.append(error)
                 return False, errors
 
+    def to_dict(self):
+        """
+        Returns the instructor's details as a dictionary, in the layout of the JSON file.
+
+        The list of assigned courses is copied, so later changes to the instructor do not change the dictionary.
+
+        Returns:
+            dict: A dictionary with the name, age, _email, instructor_id and assigned_courses of the instructor.
+        """
+        data = super().to_dict()
+        data["instructor_id"] = self.instructor_id
+        data["assigned_courses"] = list(self.assigned_courses)
+        return data
+
     @classmethod
-    def from_json(cls, json_object: dict):
+    def from_dict(cls, json_object: dict):
         """
-        Creates an Instructor instance from a JSON object.
+        Creates an Instructor instance from a dictionary as returned by `to_dict`.
 
         Args:
             json_object (dict): A dictionary representing instructor data.
 
         Returns:
             Instructor: An instance of the Instructor class.
-        """        
-        name, age, email = super().from_json(json_object)
+        """
+        name, age, email = Person.from_json(json_object)
         instructor_id = json_object.get("instructor_id")
         assigned_courses = json_object.get("assigned_courses",[])
         return cls(name,age,email,instructor_id,assigned_courses)
 
+    @classmethod
+    def _invalid_columns(cls, people):
+        """
+        Yields the checks of `Person`, then the instructor_id length check, as `validate` orders its messages.
+        """
+        yield from super()._invalid_columns(people)
+        ids = [person.instructor_id for person in people]
+        yield "Not a valid instructor_id", [position for position, id in enumerate(ids) if len(id) != 5]
+
+    @classmethod
+    def from_json(cls, json_object: dict):
+        """
+        Creates an Instructor instance from a JSON object.
+
+        Args:
+            json_object (dict): A dictionary representing instructor data.
+
+        Returns:
+            Instructor: An instance of the Instructor class.
+        """        
+        return cls.from_dict(json_object)
+
     @classmethod
     def from_db(cls, db_object: tuple):
         """
@@ -105,4 +170,37 @@ class Instructor(Person):
         name, age, email = super().from_db(db_object)
         course_id = db_object[0]
         assigned_courses = db_object[4].split(',') if db_object[4] is not None else []
-        return cls(name,age,email,course_id,assigned_courses)
\ No newline at end of file
+        return cls(name,age,email,course_id,assigned_courses)
+
+    @classmethod
+    def from_db_many(cls, db_objects, interned: dict = None):
+        """
+        Creates Instructor instances from many database tuples at once.
+
+        The objects are filled in directly instead of going through `from_db` and `__init__` for every row, with
+        the garbage collector paused, and every id is interned through `interned`, so the ids in the
+        assigned_courses of all the instructors share one string per distinct id.
+
+        Args:
+            db_objects (iterable): Tuples representing instructor data from the database.
+            interned (dict): The canonical string of each id seen so far, shared between calls to reuse the
+                same strings across batches. A new one is used if not given.
+
+        Returns:
+            list: The Instructor instances, in row order.
+        """
+        return build_many(cls, db_objects, _fill_from_db, interned)
+
+    @classmethod
+    def from_json_many(cls, json_objects, interned: dict = None):
+        """
+        Creates Instructor instances from many JSON objects at once, as `from_db_many` does for database tuples.
+
+        Args:
+            json_objects (iterable): Dictionaries representing instructor data.
+            interned (dict): The canonical string of each id seen so far, see `from_db_many`.
+
+        Returns:
+            list: The Instructor instances, in input order.
+        """
+        return build_many(cls, json_objects, _fill_from_json, interned)
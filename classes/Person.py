@@ -1,6 +1,17 @@
 import re
+from itertools import compress, count, repeat
+from operator import gt
+
+# Compiled once, instead of passing the pattern string to re.match for every email checked
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
+# The same pattern matching every line of a text, used to check many emails in one pass
+EMAIL_LINES_PATTERN = re.compile(EMAIL_PATTERN.pattern, re.MULTILINE)
 
 class Person:
+    # Attributes are kept in slots instead of a per-instance __dict__, which keeps each entity small
+    __slots__ = ("name", "age", "_email")
+
     def __init__(self,name :str, age: int, email: str):
         """
         Initializes a Person instance with the provided details.
@@ -55,6 +66,62 @@ class Person:
         else:
             return True, ["Validation Passed!"]
 
+    @classmethod
+    def validate_many(cls, people):
+        """
+        Validates many people at once, with the same checks and messages as `validate`.
+
+        Each check runs over one column (every age, then every name, ...) instead of calling `validate` on
+        each object, which is what makes bulk imports fast.
+
+        Args:
+            people (list): The objects to validate, all of this class.
+
+        Returns:
+            tuple: A tuple containing:
+                - bool: True if every object passed validation, False otherwise.
+                - dict: The list of error messages of each invalid object, keyed by its position in `people`.
+        """
+        return error_report(cls._invalid_columns(people))
+
+    @classmethod
+    def _invalid_columns(cls, people):
+        """
+        Yields each error message of `validate` with the positions of the people it applies to, in the order
+        `validate` reports them.
+        """
+        ages = [person.age for person in people]
+        if set(map(type, ages)) <= {int}:
+            # For integers the age check is just age < 17, which can be mapped over the column in C
+            yield "Not a valid age", list(compress(count(), map(gt, repeat(17), ages)))
+        else:
+            yield "Not a valid age", [position for position, age in enumerate(ages) if age == "" or not age or age < 17]
+        names = [person.name for person in people]
+        yield "Not a valid name", [position for position, name in enumerate(names) if len(name) <= 1]
+        yield "Not a valid email", invalid_emails([person._email for person in people])
+
+    def to_dict(self):
+        """
+        Returns the person's details as a dictionary, in the layout of the JSON file.
+
+        Returns:
+            dict: A dictionary with the name, age and _email of the person.
+        """
+        return {"name": self.name, "age": self.age, "_email": self._email}
+
+    @classmethod
+    def from_dict(cls, json_object : dict):
+        """
+        Creates a Person instance from a dictionary as returned by `to_dict`.
+
+        Args:
+            json_object (dict): A dictionary representing the person's data.
+
+        Returns:
+            Person: An instance of the Person class.
+        """
+        return cls(*Person.from_json(json_object))
+
     @classmethod
     def from_json(cls, json_object : dict):
         """
@@ -89,9 +156,51 @@ class Person:
     
 
 def is_valid_email(email: str) -> bool:
-    email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-
-    if re.match(email_regex, email):
+    if EMAIL_PATTERN.match(email):
         return True
     else:
         return False
+
+def invalid_emails(emails: list):
+    """
+    Returns the positions of the emails that `is_valid_email` rejects.
+
+    The emails are joined into one text, one per line, and every valid line is removed with a single regex
+    substitution, so the pattern is run by the regex engine over the whole column instead of once per call;
+    the lines left are the invalid emails. Empty emails and emails containing a newline, which the joined
+    text cannot represent, are checked one at a time.
+
+    Args:
+        emails (list): The emails to check.
+
+    Returns:
+        list: The positions of the invalid emails, in ascending order.
+    """
+    text = "\n".join(emails)
+    if text.count("\n") != max(len(emails) - 1, 0):
+        return [position for position, email in enumerate(emails) if not EMAIL_PATTERN.match(email)]
+    invalid = compress(range(len(emails)), EMAIL_LINES_PATTERN.sub("", text).split("\n"))
+    if "" in emails:
+        return sorted(set(invalid).union(position for position, email in enumerate(emails) if not email))
+    return list(invalid)
+
+def error_report(checks):
+    """
+    Builds the report returned by the validate_many methods.
+
+    Args:
+        checks (iterable): (message, positions) pairs, in the order the messages of one object are listed.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if no check failed, False otherwise.
+            - dict: The list of error messages of each failing position, keyed by position, in position order.
+    """
+    report = {}
+    for message, positions in checks:
+        for position in positions:
+            if position in report:
+                report[position].append(message)
+            else:
+                report[position] = [message]
+    return not report, dict(sorted(report.items()))
@@ -1,6 +1,34 @@
 from .Person import Person
+from .IdSet import IdSet
+from .batchBuild import build_many
+
+def _fill_from_db(student, row, intern):
+    """
+    Fills in a Student built by `Student.from_db_many` from a database tuple, interning its ids.
+    """
+    student_id, name, age, email, registered_courses = row
+    student.name = name
+    student.age = age
+    student._email = email
+    student.student_id = intern(student_id, student_id)
+    ids = registered_courses.split(',') if registered_courses is not None else ()
+    student.registered_courses = IdSet.fromkeys(map(intern, ids, ids))
+
+def _fill_from_json(student, row, intern):
+    """
+    Fills in a Student built by `Student.from_json_many` from a JSON object, interning its ids.
+    """
+    student.name = row.get("name")
+    student.age = row.get("age")
+    student._email = row.get("_email")
+    student_id = row.get("student_id")
+    student.student_id = intern(student_id, student_id)
+    ids = row.get("registered_courses", [])
+    student.registered_courses = IdSet.fromkeys(map(intern, ids, ids))
 
 class Student(Person):
+    __slots__ = ("student_id", "registered_courses")
+
     def __init__(self, name: str, age: int, email: str, student_id: str, registered_courses : list):
         """
         Initializes a Student instance with the provided details.
@@ -11,10 +39,13 @@ class Student(Person):
             email (str): The email of the student.
             student_id (str): The unique identifier for the student.
             registered_courses (list): A list of course IDs that the student is registered in.
+
+        Attributes:
+            registered_courses (IdSet): The IDs of the courses the student is registered in, in registration order.
         """
         super().__init__(name, age, email)
         self.student_id = student_id
-        self.registered_courses = registered_courses
+        self.registered_courses = IdSet.fromkeys(registered_courses)
 
     def register_course(self, course):
         """
@@ -28,8 +59,7 @@ class Student(Person):
                 - bool: True if the student was successfully registered, False if already registered.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if course.course_id not in self.registered_courses:
-            self.registered_courses.append(course.course_id)
+        if self.registered_courses.add(course.course_id):
             return True, ["Registered in course"]
         else: 
             return False, ["Already registered in course"]
@@ -46,12 +76,35 @@ class Student(Person):
                 - bool: True if the student was successfully unregistered, False if not registered.
                 - list: A list of messages indicating success or errors encountered.
         """
-        if course.course_id not in self.registered_courses:
+        if not self.registered_courses.discard(course.course_id):
             return False, ["Course not registered"]
         else: 
-            self.registered_courses.remove(course.course_id)
             return True, ["Course unregistered in course"]
 
+    def register_courses(self, courses):
+        """
+        Registers the student to many courses at once.
+
+        Args:
+            courses (iterable): Instances of the Course class to register.
+
+        Returns:
+            list: A list with one tuple per course, in input order, as returned by `register_course`.
+        """
+        return [self.register_course(course) for course in courses]
+
+    def unregister_courses(self, courses):
+        """
+        Unregisters the student from many courses at once.
+
+        Args:
+            courses (iterable): Instances of the Course class to unregister.
+
+        Returns:
+            list: A list with one tuple per course, in input order, as returned by `unregister_course`.
+        """
+        return [self.unregister_course(course) for course in courses]
+
     def validate(self):
         """
         Validates the student details, ensuring the student ID and other attributes are correct.
@@ -75,22 +128,58 @@ class Student(Person):
                 errors.append(error)
                 return False, errors
     
+    def to_dict(self):
+        """
+        Returns the student's details as a dictionary, in the layout of the JSON file.
+
+        The list of registered courses is copied, so later changes to the student do not change the dictionary.
+
+        Returns:
+            dict: A dictionary with the name, age, _email, student_id and registered_courses of the student.
+        """
+        data = super().to_dict()
+        data["student_id"] = self.student_id
+        data["registered_courses"] = list(self.registered_courses)
+        return data
+
     @classmethod
-    def from_json(cls, json_object: dict):
+    def from_dict(cls, json_object: dict):
         """
-        Creates an Student instance from a JSON object.
+        Creates a Student instance from a dictionary as returned by `to_dict`.
 
         Args:
             json_object (dict): A dictionary representing student data.
 
         Returns:
             Student: An instance of the Student class.
-        """        
-        name, age, email = super().from_json(json_object)
+        """
+        name, age, email = Person.from_json(json_object)
         student_id = json_object.get("student_id")
         registered_courses = json_object.get("registered_courses",[])
         return cls(name,age,email,student_id,registered_courses)
 
+    @classmethod
+    def _invalid_columns(cls, people):
+        """
+        Yields the checks of `Person`, then the student_id length check, as `validate` orders its messages.
+        """
+        yield from super()._invalid_columns(people)
+        ids = [person.student_id for person in people]
+        yield "Not a valid student_id", [position for position, id in enumerate(ids) if len(id) != 5]
+
+    @classmethod
+    def from_json(cls, json_object: dict):
+        """
+        Creates an Student instance from a JSON object.
+
+        Args:
+            json_object (dict): A dictionary representing student data.
+
+        Returns:
+            Student: An instance of the Student class.
+        """        
+        return cls.from_dict(json_object)
+
     @classmethod
     def from_db(cls, db_object: tuple):
         """
@@ -107,4 +196,35 @@ class Student(Person):
         registered_courses = db_object[4].split(',') if db_object[4] is not None else []
         return cls(name,age,email,student_id,registered_courses)
 
- 
\ No newline at end of file
+    @classmethod
+    def from_db_many(cls, db_objects, interned: dict = None):
+        """
+        Creates Student instances from many database tuples at once.
+
+        The objects are filled in directly instead of going through `from_db` and `__init__` for every row, with
+        the garbage collector paused, and every id is interned through `interned`, so the ids in the
+        registered_courses of all the students share one string per distinct id.
+
+        Args:
+            db_objects (iterable): Tuples representing student data from the database.
+            interned (dict): The canonical string of each id seen so far, shared between calls to reuse the
+                same strings across batches. A new one is used if not given.
+
+        Returns:
+            list: The Student instances, in row order.
+        """
+        return build_many(cls, db_objects, _fill_from_db, interned)
+
+    @classmethod
+    def from_json_many(cls, json_objects, interned: dict = None):
+        """
+        Creates Student instances from many JSON objects at once, as `from_db_many` does for database tuples.
+
+        Args:
+            json_objects (iterable): Dictionaries representing student data.
+            interned (dict): The canonical string of each id seen so far, see `from_db_many`.
+
+        Returns:
+            list: The Student instances, in input order.
+        """
+        return build_many(cls, json_objects, _fill_from_json, interned)
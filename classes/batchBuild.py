@@ -0,0 +1,58 @@
+"""
+This module provides the helpers shared by the batch constructors of the entity classes (`from_db_many` and
+`from_json_many`).
+
+Building a large number of objects in a tight loop triggers the cyclic garbage collector over and over: every
+container allocated counts towards its thresholds, and each full collection walks every object built so far,
+so the cost of a load grows faster than its size. None of the objects built form reference cycles, so the
+collector is paused while a batch is built.
+
+Functions:
+    gc_paused(): Context manager disabling the garbage collector for the duration of a block.
+    build_many(cls, rows, fill, interned): The loop of the batch constructors, filling in one object per row.
+"""
+
+import gc
+from contextlib import contextmanager
+
+@contextmanager
+def gc_paused():
+    """
+    Disables the garbage collector for the duration of the block, restoring its previous state afterwards.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def build_many(cls, rows, fill, interned: dict = None):
+    """
+    Builds instances of an entity class from many rows, the loop shared by the batch constructors.
+
+    The objects are created with `cls.__new__` and filled in by `fill` instead of going through `__init__` for every
+    row, with the garbage collector paused. Ids are interned through `interned`, so equal ids share one string
+    across every object built.
+
+    Args:
+        cls (type): The class to build.
+        rows (iterable): The rows, database tuples or JSON objects.
+        fill (callable): Sets the fields of a new object from a row, called as fill(entity, row, intern), where
+            intern(id, id) returns the canonical string of an id.
+        interned (dict): The canonical string of each id seen so far, shared between calls to reuse the same
+            strings across batches. A new one is used if not given.
+
+    Returns:
+        list: The objects, in row order.
+    """
+    intern = (interned if interned is not None else {}).setdefault
+    new = cls.__new__
+    entities = []
+    with gc_paused():
+        for row in rows:
+            entity = new(cls)
+            fill(entity, row, intern)
+            entities.append(entity)
+    return entities
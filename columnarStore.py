@@ -0,0 +1,326 @@
+"""
+This module provides a columnar, read-only copy of the data for reports that only need a few fields.
+
+shared.py keeps one Python object per entity, each with its own strings and id collection, which is what the tabs
+edit but is heavy for a job that only counts or filters. The store here keeps each field in its own column
+instead. Ids are interned to their position in the table, ages are kept in `array('H')` columns, and
+enrollments are kept as CSR adjacency arrays in both directions. The students of course c are the positions
+`course_students[course_offsets[c]:course_offsets[c + 1]]`, and the courses of a student are held the same way.
+Counts and histograms are computed from these arrays without creating any entity. Student, Instructor and
+Course objects are only built when a view asks for one.
+
+Only the standard library is used (`array`), so the store works wherever the applications do.
+
+Classes:
+    ColumnarStore: Column arrays of the courses, students and instructors and their enrollments.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate, compress
+from operator import sub
+from classes.Course import Course, Student, Instructor
+from crud import databaseCRUD
+
+# Typecodes of the column arrays: ages, positions and offsets, and the instructor of each course
+AGE_TYPE = "H"
+POSITION_TYPE = "I"
+INSTRUCTOR_TYPE = "l"
+
+def _age(value):
+    """
+    Returns an age as stored in an `array('H')`, 0 for a missing or out of range value.
+    """
+    return value if isinstance(value, int) and 0 <= value <= 0xFFFF else 0
+
+def _age_mask(ages: array, low: int, high: int):
+    """
+    Returns a byte per age, 1 if it is between `low` and `high` (inclusive) and 0 otherwise.
+
+    Ages fit in one byte in practice, so the low byte of every age is mapped through a 256 entry table with
+    `bytes.translate`, which runs in C; the ages are only tested one at a time if one of them is above 255.
+    """
+    raw = ages.tobytes()
+    low_bytes, high_bytes = (raw[0::2], raw[1::2]) if sys.byteorder == "little" else (raw[1::2], raw[0::2])
+    if not high_bytes.strip(b"\0"):
+        return low_bytes.translate(bytes(low <= age <= high for age in range(256)))
+    return bytes(low <= age <= high for age in ages)
+
+def _transpose(offsets: array, targets: array, columns: int):
+    """
+    Transposes a CSR adjacency, e.g. course -> students into student -> courses, with a counting sort.
+
+    Args:
+        offsets (array): Start of each row's columns in `targets`, plus the end.
+        targets (array): The columns of every row, grouped by row.
+        columns (int): The number of columns, which become the rows of the result.
+
+    Returns:
+        tuple: (offsets, targets) of the transposed adjacency, each row's columns in ascending order.
+    """
+    counts = Counter(targets)
+    transposed_offsets = array(POSITION_TYPE, accumulate(map(counts.__getitem__, range(columns)), initial=0))
+    cursor = transposed_offsets.tolist()
+    transposed = array(POSITION_TYPE, bytes(targets.itemsize * len(targets)))
+    start = 0
+    for row, end in enumerate(offsets[1:]):
+        for column in targets[start:end]:
+            transposed[cursor[column]] = row
+            cursor[column] += 1
+        start = end
+    return transposed_offsets, transposed
+
+class ColumnarStore:
+    def __init__(self, courses, students, instructors):
+        """
+        Initializes the ColumnarStore from rows in the layout returned by databaseCRUD's fetch_courses,
+        fetch_students and fetch_instructors.
+
+        Enrollments are taken from the course rows and instructor assignments from the instructor id of each
+        course; ids that do not belong to a known entity are ignored.
+
+        Args:
+            courses (iterable): Rows of (course_id, course_name, instructor_id, enrolled_students).
+            students (iterable): Rows of (student_id, name, age, email, registered_courses).
+            instructors (iterable): Rows of (instructor_id, name, age, email, assigned_courses).
+
+        Attributes:
+            student_ids (list): Id of each student, by position
+            student_index (dict): Position of each student, keyed by id
+            student_names (list): Name of each student
+            student_emails (list): Email of each student
+            student_ages (array): Age of each student (0 if missing)
+            instructor_ids (list): Id of each instructor, by position
+            instructor_index (dict): Position of each instructor, keyed by id
+            instructor_names (list): Name of each instructor
+            instructor_emails (list): Email of each instructor
+            instructor_ages (array): Age of each instructor (0 if missing)
+            course_ids (list): Id of each course, by position
+            course_index (dict): Position of each course, keyed by id
+            course_names (list): Name of each course
+            course_instructors (array): Position of the instructor of each course, -1 if it has none
+            course_offsets (array): Start of each course's students in `course_students`, plus the end
+            course_students (array): Positions of the enrolled students, grouped by course
+            student_offsets (array): Start of each student's courses in `student_courses`, plus the end
+            student_courses (array): Positions of the registered courses, grouped by student
+            instructor_offsets (array): Start of each instructor's courses in `instructor_courses`, plus the end
+            instructor_courses (array): Positions of the assigned courses, grouped by instructor
+        """
+        self.student_ids : list = []
+        self.student_names : list = []
+        self.student_emails : list = []
+        self.student_ages : array = array(AGE_TYPE)
+        for student_id, name, age, email, _ in students:
+            self.student_ids.append(student_id)
+            self.student_names.append(name)
+            self.student_emails.append(email)
+            self.student_ages.append(_age(age))
+        self.student_index : dict = {student_id: position for position, student_id in enumerate(self.student_ids)}
+
+        self.instructor_ids : list = []
+        self.instructor_names : list = []
+        self.instructor_emails : list = []
+        self.instructor_ages : array = array(AGE_TYPE)
+        for instructor_id, name, age, email, _ in instructors:
+            self.instructor_ids.append(instructor_id)
+            self.instructor_names.append(name)
+            self.instructor_emails.append(email)
+            self.instructor_ages.append(_age(age))
+        self.instructor_index : dict = {instructor_id: position
+                                        for position, instructor_id in enumerate(self.instructor_ids)}
+
+        self.course_ids : list = []
+        self.course_names : list = []
+        self.course_instructors : array = array(INSTRUCTOR_TYPE)
+        self.course_offsets : array = array(POSITION_TYPE, [0])
+        self.course_students : array = array(POSITION_TYPE)
+        student_index = self.student_index
+        for course_id, course_name, instructor_id, enrolled_students in courses:
+            self.course_ids.append(course_id)
+            self.course_names.append(course_name)
+            self.course_instructors.append(self.instructor_index.get(instructor_id, -1))
+            if enrolled_students:
+                positions = [student_index.get(student_id) for student_id in enrolled_students.split(",")]
+                self.course_students.extend(position for position in positions if position is not None)
+            self.course_offsets.append(len(self.course_students))
+        self.course_index : dict = {course_id: position for position, course_id in enumerate(self.course_ids)}
+
+        self.student_offsets, self.student_courses = _transpose(
+            self.course_offsets, self.course_students, len(self.student_ids))
+        assigned = array(POSITION_TYPE, (instructor for instructor in self.course_instructors if instructor >= 0))
+        assigned_offsets = array(POSITION_TYPE, accumulate((instructor >= 0 for instructor in self.course_instructors),
+                                                           initial=0))
+        self.instructor_offsets, self.instructor_courses = _transpose(
+            assigned_offsets, assigned, len(self.instructor_ids))
+
+    @classmethod
+    def from_db(cls):
+        """
+        Creates a ColumnarStore from the SQLite database, streaming the rows instead of fetching whole tables.
+
+        Returns:
+            ColumnarStore: The store of the current database contents.
+        """
+        return cls(databaseCRUD.iter_courses(), databaseCRUD.iter_students(), databaseCRUD.iter_instructors())
+
+    def students_per_course(self):
+        """
+        Returns the number of students enrolled in each course.
+
+        Returns:
+            array: The count of each course, by course position.
+        """
+        return array(POSITION_TYPE, map(sub, self.course_offsets[1:], self.course_offsets[:-1]))
+
+    def courses_per_student(self):
+        """
+        Returns the number of courses each student is registered in.
+
+        Returns:
+            array: The count of each student, by student position.
+        """
+        return array(POSITION_TYPE, map(sub, self.student_offsets[1:], self.student_offsets[:-1]))
+
+    def age_histogram(self, bin_width: int = 1, instructors: bool = False):
+        """
+        Counts the students (or instructors) in each age bin.
+
+        Args:
+            bin_width (int): The width of the bins, in years.
+            instructors (bool): Whether to count the instructors instead of the students.
+
+        Returns:
+            dict: The number of people in each bin, keyed by the first age of the bin, in increasing age order.
+        """
+        ages = self.instructor_ages if instructors else self.student_ages
+        counts = Counter(ages) if bin_width == 1 else Counter(age // bin_width * bin_width for age in ages)
+        return dict(sorted(counts.items()))
+
+    def select_students(self, min_age: int = None, max_age: int = None, course_id: str = None):
+        """
+        Returns the positions of the students matching every given condition.
+
+        Args:
+            min_age (int): The lowest age to keep.
+            max_age (int): The highest age to keep.
+            course_id (str): Keep only the students enrolled in this course.
+
+        Returns:
+            array: The matching student positions, in ascending order.
+        """
+        positions, mask = self._student_mask(min_age, max_age, course_id)
+        if mask is None:
+            return array(POSITION_TYPE, positions)
+        return array(POSITION_TYPE, compress(positions, mask))
+
+    def count_students(self, min_age: int = None, max_age: int = None, course_id: str = None):
+        """
+        Returns the number of students matching every given condition, see `select_students`.
+        """
+        positions, mask = self._student_mask(min_age, max_age, course_id)
+        return len(positions) if mask is None else mask.count(1)
+
+    def _student_mask(self, min_age, max_age, course_id):
+        """
+        Returns the candidate student positions and a byte mask (1 to keep) of the ones in the age range,
+        or None for the mask if no age bound is given.
+        """
+        if course_id is not None:
+            course = self.course_index.get(course_id)
+            if course is None:
+                return (), None
+            positions = sorted(self.course_students[self.course_offsets[course]:self.course_offsets[course + 1]])
+            ages = array(AGE_TYPE, map(self.student_ages.__getitem__, positions))
+        else:
+            positions = range(len(self.student_ids))
+            ages = self.student_ages
+        if min_age is None and max_age is None:
+            return positions, None
+        return positions, _age_mask(ages, 0 if min_age is None else min_age, 0xFFFF if max_age is None else max_age)
+
+    def enrolled_student_ids(self, course_id: str):
+        """
+        Returns the ids of the students enrolled in a course, in enrollment order, or an empty list.
+        """
+        course = self.course_index.get(course_id)
+        if course is None:
+            return []
+        return [self.student_ids[student]
+                for student in self.course_students[self.course_offsets[course]:self.course_offsets[course + 1]]]
+
+    def registered_course_ids(self, student_id: str):
+        """
+        Returns the ids of the courses a student is registered in, or an empty list.
+        """
+        student = self.student_index.get(student_id)
+        if student is None:
+            return []
+        return [self.course_ids[course]
+                for course in self.student_courses[self.student_offsets[student]:self.student_offsets[student + 1]]]
+
+    def student(self, position: int):
+        """
+        Builds the Student at a position.
+
+        Args:
+            position (int): The position of the student, e.g. from `student_index` or `select_students`.
+
+        Returns:
+            Student: A new Student object; changing it does not change the store.
+        """
+        courses = self.student_courses[self.student_offsets[position]:self.student_offsets[position + 1]]
+        return Student(self.student_names[position], self.student_ages[position], self.student_emails[position],
+                       self.student_ids[position], [self.course_ids[course] for course in courses])
+
+    def instructor(self, position: int):
+        """
+        Builds the Instructor at a position.
+
+        Args:
+            position (int): The position of the instructor, e.g. from `instructor_index`.
+
+        Returns:
+            Instructor: A new Instructor object; changing it does not change the store.
+        """
+        courses = self.instructor_courses[self.instructor_offsets[position]:self.instructor_offsets[position + 1]]
+        return Instructor(self.instructor_names[position], self.instructor_ages[position],
+                          self.instructor_emails[position], self.instructor_ids[position],
+                          [self.course_ids[course] for course in courses])
+
+    def course(self, position: int):
+        """
+        Builds the Course at a position.
+
+        Args:
+            position (int): The position of the course, e.g. from `course_index`.
+
+        Returns:
+            Course: A new Course object; changing it does not change the store.
+        """
+        instructor = self.course_instructors[position]
+        students = self.course_students[self.course_offsets[position]:self.course_offsets[position + 1]]
+        return Course(self.course_ids[position], self.course_names[position],
+                      self.instructor_ids[instructor] if instructor >= 0 else "",
+                      [self.student_ids[student] for student in students])
+
+    def students(self, positions=None):
+        """
+        Yields the Student at each position, or every student, building each one only when it is reached.
+        """
+        for position in range(len(self.student_ids)) if positions is None else positions:
+            yield self.student(position)
+
+    def instructors(self, positions=None):
+        """
+        Yields the Instructor at each position, or every instructor, building each one only when it is reached.
+        """
+        for position in range(len(self.instructor_ids)) if positions is None else positions:
+            yield self.instructor(position)
+
+    def courses(self, positions=None):
+        """
+        Yields the Course at each position, or every course, building each one only when it is reached.
+        """
+        for position in range(len(self.course_ids)) if positions is None else positions:
+            yield self.course(position)
@@ -0,0 +1,148 @@
+"""
+This module provides the compact binary snapshot format of the JSON backend.
+
+data.json repeats every field name ("_email", "registered_courses", ...) in every row and is indented, so most
+of the file is structure, and parsing it is slow. A binary snapshot stores each table once per row shape: the
+field names of rows with the same keys (in the same order) are written a single time, and each row is only the
+list of its values. The result is serialized with `marshal`, whose reader and writer are in C and which writes
+every value with a one byte type tag instead of JSON text. The garbage collector is paused while the rows are
+built, since collecting during the creation of millions of containers costs more than the decoding itself.
+
+The conversion is lossless: any document that can be stored as JSON, including key order, rows with missing or
+extra fields and values that are not rows, reads back equal to the original.
+
+`marshal` data is only meant to be read by the Python version that wrote it, and must not be read from untrusted
+sources; the JSON file remains the interchange format (see `json_to_binary` and `binary_to_json`).
+
+Classes:
+    SnapshotError: Raised when a binary snapshot cannot be read.
+
+Functions:
+    dumps(data): Encodes a JSON document as a binary snapshot.
+    loads(payload): Decodes a binary snapshot back into the JSON document.
+    json_to_binary(json_path, binary_path): Converts a JSON data file to a binary snapshot.
+    binary_to_json(binary_path, json_path): Converts a binary snapshot to a JSON data file.
+"""
+
+import json
+import marshal
+from classes.batchBuild import gc_paused
+
+# Identifies a binary snapshot and the version of its layout
+MAGIC = b"L2SNAP\x00\x01"
+
+# marshal format version; version 3 and later write repeated objects as references
+MARSHAL_VERSION = 4
+
+class SnapshotError(ValueError):
+    """
+    Raised when a file is not a readable binary snapshot.
+    """
+
+def _encode_table(rows):
+    """
+    Splits a table into its row shapes and the values of each row.
+
+    Returns:
+        tuple: (shapes, shape_ids, values), where shapes is a list of key tuples, shape_ids the shape of each row
+            (-1 for a value that is not a row) and values the list of values (or the value itself) of each row.
+    """
+    shapes = []
+    shape_index = {}
+    shape_ids = []
+    values = []
+    for row in rows:
+        if not isinstance(row, dict):
+            shape_ids.append(-1)
+            values.append(row)
+            continue
+        keys = tuple(row)
+        shape = shape_index.get(keys)
+        if shape is None:
+            shape = shape_index[keys] = len(shapes)
+            shapes.append(keys)
+        shape_ids.append(shape)
+        values.append(list(row.values()))
+    return shapes, shape_ids, values
+
+def _decode_table(shapes, shape_ids, values):
+    """
+    Rebuilds the rows of a table from its encoded form.
+    """
+    rows = []
+    for shape, row in zip(shape_ids, values):
+        rows.append(row if shape < 0 else dict(zip(shapes[shape], row)))
+    return rows
+
+def dumps(data):
+    """
+    Encodes a JSON document as a binary snapshot.
+
+    Args:
+        data (dict): The document, a dict of tables (lists of rows) and any other JSON values.
+
+    Returns:
+        bytes: The binary snapshot.
+    """
+    tables = []
+    with gc_paused():
+        for name, table in data.items():
+            if isinstance(table, list):
+                tables.append((name, True) + _encode_table(table))
+            else:
+                tables.append((name, False, table))
+        return MAGIC + marshal.dumps(tables, MARSHAL_VERSION)
+
+def loads(payload):
+    """
+    Decodes a binary snapshot back into the JSON document.
+
+    Args:
+        payload (bytes): The binary snapshot.
+
+    Returns:
+        dict: The document.
+
+    Raises:
+        SnapshotError: If the payload is not a complete binary snapshot.
+    """
+    if payload[:len(MAGIC)] != MAGIC:
+        raise SnapshotError("Not a binary snapshot")
+    try:
+        with gc_paused():
+            tables = marshal.loads(memoryview(payload)[len(MAGIC):])
+            data = {}
+            for table in tables:
+                if table[1]:
+                    data[table[0]] = _decode_table(*table[2:])
+                else:
+                    data[table[0]] = table[2]
+    except (EOFError, ValueError, TypeError, IndexError) as e:
+        raise SnapshotError(f"Corrupt binary snapshot: {e}") from e
+    return data
+
+def json_to_binary(json_path, binary_path):
+    """
+    Converts a JSON data file to a binary snapshot.
+
+    Args:
+        json_path (str): The JSON file to read.
+        binary_path (str): The binary snapshot to write.
+    """
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    with open(binary_path, 'wb') as f:
+        f.write(dumps(data))
+
+def binary_to_json(binary_path, json_path):
+    """
+    Converts a binary snapshot to a JSON data file, in the layout written by the JSON backend.
+
+    Args:
+        binary_path (str): The binary snapshot to read.
+        json_path (str): The JSON file to write.
+    """
+    with open(binary_path, 'rb') as f:
+        data = loads(f.read())
+    with open(json_path, 'w') as f:
+        json.dump(data, f, indent=4)
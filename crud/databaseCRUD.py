@@ -1,16 +1,354 @@
 import sqlite3
+import threading
+import atexit
+import itertools
+import os
 from classes.Course import *
 
 database_path = './database.db'
 
+# Serve every operation from an in-memory copy of database_path, written back to the file by flush_db
+memory_mode = False
+
+# Seconds between background flushes of the in-memory copy. A crash loses at most this much work; None or 0
+# flushes only at shutdown (or when flush_db is called), which is fastest but keeps every change at risk
+flush_interval = 5.0
+
+# PRAGMAs applied once to every pooled connection when it is opened
+connection_pragmas = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+
+# PRAGMAs of connection_pragmas that only apply to a database file, skipped for the in-memory copy
+file_only_pragmas = {"journal_mode", "mmap_size"}
+
+# Schema migrations, in order, each with the tables it needs. Migration N brings the database to PRAGMA user_version N + 1
+migrations = [
+    (("Enrollment", "Course"), [
+        "CREATE INDEX IF NOT EXISTS idx_enrollment_student_id ON Enrollment (student_id)",
+        "CREATE INDEX IF NOT EXISTS idx_course_instructor_id ON Course (instructor_id)",
+    ]),
+]
+
+FETCH_COURSES_QUERY = """
+    SELECT c.course_id, c.course_name, c.instructor_id, 
+        GROUP_CONCAT(e.student_id) AS enrolled_students
+    FROM Course c
+    LEFT JOIN Enrollment e ON c.course_id = e.course_id
+    GROUP BY c.course_id
+"""
+
+FETCH_STUDENTS_QUERY = """
+    SELECT s.student_id, s.name, s.age, s.email, 
+        GROUP_CONCAT(e.course_id) AS registered_courses
+    FROM Student s
+    LEFT JOIN Enrollment e ON s.student_id = e.student_id
+    GROUP BY s.student_id
+"""
+
+FETCH_INSTRUCTORS_QUERY = """
+    SELECT i.instructor_id, i.name, i.age, i.email, 
+        GROUP_CONCAT(c.course_id) AS assigned_courses
+    FROM Instructor i
+    LEFT JOIN Course c ON i.instructor_id = c.instructor_id
+    GROUP BY i.instructor_id
+"""
+
+FETCH_COURSES_PAGE_QUERY = """
+    SELECT c.course_id, c.course_name, c.instructor_id, 
+        GROUP_CONCAT(e.student_id) AS enrolled_students
+    FROM Course c
+    LEFT JOIN Enrollment e ON c.course_id = e.course_id
+    WHERE c.course_id > ?
+    GROUP BY c.course_id
+    ORDER BY c.course_id
+    LIMIT ?
+"""
+
+FETCH_STUDENTS_PAGE_QUERY = """
+    SELECT s.student_id, s.name, s.age, s.email, 
+        GROUP_CONCAT(e.course_id) AS registered_courses
+    FROM Student s
+    LEFT JOIN Enrollment e ON s.student_id = e.student_id
+    WHERE s.student_id > ?
+    GROUP BY s.student_id
+    ORDER BY s.student_id
+    LIMIT ?
+"""
+
+FETCH_INSTRUCTORS_PAGE_QUERY = """
+    SELECT i.instructor_id, i.name, i.age, i.email, 
+        GROUP_CONCAT(c.course_id) AS assigned_courses
+    FROM Instructor i
+    LEFT JOIN Course c ON i.instructor_id = c.instructor_id
+    WHERE i.instructor_id > ?
+    GROUP BY i.instructor_id
+    ORDER BY i.instructor_id
+    LIMIT ?
+"""
+
+DELETE_COURSE_ENROLLMENTS_QUERY = "DELETE FROM Enrollment WHERE course_id = ?"
+DELETE_STUDENT_ENROLLMENTS_QUERY = "DELETE FROM Enrollment WHERE student_id = ?"
+CLEAR_INSTRUCTOR_COURSES_QUERY = "UPDATE Course SET instructor_id = NULL WHERE instructor_id = ?"
+
+# Queries that must be served by an index, checked by check_query_plans
+hot_queries = [
+    FETCH_COURSES_QUERY,
+    FETCH_STUDENTS_QUERY,
+    FETCH_INSTRUCTORS_QUERY,
+    FETCH_COURSES_PAGE_QUERY,
+    FETCH_STUDENTS_PAGE_QUERY,
+    FETCH_INSTRUCTORS_PAGE_QUERY,
+    DELETE_COURSE_ENROLLMENTS_QUERY,
+    DELETE_STUDENT_ENROLLMENTS_QUERY,
+    CLEAR_INSTRUCTOR_COURSES_QUERY,
+]
+
+_local = threading.local()
+
+# The (thread, connection) pairs of the pooled connections still open, closed together at exit by close_all_db.
+# Connections of threads that ended without close_db are closed when another connection is opened
+_connections = []
+_connections_lock = threading.Lock()
+
+# The in-memory copy of the database while memory_mode is on
+_memory = {"anchor": None, "path": None, "uri": None, "version": None, "flusher": None, "stop": None}
+_memory_lock = threading.RLock()
+_memory_names = itertools.count()
+
 def connect_db():
     """
-    Establish a connection to the SQLite database.
+    Return the calling thread's pooled connection to the SQLite database.
+
+    The connection is opened and tuned with `connection_pragmas` on first use and then kept warm
+    for every later call from the same thread, so the file is not reopened and the schema is not
+    reparsed on each operation. A new connection is opened if `database_path` or `memory_mode` has changed.
+
+    In memory mode the connection is to the in-memory copy of `database_path` (see `open_memory_db`).
 
     Returns:
         sqlite3.Connection: A connection object to interact with the database.
     """
-    return sqlite3.connect(database_path)
+    target = open_memory_db() if memory_mode else database_path
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == target:
+        return conn
+    if conn is not None:
+        close_db()
+
+    # Only used by this thread, but closed by the thread that exits the program (see close_all_db)
+    conn = sqlite3.connect(target, uri=memory_mode, check_same_thread=False)
+    try:
+        for pragma, value in connection_pragmas.items():
+            if not (memory_mode and pragma in file_only_pragmas):
+                conn.execute(f"PRAGMA {pragma} = {value}")
+        migrate_db(conn)
+    except BaseException:
+        conn.close()
+        raise
+    with _connections_lock:
+        finished = [pair for pair in _connections if not pair[0].is_alive()]
+        for pair in finished:
+            _connections.remove(pair)
+        _connections.append((threading.current_thread(), conn))
+    for _, connection in finished:
+        connection.close()
+    _local.conn = conn
+    _local.path = target
+    return conn
+
+def close_db():
+    """
+    Close the calling thread's pooled connection, if one is open.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        with _connections_lock:
+            _connections[:] = [pair for pair in _connections if pair[1] is not conn]
+        conn.close()
+        _local.conn = None
+        _local.path = None
+
+def close_all_db():
+    """
+    Close the pooled connections of every thread. Registered to run at exit, when the threads that opened
+    them may still be running or may never have closed them; they must not be used afterwards.
+    """
+    with _connections_lock:
+        connections = [conn for _, conn in _connections]
+        _connections.clear()
+    for conn in connections:
+        conn.close()
+
+atexit.register(close_all_db)
+
+def open_memory_db():
+    """
+    Load `database_path` into memory with the SQLite backup API, if it is not loaded already.
+
+    A file in WAL mode records it in its header, which the memdb VFS cannot open. The file is therefore read
+    with `serialize`, switched to rollback journal mode in the copy (header bytes 18 and 19 set to 1) and
+    loaded through a private in-memory database, so the file itself keeps its journal mode.
+
+    The copy lives in SQLite's memdb VFS under a name unique to this process, so the pooled connection of every
+    thread opens the same in-memory database and SQLite's usual locking (with its busy timeout) applies between
+    them. It is kept alive by an anchor connection until `close_memory_db`. If `flush_interval` is set, a daemon
+    thread flushes the copy back to the file on that interval. Loading another file closes (and flushes) the
+    previous copy first.
+
+    Returns:
+        str: The URI of the in-memory database.
+    """
+    with _memory_lock:
+        if _memory["anchor"] is not None and _memory["path"] == database_path:
+            return _memory["uri"]
+        close_memory_db()
+
+        uri = f"file:/lab2-{os.getpid()}-{next(_memory_names)}?vfs=memdb"
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        disk = sqlite3.connect(database_path)
+        try:
+            image = bytearray(disk.serialize())
+        finally:
+            disk.close()
+        if image:
+            image[18:20] = b"\x01\x01"
+            staging = sqlite3.connect(":memory:")
+            try:
+                staging.deserialize(bytes(image))
+                staging.backup(anchor)
+            finally:
+                staging.close()
+        _memory.update(anchor=anchor, path=database_path, uri=uri,
+                       version=anchor.execute("PRAGMA data_version").fetchone()[0])
+
+        if flush_interval:
+            stop = threading.Event()
+            flusher = threading.Thread(target=_flush_periodically, args=(stop, flush_interval),
+                                       name="database-flusher", daemon=True)
+            _memory.update(flusher=flusher, stop=stop)
+            flusher.start()
+        return uri
+
+def _flush_periodically(stop: threading.Event, interval: float):
+    """
+    Flush the in-memory copy every `interval` seconds until `stop` is set.
+    """
+    while not stop.wait(interval):
+        with _memory_lock:
+            if not stop.is_set():
+                flush_db()
+
+def flush_db():
+    """
+    Write the in-memory copy back to its file, if it has changed since it was loaded or last flushed.
+
+    Changes are detected with PRAGMA data_version, which counts the commits of the other connections. The copy
+    is first backed up to a private in-memory database, which only holds up writers for the time of a memory
+    copy, and then written to the file from there.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if the file is up to date, False if it could not be written.
+            - list: A list of messages indicating success or errors encountered.
+    """
+    with _memory_lock:
+        anchor = _memory["anchor"]
+        if anchor is None:
+            return True, ["No in-memory database to flush"]
+        version = anchor.execute("PRAGMA data_version").fetchone()[0]
+        if version == _memory["version"]:
+            return True, ["Database file already up to date"]
+
+        snapshot = sqlite3.connect(":memory:")
+        try:
+            anchor.backup(snapshot)
+            disk = sqlite3.connect(_memory["path"])
+            try:
+                snapshot.backup(disk)
+            finally:
+                disk.close()
+        except sqlite3.Error as e:
+            return False, [f"Error flushing database to {_memory['path']}: {e}"]
+        finally:
+            snapshot.close()
+        _memory["version"] = version
+        return True, [f"Database flushed to {_memory['path']}"]
+
+def close_memory_db():
+    """
+    Stop the background flusher, flush the in-memory copy a last time and release it.
+
+    Runs at interpreter exit, so changes made in memory mode reach the file on a normal shutdown.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if the file is up to date, False if the last flush failed.
+            - list: A list of messages indicating success or errors encountered.
+    """
+    with _memory_lock:
+        if _memory["stop"] is not None:
+            # The flusher checks the event under the lock, so it never flushes again once it is set
+            _memory["stop"].set()
+        result = flush_db()
+        close_db()
+        if _memory["anchor"] is not None:
+            _memory["anchor"].close()
+        _memory.update(anchor=None, path=None, uri=None, version=None, flusher=None, stop=None)
+        return result
+
+atexit.register(close_memory_db)
+
+def migrate_db(conn: sqlite3.Connection):
+    """
+    Apply every schema migration the database has not seen yet.
+
+    The applied version is stored in PRAGMA user_version, so each migration runs once per database. The tables
+    are not created here: on a new or empty database, the migrations stop at the first one whose tables do not
+    exist yet, and it runs on a later connection once they do.
+
+    Args:
+        conn (sqlite3.Connection): The connection to migrate.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= len(migrations):
+        return
+    tables = {name.lower() for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for number, (required, statements) in enumerate(migrations[version:], start=version + 1):
+        if not tables.issuperset(table.lower() for table in required):
+            return
+        with conn:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {number}")
+
+def check_query_plans():
+    """
+    Check with EXPLAIN QUERY PLAN that none of the `hot_queries` fall back to a table scan.
+
+    A step fails if it scans a table without an index or builds an automatic index at query time.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if every hot query uses an index, False otherwise.
+            - list: A list of messages indicating success or the offending plan steps.
+    """
+    conn : sqlite3.Connection = connect_db()
+    errors = []
+    for query in hot_queries:
+        parameters = (None,) * query.count("?")
+        for step in conn.execute("EXPLAIN QUERY PLAN " + query, parameters):
+            detail = step[3]
+            if (detail.startswith("SCAN") and "USING" not in detail) or "AUTOMATIC" in detail:
+                errors.append(f"{detail} in: {' '.join(query.split())}")
+
+    if errors:
+        return False, errors
+    else:
+        return True, ["Query plans use indexes"]
 
 def fetch_courses():
     """
@@ -24,19 +362,69 @@ def fetch_courses():
     conn : sqlite3.Connection = connect_db()
     cursor : sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("""
-            SELECT c.course_id, c.course_name, c.instructor_id, 
-                GROUP_CONCAT(e.student_id) AS enrolled_students
-            FROM Course c
-            LEFT JOIN Enrollment e ON c.course_id = e.course_id
-            GROUP BY c.course_id
-        """)
+        cursor.execute(FETCH_COURSES_QUERY)
         courses = cursor.fetchall()
         return courses
     except sqlite3.Error as e:
         return []
+
+def fetch_courses_page(after_id: str = None, limit: int = 500):
+    """
+    Retrieve one page of courses ordered by course_id, starting after the given course_id.
+
+    Args:
+        after_id (str): The last course_id of the previous page, or None for the first page.
+        limit (int): The maximum number of courses to return.
+
+    Returns:
+        list: A list of tuples in the same format as `fetch_courses`.
+              Returns an empty list if an error occurs or there are no more courses.
+    """
+    return _fetch_page(FETCH_COURSES_PAGE_QUERY, after_id, limit)
+
+def iter_courses(batch_size: int = 500):
+    """
+    Stream all courses from the database without loading them into memory at once.
+
+    Args:
+        batch_size (int): The number of rows pulled from the cursor at a time.
+
+    Yields:
+        tuple: A tuple in the same format as `fetch_courses`.
+    """
+    yield from _iter_rows(FETCH_COURSES_QUERY, batch_size)
+
+def _fetch_page(query: str, after_id: str, limit: int):
+    """
+    Runs a keyset page query. Ids are text, so every id sorts after the empty string.
+
+    Returns:
+        list: The rows of the page, or an empty list if an error occurs.
+    """
+    conn : sqlite3.Connection = connect_db()
+    cursor : sqlite3.Cursor = conn.cursor()
+    try:
+        cursor.execute(query, (after_id if after_id is not None else "", limit))
+        return cursor.fetchall()
+    except sqlite3.Error as e:
+        return []
+
+def _iter_rows(query: str, batch_size: int):
+    """
+    Runs a query on its own cursor and yields its rows, pulling them with fetchmany.
+    """
+    conn : sqlite3.Connection = connect_db()
+    cursor : sqlite3.Cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        rows = cursor.fetchmany(batch_size)
+        while rows:
+            yield from rows
+            rows = cursor.fetchmany(batch_size)
+    except sqlite3.Error as e:
+        return
     finally:
-        conn.close()
+        cursor.close()
 
 def add_course(course: Course):
     """
@@ -62,9 +450,8 @@ def add_course(course: Course):
         conn.commit()
         return True, [f"Added course {course.course_name} to table"]
     except sqlite3.Error as e:
+        conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def edit_course(course: Course):
     """
@@ -92,8 +479,6 @@ def edit_course(course: Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def delete_course(course: Course):
     """
@@ -110,7 +495,7 @@ def delete_course(course: Course):
     conn: sqlite3.Connection = connect_db()
     cursor: sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("DELETE FROM Enrollment WHERE course_id = ?", (course.course_id,))
+        cursor.execute(DELETE_COURSE_ENROLLMENTS_QUERY, (course.course_id,))
         conn.commit()
         cursor.execute("DELETE FROM Course WHERE course_id = ?", (course.course_id,))
         conn.commit()
@@ -118,8 +503,6 @@ def delete_course(course: Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def fetch_students():
     """
@@ -133,19 +516,37 @@ def fetch_students():
     conn  : sqlite3.Connection = connect_db()
     cursor : sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("""
-            SELECT s.student_id, s.name, s.age, s.email, 
-                GROUP_CONCAT(e.course_id) AS registered_courses
-            FROM Student s
-            LEFT JOIN Enrollment e ON s.student_id = e.student_id
-            GROUP BY s.student_id
-        """)
+        cursor.execute(FETCH_STUDENTS_QUERY)
         students = cursor.fetchall()
         return students
     except sqlite3.Error as e:
         return []
-    finally:
-        conn.close()
+
+def fetch_students_page(after_id: str = None, limit: int = 500):
+    """
+    Retrieve one page of students ordered by student_id, starting after the given student_id.
+
+    Args:
+        after_id (str): The last student_id of the previous page, or None for the first page.
+        limit (int): The maximum number of students to return.
+
+    Returns:
+        list: A list of tuples in the same format as `fetch_students`.
+              Returns an empty list if an error occurs or there are no more students.
+    """
+    return _fetch_page(FETCH_STUDENTS_PAGE_QUERY, after_id, limit)
+
+def iter_students(batch_size: int = 500):
+    """
+    Stream all students from the database without loading them into memory at once.
+
+    Args:
+        batch_size (int): The number of rows pulled from the cursor at a time.
+
+    Yields:
+        tuple: A tuple in the same format as `fetch_students`.
+    """
+    yield from _iter_rows(FETCH_STUDENTS_QUERY, batch_size)
 
 def add_student(student: Student):
     """
@@ -171,9 +572,8 @@ def add_student(student: Student):
         conn.commit()
         return True, [f"Added student {student.name} to table"]
     except sqlite3.Error as e:
+        conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def edit_student(student: Student):
     """
@@ -201,8 +601,6 @@ def edit_student(student: Student):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def delete_student(student: Student):
     """
@@ -219,7 +617,7 @@ def delete_student(student: Student):
     conn  : sqlite3.Connection = connect_db()
     cursor : sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("DELETE FROM Enrollment WHERE student_id = ?", (student.student_id,))
+        cursor.execute(DELETE_STUDENT_ENROLLMENTS_QUERY, (student.student_id,))
         conn.commit()
         cursor.execute("DELETE FROM Student WHERE student_id = ?", (student.student_id,))
         conn.commit()
@@ -227,8 +625,6 @@ def delete_student(student: Student):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def register_course(student: Student, course: Course):
     """
@@ -253,8 +649,6 @@ def register_course(student: Student, course: Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def unregister_course(student: Student, course : Course):
     """
@@ -279,8 +673,69 @@ def unregister_course(student: Student, course : Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
+
+def register_courses_bulk(pairs):
+    """
+    Register many students to courses in the database inside a single transaction.
+
+    Each (student, course) pair is inserted with the same statement as `register_course`, but only
+    one commit is issued for the whole batch. A pair that fails (e.g. already registered) does not
+    abort the others.
+
+    Args:
+        pairs (iterable): An iterable of (Student, Course) tuples.
+
+    Returns:
+        list: A list with one tuple per pair, in input order, containing:
+            - bool: True if the student was successfully registered, False otherwise.
+            - list: A list of messages indicating success or errors encountered.
+    """
+    return _enrollment_bulk(pairs, "INSERT INTO Enrollment (course_id, student_id) VALUES (?, ?)",
+                            "Added student {student} to course {course}")
+
+def unregister_courses_bulk(pairs):
+    """
+    Unregister many students from courses in the database inside a single transaction.
+
+    Args:
+        pairs (iterable): An iterable of (Student, Course) tuples.
+
+    Returns:
+        list: A list with one tuple per pair, in input order, containing:
+            - bool: True if the student was successfully unregistered, False otherwise.
+            - list: A list of messages indicating success or errors encountered.
+    """
+    return _enrollment_bulk(pairs, "DELETE FROM Enrollment WHERE course_id = ? AND student_id = ?",
+                            "Removed student {student} from course {course}")
+
+def _enrollment_bulk(pairs, query, message):
+    """
+    Runs an Enrollment statement for every (student, course) pair and commits once.
+
+    Args:
+        pairs (iterable): An iterable of (Student, Course) tuples.
+        query (str): The statement to run, taking (course_id, student_id) parameters.
+        message (str): The success message, formatted with the student and course names.
+
+    Returns:
+        list: A list of (bool, list) results, one per pair. If the commit fails, every pair fails.
+    """
+    pairs = list(pairs)
+    conn  : sqlite3.Connection = connect_db()
+    cursor : sqlite3.Cursor = conn.cursor()
+    results = []
+    try:
+        for student, course in pairs:
+            try:
+                cursor.execute(query, (course.course_id, student.student_id))
+                results.append((True, [message.format(student=student.name, course=course.course_name)]))
+            except sqlite3.Error as e:
+                results.append((False, [str(e)]))
+        conn.commit()
+        return results
+    except sqlite3.Error as e:
+        conn.rollback()
+        return [(False, [str(e)]) for _ in pairs]
 
 def fetch_instructors():
     """
@@ -294,19 +749,37 @@ def fetch_instructors():
     conn  : sqlite3.Connection = connect_db()
     cursor : sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("""
-            SELECT i.instructor_id, i.name, i.age, i.email, 
-                GROUP_CONCAT(c.course_id) AS assigned_courses
-            FROM Instructor i
-            LEFT JOIN Course c ON i.instructor_id = c.instructor_id
-            GROUP BY i.instructor_id
-        """)
+        cursor.execute(FETCH_INSTRUCTORS_QUERY)
         instructors = cursor.fetchall()
         return instructors
     except sqlite3.Error as e:
         return []
-    finally:
-        conn.close()
+
+def fetch_instructors_page(after_id: str = None, limit: int = 500):
+    """
+    Retrieve one page of instructors ordered by instructor_id, starting after the given instructor_id.
+
+    Args:
+        after_id (str): The last instructor_id of the previous page, or None for the first page.
+        limit (int): The maximum number of instructors to return.
+
+    Returns:
+        list: A list of tuples in the same format as `fetch_instructors`.
+              Returns an empty list if an error occurs or there are no more instructors.
+    """
+    return _fetch_page(FETCH_INSTRUCTORS_PAGE_QUERY, after_id, limit)
+
+def iter_instructors(batch_size: int = 500):
+    """
+    Stream all instructors from the database without loading them into memory at once.
+
+    Args:
+        batch_size (int): The number of rows pulled from the cursor at a time.
+
+    Yields:
+        tuple: A tuple in the same format as `fetch_instructors`.
+    """
+    yield from _iter_rows(FETCH_INSTRUCTORS_QUERY, batch_size)
 
 def add_instructor(instructor: Instructor):
     """
@@ -334,8 +807,6 @@ def add_instructor(instructor: Instructor):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def edit_instructor(instructor: Instructor):
     """
@@ -363,8 +834,6 @@ def edit_instructor(instructor: Instructor):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def delete_instructor(instructor: Instructor):
     """
@@ -381,7 +850,7 @@ def delete_instructor(instructor: Instructor):
     conn  : sqlite3.Connection = connect_db()
     cursor : sqlite3.Cursor = conn.cursor()
     try:
-        cursor.execute("UPDATE Course SET instructor_id = NULL WHERE instructor_id = ?", (instructor.instructor_id,))
+        cursor.execute(CLEAR_INSTRUCTOR_COURSES_QUERY, (instructor.instructor_id,))
         conn.commit()
         cursor.execute("DELETE FROM Instructor WHERE instructor_id = ?", (instructor.instructor_id,))
         conn.commit()
@@ -389,8 +858,6 @@ def delete_instructor(instructor: Instructor):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
  
 def assign_instructor(instructor : Instructor, course : Course):
     """
@@ -414,8 +881,6 @@ def assign_instructor(instructor : Instructor, course : Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
 
 def unassign_instructor(instructor : Instructor, course : Course):
     """
@@ -439,5 +904,3 @@ def unassign_instructor(instructor : Instructor, course : Course):
     except sqlite3.Error as e:
         conn.rollback()
         return False, [str(e)]
-    finally:
-        conn.close()
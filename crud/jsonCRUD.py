@@ -1,32 +1,681 @@
 import json
+import os
+import tempfile
+import shutil
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from crud.jsonStream import iter_table
+from crud import binarySnapshot
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows: locking is then limited to the threads of this process
+    fcntl = None
 
 file_path = "./data.json"
 
+# How changes are persisted: "snapshot" rewrites `file_path` on every change, "journal" appends each
+# change to `journal_path` and only rewrites `file_path` when the journal is compacted
+storage_mode = "snapshot"
+journal_path = "./data.json.log"
+
+# On-disk format of the snapshot at `file_path`: "json", or "binary" for the compact format of crud.binarySnapshot
+# (convert an existing file with binarySnapshot.json_to_binary before switching)
+snapshot_format = "json"
+
+# Number of journaled changes after which the journal is compacted into a new snapshot
+compact_threshold = 1000
+
+# Number of previous snapshots kept next to `file_path` as file_path.1 (newest) to file_path.N (oldest)
+history_size = 3
+
+# File locked while reading (shared) and writing (exclusive) the data, so several processes can share it
+lock_path = "./data.json.lock"
+
+# Key of the document's version counter, incremented by every saved change
+version_key = "_version"
+
+# Name of the id field of the rows of each table
+id_fields = {"Course": "course_id", "Student": "student_id", "Instructor": "instructor_id"}
+
+# Parsed copy of the JSON file (and journal), kept between calls and revalidated against their stat signatures,
+# along with the id -> position index of each of its tables
+_cache = {"signature": None, "data": None, "journal_ops": 0, "journal_offset": 0, "indexes": {}}
+
+# The transaction the add, edit and delete functions currently belong to, if any (see `transaction`)
+_transaction = None
+
+# The open `lock_path` and how many nested _locked blocks of this process hold it
+_lock = {"file": None, "depth": 0}
+_thread_lock = threading.RLock()
+
+# Number of load_json calls served from the cache (hits) and by parsing the file (misses), and number of
+# changes that had to be checked again because another process saved a newer version first (conflicts)
+cache_stats = {"hits": 0, "misses": 0, "conflicts": 0}
+
+@contextmanager
+def _locked(exclusive=False):
+    """
+    Holds the lock on `lock_path` for the duration of the block: shared for reading, exclusive for writing.
+
+    Nested blocks of the same process reuse the lock taken by the outermost one, which must be exclusive if
+    any nested block is. Threads of the process take turns.
+    """
+    with _thread_lock:
+        if _lock["depth"] == 0:
+            f = open(lock_path, 'a')
+            if fcntl is not None:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                except BaseException:
+                    f.close()
+                    raise
+            _lock["file"] = f
+        _lock["depth"] += 1
+        try:
+            yield
+        finally:
+            _lock["depth"] -= 1
+            if _lock["depth"] == 0:
+                # Closing the file releases the lock
+                _lock["file"].close()
+                _lock["file"] = None
+
+def _file_signature(path):
+    """
+    Returns what identifies the current contents of a file without reading it: its path, inode, size and mtime.
+    Returns None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (os.path.abspath(path), st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _signature():
+    """
+    Returns the signature of everything load_json reads in the current storage mode.
+    """
+    if storage_mode == "journal":
+        return (_file_signature(file_path), _file_signature(journal_path))
+    return (_file_signature(file_path), None)
+
 def load_json():
     """
     Load data from a JSON file.
 
-    Reads the JSON data from the file specified by `file_path` and returns it.
+    Reads the JSON data from the file specified by `file_path` (stored in `snapshot_format`) and returns it.
+    In journal mode the changes recorded in `journal_path` are replayed on top of it. The parsed data is
+    cached in memory and only re-parsed when the files' inode, size or mtime show that they changed on disk
+    (e.g. another process saved them); the files are then read under a shared lock. In journal mode, when only
+    the journal grew, just the changes appended since the last read are applied. The returned dict is the
+    cached copy: after mutating it, persist it with `save_data`.
 
     Returns:
         dict: The data loaded from the JSON file.
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    signature = _signature()
+    if _cache["signature"] == signature:
+        cache_stats["hits"] += 1
+        return _cache["data"]
+
+    with _locked():
+        # Another process may have saved between the stat and taking the lock
+        signature = _signature()
+        cache_stats["misses"] += 1
+        if _journal_grew(signature):
+            count, offset = _replay_journal(_cache["data"], _cache["indexes"], _cache["journal_offset"])
+            _cache["signature"] = signature
+            _cache["journal_ops"] += count
+            _cache["journal_offset"] = offset
+            return _cache["data"]
+
+        data = _read_snapshot()
+        indexes = {}
+        journal_ops, journal_offset = 0, 0
+        if storage_mode == "journal":
+            journal_ops, journal_offset = _replay_journal(data, indexes)
+    _cache["signature"] = signature
+    _cache["data"] = data
+    _cache["journal_ops"] = journal_ops
+    _cache["journal_offset"] = journal_offset
+    _cache["indexes"] = indexes
     return data
 
+def _journal_grew(signature):
+    """
+    Returns whether the cached data can be brought up to date by replaying the end of the journal: the snapshot
+    is unchanged and the journal was only appended to since it was read. Not while a transaction has unsaved
+    changes in the cached data, which must be checked against the latest document instead.
+    """
+    cached = _cache["signature"]
+    if storage_mode != "journal" or cached is None or _transaction is not None:
+        return False
+    if cached[0] != signature[0] or cached[1] is None or signature[1] is None:
+        return False
+    # Same path and inode, and at least as long as what was read
+    return cached[1][:2] == signature[1][:2] and signature[1][2] >= _cache["journal_offset"]
+
+def iter_json(table_type):
+    """
+    Iterate over the rows of a table in the JSON data.
+
+    In snapshot mode with a JSON snapshot, when the cached copy is out of date, the rows are parsed one at a
+    time straight from `file_path` (see crud.jsonStream), so the first rows are available before the rest of
+    the file is read and the whole document is never held in memory. Otherwise the rows come from `load_json`,
+    since the cache is already parsed or the journal has to be replayed on top of the snapshot.
+
+    Args:
+        table_type (str): The table to read, 'Course', 'Student', or 'Instructor'
+
+    Yields:
+        dict: The rows of the table.
+    """
+    if storage_mode == "journal" or snapshot_format != "json" or _cache["signature"] == _signature():
+        yield from load_json()[table_type]
+        return
+    yield from iter_table(file_path, table_type)
+
+def get_entry_json(table_type, id):
+    """
+    Look up an entry of a table in the JSON data by its id.
+
+    Inside a transaction, the entry reflects the changes already made in it.
+
+    Args:
+        table_type (str): The table to look in, 'Course', 'Student', or 'Instructor'
+        id (str): The id of the entry.
+
+    Returns:
+        dict: The stored entry, or None if the table has no entry with that id.
+    """
+    data = _current_data()
+    if not isinstance(data.get(table_type), list):
+        return None
+    position = _table_index(data, table_type).get(id)
+    if position is None:
+        return None
+    return data[table_type][position]
+
 def save_data(new_data):
     """
     Save data to a JSON file.
 
-    Writes the given data to the JSON file specified by `file_path`.
+    Writes the given data to the JSON file specified by `file_path` and keeps it as the cached copy.
+    The data is written to a temporary file that is fsynced and then renamed over `file_path`, so a crash
+    or a concurrent reader never sees a partially written file. The previous snapshots are kept as
+    generations (see `history_size`). In journal mode the journal is emptied, since the snapshot now
+    contains every change.
+
+    The save replaces whatever other processes saved in the meantime; its version is set above theirs.
 
     Args:
         new_data (dict): The data to be saved into the JSON file.
     """
-    with open(file_path, 'w') as f:
-        json.dump(new_data, f, indent=4)
+    try:
+        with _locked(exclusive=True):
+            current = _current_version()
+            new_data[version_key] = max(new_data.get(version_key, 0), current) + 1
+            _write_snapshot(new_data)
+    except BaseException:
+        # The cached data may have been changed directly and was not saved
+        _discard_changes()
+        raise
+    # The caller may have changed the tables directly, so the indexes are rebuilt when next needed
+    _cache["indexes"] = {}
+
+def _write_snapshot(new_data):
+    """
+    Writes `new_data` as the new snapshot and makes it the cached copy, keeping the table indexes.
+    Used for changes applied through `_apply`, which keeps the indexes in sync itself.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb' if snapshot_format == "binary" else 'w') as f:
+            if snapshot_format == "binary":
+                f.write(binarySnapshot.dumps(new_data))
+            else:
+                json.dump(new_data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        _rotate_generations()
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(directory)
+
+    if storage_mode == "journal":
+        open(journal_path, 'w').close()
+    _cache["signature"] = _signature()
+    _cache["data"] = new_data
+    _cache["journal_ops"] = 0
+    _cache["journal_offset"] = 0
+
+def _read_snapshot():
+    """
+    Parses `file_path`, falling back to the newest previous generation that parses if it is unreadable.
+
+    Returns:
+        dict: The parsed data.
+
+    Raises:
+        ValueError: If neither the file nor any generation can be parsed (json.JSONDecodeError, or
+            binarySnapshot.SnapshotError for binary snapshots).
+    """
+    paths = [file_path] + [f"{file_path}.{generation}" for generation in range(1, history_size + 1)]
+    error = None
+    for path in paths:
+        try:
+            if snapshot_format == "binary":
+                with open(path, 'rb') as f:
+                    return binarySnapshot.loads(f.read())
+            with open(path, 'r') as f:
+                return json.load(f)
+        except ValueError as e:
+            error = error or e
+        except FileNotFoundError:
+            if path == file_path:
+                raise
+    raise error
+
+def _rotate_generations():
+    """
+    Shifts file_path.1 .. file_path.N-1 up by one and makes the current `file_path` the new file_path.1.
+    The current file is hard linked, not moved, so `file_path` exists at every moment.
+    """
+    if history_size <= 0 or not os.path.exists(file_path):
+        return
+    for generation in range(history_size - 1, 0, -1):
+        older = f"{file_path}.{generation}"
+        if os.path.exists(older):
+            os.replace(older, f"{file_path}.{generation + 1}")
+    newest = f"{file_path}.1"
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        os.link(file_path, newest)
+    except OSError:
+        shutil.copyfile(file_path, newest)
+
+def _fsync_directory(directory):
+    """
+    Flushes a rename to disk by fsyncing the directory that contains it, where the platform allows it.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def compact_journal():
+    """
+    Compact the journal: write the current data as a new snapshot and empty the journal.
+    """
+    with _locked(exclusive=True):
+        _write_snapshot(load_json())
+
+def _commit(data, record):
+    """
+    Persists a change that was already applied to the cached data.
+
+    In snapshot mode the whole data is saved. In journal mode the change record is appended to the journal
+    as one JSON line, in place of a last line cut short by a crash, and fsynced, and the journal is compacted
+    once it holds `compact_threshold` changes.
+
+    Args:
+        data (dict): The cached data, with the change applied.
+        record (dict): The change, as built by the add, edit and delete functions.
+    """
+    if storage_mode != "journal":
+        _write_snapshot(data)
+        return
+
+    with open(journal_path, 'a') as f:
+        # Drop a last line cut short by a crash, which replaying stops at, so the record starts on its own line
+        end = _cache["journal_offset"]
+        f.truncate(end)
+        try:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            # Do not leave a partial line that a later append would run into
+            f.truncate(end)
+            raise
+        _cache["journal_offset"] = f.tell()
+    _cache["signature"] = _signature()
+    _cache["journal_ops"] += 1
+    if _cache["journal_ops"] >= compact_threshold:
+        _write_snapshot(data)
+
+def _replay_journal(data, indexes, offset=0):
+    """
+    Applies the changes recorded in the journal, from byte `offset` on, to the data loaded from the snapshot.
+
+    A last line cut short by a crash is ignored. Replaying is idempotent, so changes already contained in the
+    snapshot (a crash between writing a snapshot and emptying the journal) are harmless.
+
+    Returns:
+        tuple: The number of changes replayed and the offset of the end of the last one.
+    """
+    try:
+        f = open(journal_path, 'rb')
+    except FileNotFoundError:
+        return 0, 0
+
+    count = 0
+    with f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            _apply(data, record, indexes)
+            count += 1
+            offset += len(line)
+    return count, offset
+
+def _entry_id(entry):
+    """
+    Returns the id of a Course, Student or Instructor.
+    """
+    return getattr(entry, "course_id", None) or getattr(entry, "student_id", None) or getattr(entry, "instructor_id", None)
+
+def _entry_dict(entry):
+    """
+    Returns the stored form of an entry, copying its lists so later changes to the object do not leak into the data.
+    """
+    return entry.to_dict()
 
+def _table_index(data, table, indexes=None):
+    """
+    Returns the id -> position index of a table, building it on first use.
+
+    Args:
+        data (dict): The data the table belongs to.
+        table (str): The name of the table.
+        indexes (dict): The indexes of `data`, defaulting to the ones of the cached data.
+
+    Returns:
+        dict: The position of each row in the table, keyed by the row's id.
+    """
+    if indexes is None:
+        indexes = _cache["indexes"]
+    index = indexes.get(table)
+    if index is None:
+        field = id_fields.get(table)
+        index = {}
+        for position, row in enumerate(data[table]):
+            index.setdefault(_row_id(row, field), position)
+        indexes[table] = index
+    return index
+
+def _row_id(row, field):
+    """
+    Returns the id of a stored row: the value of the table's id field, or the first id field the row has.
+    """
+    if field is not None:
+        return row.get(field)
+    return row.get('student_id') or row.get('course_id') or row.get('instructor_id')
+
+def _apply(data, record, indexes=None):
+    """
+    Applies a change record to the data, keeping the table's index in sync.
+
+    A deleted row is removed from its place, so the rows keep their order; the positions of the rows after
+    it are shifted in the index. Adds and edits only touch their own row.
+
+    Args:
+        data (dict): The data to change.
+        record (dict): A dict with the keys "op" ('add', 'edit' or 'delete'), "table", "id" and, except
+            for deletes, "entry" (the stored form of the entry); or a transaction, with the keys "op" ('batch')
+            and "records" (the list of its changes). Saved records also carry the document "version" they
+            produced.
+        indexes (dict): The indexes of `data`, defaulting to the ones of the cached data.
+    """
+    if "version" in record:
+        data[version_key] = record["version"]
+    if record["op"] == "batch":
+        for change in record["records"]:
+            _apply(data, change, indexes)
+        return
+
+    table = record["table"]
+    rows = data[table]
+    index = _table_index(data, table, indexes)
+    position = index.get(record["id"])
+    if record["op"] == "delete":
+        if position is not None:
+            del index[record["id"]]
+            del rows[position]
+            field = id_fields.get(table)
+            for later in range(position, len(rows)):
+                row_id = _row_id(rows[later], field)
+                # A duplicated id stays indexed at its first row
+                if index.get(row_id) == later + 1:
+                    index[row_id] = later
+    elif position is not None:
+        rows[position] = record["entry"]
+    elif record["op"] == "add":
+        index[record["id"]] = len(rows)
+        rows.append(record["entry"])
+
+def _check(data, record, base=False):
+    """
+    Returns why a change record cannot be applied to the data, or None if it can.
+
+    Args:
+        data (dict): The data to check against.
+        record (dict): The change record.
+        base (bool): Whether an edit must also find the row it was made on ("base") unchanged in the data.
+    """
+    table = record["table"]
+    if not isinstance(data.get(table), list):
+        return "Table does not exist"
+    position = _table_index(data, table).get(record["id"])
+    if record["op"] == "add" and position is not None:
+        return f'{table} already exists in table'
+    if record["op"] != "add" and position is None:
+        return f'{table} not in table'
+    if base and record["op"] == "edit" and data[table][position] != record["base"]:
+        return f'{table} was changed by another process, load it again and retry'
+    return None
+
+def _stored(record):
+    """
+    Returns a change record as it is saved, without the row an edit was made on.
+    """
+    if "base" not in record:
+        return record
+    return {key: value for key, value in record.items() if key != "base"}
+
+def _current_version():
+    """
+    Returns the version of the saved document, 0 if it has none or does not exist yet.
+    """
+    try:
+        return load_json().get(version_key, 0)
+    except FileNotFoundError:
+        return 0
+
+def _save(data, records, applied):
+    """
+    Saves change records that were checked against the data, as one compare-and-swap.
+
+    Under the exclusive lock, if another process saved a newer version since the data was loaded, the latest
+    document is loaded and only these records are checked and applied again on top of it. An edit only applies
+    if the row it was made on is unchanged in the latest document, so a read-modify-write never overwrites
+    the other process' change to the same row; the save fails with a conflict instead. The document's version
+    is then incremented and the change is committed. If saving raises (e.g. the disk is full), the cached data,
+    which the records were already applied to, is dropped so that it is read again from the files.
+
+    Args:
+        data (dict): The document the records were checked against.
+        records (list): The change records, in order.
+        applied (bool): Whether the records were already applied to `data`.
+
+    Returns:
+        list: The messages of the record that no longer applies to the latest document, empty if saved.
+    """
+    try:
+        with _locked(exclusive=True):
+            version = data.get(version_key, 0)
+            if applied and (_cache["data"] is not data or _cache["signature"] != _signature()):
+                # The unsaved changes cannot be caught up with the other process' changes
+                _discard_changes()
+            latest = load_json()
+            if not applied or latest is not data:
+                rebased = latest.get(version_key, 0) != version
+                if rebased:
+                    cache_stats["conflicts"] += 1
+                changed = set()
+                for position, record in enumerate(records):
+                    # Only the first change of a row was made on the saved document
+                    key = (record["table"], record["id"])
+                    error = _check(latest, record, base=rebased and key not in changed)
+                    if error is not None:
+                        if position > 0:
+                            _discard_changes()
+                        return [error]
+                    changed.add(key)
+                    _apply(latest, record)
+            data = latest
+            version = data.get(version_key, 0) + 1
+            data[version_key] = version
+            if len(records) == 1:
+                record = dict(_stored(records[0]), version=version)
+            else:
+                record = {"op": "batch", "records": [_stored(record) for record in records], "version": version}
+            _commit(data, record)
+    except BaseException:
+        # The cached data holds changes that were not saved
+        _discard_changes()
+        raise
+    return []
+
+def _change(data, record, message):
+    """
+    Checks a change record against the data, then saves it, or applies it to the data of the active transaction.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if the change was made, False otherwise.
+            - list: A list containing `message`, or the errors encountered.
+    """
+    error = _check(data, record)
+    if error is not None:
+        return False, [error]
+    if record["op"] == "edit":
+        record["base"] = data[record["table"]][_table_index(data, record["table"])[record["id"]]]
+    if _transaction is not None:
+        _apply(data, record)
+        _transaction.records.append(record)
+        return True, [message]
+    errors = _save(data, [record], applied=False)
+    if errors:
+        return False, errors
+    return True, [message]
+
+class Transaction:
+    def __init__(self, data: dict):
+        """
+        Initializes the Transaction, which collects the changes made inside a `transaction` block.
+
+        Attributes:
+            data (dict): The document the changes are applied to
+            records (list): The change records applied so far, in order
+            errors (list): Messages of the add, edit and delete calls that failed
+            committed (bool): Whether the changes were persisted when the block ended
+        """
+        self.data : dict = data
+        self.records : list = []
+        self.errors : list = []
+        self.committed : bool = False
+
+@contextmanager
+def transaction():
+    """
+    Group add, edit and delete calls into one transaction.
+
+    Inside the block, `add_entry_json`, `edit_entry_json` and `delete_entry_json` validate and apply their change
+    to one loaded document and return their usual result, but nothing is written. When the block ends, all the
+    changes are persisted with a single write: one snapshot, or one journal line in journal mode, so a crash
+    never keeps only part of them. If any call in the block failed, or the block raised, none of the changes
+    are kept. If another process saved in the meantime, the changes are checked again against its version of
+    the document and the transaction fails if one of them no longer applies. Transactions nested in another one
+    are part of the outer transaction.
+
+    Yields:
+        Transaction: The transaction; after the block, `committed` tells whether the changes were persisted
+        and `errors` lists the messages of the calls that failed.
+    """
+    global _transaction
+    if _transaction is not None:
+        yield _transaction
+        return
+
+    current = _transaction = Transaction(load_json())
+    try:
+        yield current
+    except BaseException:
+        _transaction = None
+        _discard_changes()
+        raise
+    _transaction = None
+
+    if current.errors:
+        _discard_changes()
+    elif current.records:
+        current.errors.extend(_save(current.data, current.records, applied=True))
+        current.committed = not current.errors
+    else:
+        current.committed = True
+
+def _discard_changes():
+    """
+    Drops the cached data so that changes applied to it but never persisted are forgotten; the next
+    load_json reads the files again.
+    """
+    _cache["signature"] = None
+    _cache["data"] = None
+    _cache["indexes"] = {}
+
+def _current_data():
+    """
+    Returns the document to change: the one of the current transaction, or the loaded data.
+    """
+    if _transaction is not None:
+        return _transaction.data
+    return load_json()
+
+def _transactional(function):
+    """
+    Records the messages of a failed add, edit or delete call in the current transaction, so it is not committed.
+    """
+    @wraps(function)
+    def wrapper(table_type, entry):
+        valid, messages = function(table_type, entry)
+        if not valid and _transaction is not None:
+            _transaction.errors.extend(messages)
+        return valid, messages
+    return wrapper
+
+@_transactional
 def add_entry_json(table_type, entry):
     """
     Add a new entry to a specified table in the JSON data.
@@ -42,9 +691,9 @@ def add_entry_json(table_type, entry):
             - bool: True if the entry was successfully added, False otherwise.
             - list: A list of messages indicating success or errors encountered.
     """
-    data = load_json()
+    data = _current_data()
 
-    if table_type not in data:
+    if not isinstance(data.get(table_type), list):
         return False,["Table does not exist"]
     
     valid , errors = entry.validate()
@@ -52,18 +701,12 @@ def add_entry_json(table_type, entry):
     if not valid:
         return valid, errors
     
-    id = str(getattr(entry, "course_id", None) or getattr(entry, "student_id", None) or getattr(entry, "instructor_id", None))
-    
-    for _, item in enumerate(data[table_type]):
-            if item.get('student_id') == id or item.get('course_id') == id or item.get('instructor_id')== id:
-                print(item,id)
-                return False, [f'{table_type} already exists in table']
+    id = str(_entry_id(entry))
 
-    data[table_type].append(entry.__dict__)
-
-    save_data(data)
-    return True, [f"Added {table_type} to table"]
+    record = {"op": "add", "table": table_type, "id": id, "entry": _entry_dict(entry)}
+    return _change(data, record, f"Added {table_type} to table")
 
+@_transactional
 def edit_entry_json(table_type, entry):
     """
     Edit an existing entry in a specified table in the JSON data.
@@ -79,9 +722,9 @@ def edit_entry_json(table_type, entry):
             - bool: True if the entry was successfully edited, False otherwise.
             - list: A list of messages indicating success or errors encountered.
     """
-    data = load_json()
+    data = _current_data()
 
-    if table_type not in data:
+    if not isinstance(data.get(table_type), list):
         return False,["Table does not exist"]
     
     valid , errors = entry.validate()
@@ -89,21 +732,39 @@ def edit_entry_json(table_type, entry):
     if not valid:
         return valid, errors
     
-    id = getattr(entry, "course_id", None) or getattr(entry, "student_id", None) or getattr(entry, "instructor_id", None)
-    
-    not_in_table = True
-    for index, item in enumerate(data[table_type]):
-            if item.get('student_id') == id or item.get('course_id') == id or item.get('instructor_id') == id:
-                data[table_type][index] = entry.__dict__
-                not_in_table = False
-                break
-    
-    if not_in_table:
-        return False, [f'{table_type} not in table']
+    id = _entry_id(entry)
+
+    record = {"op": "edit", "table": table_type, "id": id, "entry": _entry_dict(entry)}
+    return _change(data, record, f"Editted {table_type} in table")
 
-    save_data(data)
-    return True, [f"Editted {table_type} in table"]
+@_transactional
+def edit_row_json(table_type, row):
+    """
+    Replace the stored row of an existing entry in a specified table in the JSON data.
+
+    Unlike `edit_entry_json`, the row is saved as given, without validating the entry: it is meant for changes
+    that only touch the references between entries, such as removing a deleted course from its students.
 
+    Args:
+        table_type (str): The type of table in which the entry should be edited, 'Course', 'Student', or 'Instructor'
+        row (dict): The new stored form of the entry, including its id.
+
+    Returns:
+        tuple: A tuple containing:
+            - bool: True if the entry was successfully edited, False otherwise.
+            - list: A list of messages indicating success or errors encountered.
+    """
+    data = _current_data()
+
+    if not isinstance(data.get(table_type), list):
+        return False,["Table does not exist"]
+
+    id = _row_id(row, id_fields.get(table_type))
+
+    record = {"op": "edit", "table": table_type, "id": id, "entry": row}
+    return _change(data, record, f"Editted {table_type} in table")
+
+@_transactional
 def delete_entry_json(table_type, entry):
     """
     Delete an existing entry from a specified table in the JSON data.
@@ -119,22 +780,12 @@ def delete_entry_json(table_type, entry):
             - bool: True if the entry was successfully deleted, False otherwise.
             - list: A list of messages indicating success or errors encountered.
     """
-    data = load_json()
+    data = _current_data()
 
-    if table_type not in data:
+    if not isinstance(data.get(table_type), list):
         return False,["Table does not exist"]
     
-    id = getattr(entry, "course_id", None) or getattr(entry, "student_id", None) or getattr(entry, "instructor_id", None)
-
-    not_in_table = True
-    for index, item in enumerate(data[table_type]):
-            if item.get('student_id') == id or item.get('course_id') == id or item.get('instructor_id') ==id:
-                data[table_type].pop(index)
-                not_in_table = False
-                break
-
-    if not_in_table:
-        return False, [f'{table_type} not in table']
+    id = _entry_id(entry)
 
-    save_data(data)
-    return True, [f"Deleted {table_type} from table"]
\ No newline at end of file
+    record = {"op": "delete", "table": table_type, "id": id}
+    return _change(data, record, f"Deleted {table_type} from table")
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+This module reads the tables of a JSON data file one row at a time.
+
+`json.load` has to build the whole document before any of it can be used, which for a large data.json takes
+several times the file size in memory and delays the first row until the last one is parsed. The reader here
+memory-maps the file, decodes it a chunk at a time and walks the top-level object and the table arrays with a
+small hand-written tokenizer; each row is parsed on its own (with the C parser of the json module) and handed
+out as soon as it is complete. Only the current chunk and row are held in memory.
+
+Classes:
+    JsonStream: A tokenizer over a memory-mapped JSON file.
+
+Functions:
+    iter_table(path, table_type): Yields the rows of one table of a JSON data file.
+"""
+
+import codecs
+import json
+import mmap
+import os
+
+# Number of bytes decoded at a time
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+
+class JsonStream:
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        """
+        Initializes the JsonStream over the file at `path`. The file must be closed with `close`.
+
+        Attributes:
+            chunk_size (int): Number of bytes decoded when more text is needed
+            text (str): The decoded text that has not been consumed yet, from `pos` on
+            pos (int): Position of the next character to read in `text`
+            offset (int): Number of bytes of the file decoded so far
+            eof (bool): Whether the whole file has been decoded
+        """
+        self.chunk_size : int = chunk_size
+        self.text : str = ""
+        self.pos : int = 0
+        self.offset : int = 0
+        self.eof : bool = False
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files; an empty file is simply an empty stream
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._size = size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fill(self):
+        """
+        Decodes the next chunk of the file, dropping the text that was already consumed.
+
+        Returns:
+            bool: False if the end of the file was already reached.
+        """
+        if self.eof:
+            return False
+        end = min(self.offset + self.chunk_size, self._size)
+        chunk = self._map[self.offset:end] if self._map is not None else b""
+        self.offset = end
+        self.eof = end >= self._size
+        self.text = self.text[self.pos:] + self._decoder.decode(chunk, final=self.eof)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character without consuming it, or "" at the end of the file.
+        """
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, characters: str):
+        """
+        Consumes the next character, which must be one of `characters`.
+
+        Returns:
+            str: The character consumed.
+
+        Raises:
+            json.JSONDecodeError: If the next character is not one of `characters`.
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise self.error(f"Expecting one of {characters!r}")
+        self.pos += 1
+        return character
+
+    def value(self):
+        """
+        Parses and consumes the next JSON value.
+
+        The value is parsed from the decoded text; if it runs up to the end of the text, more of the file is
+        decoded and it is parsed again, so a value cut by a chunk boundary is never returned half read.
+
+        Raises:
+            json.JSONDecodeError: If the next value is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """
+        Yields the elements of the array starting at the current position, consuming it.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def skip(self):
+        """
+        Consumes the next value. Arrays are skipped one element at a time, so skipping a large table never
+        holds it in memory.
+        """
+        if self.peek() == "[":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+    def error(self, message: str):
+        """
+        Returns a JSONDecodeError for the current position of the stream.
+        """
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+def iter_table(path: str, table_type: str):
+    """
+    Yields the rows of one table of a JSON data file, as dicts, while the file is being read.
+
+    Args:
+        path (str): The path of the JSON data file.
+        table_type (str): The name of the table, 'Course', 'Student', or 'Instructor'.
+
+    Yields:
+        dict: The rows of the table, in file order.
+
+    Raises:
+        KeyError: If the file has no such table.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with JsonStream(path) as stream:
+        stream.expect("{")
+        if stream.peek() == "}":
+            raise KeyError(table_type)
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise stream.error("Expecting property name")
+            stream.expect(":")
+            if key == table_type:
+                yield from stream.items()
+                return
+            stream.skip()
+            if stream.expect(",}") == "}":
+                raise KeyError(table_type)
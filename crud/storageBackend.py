@@ -0,0 +1,458 @@
+"""
+This module provides the storage backends the applications read and write their data through.
+
+A backend offers the same operations whatever it stores the data in: streaming the entity sets, adding, editing and
+deleting entities, and the enrollment and instructor assignment changes. Every change returns the usual
+(bool, [messages]) tuple. Deleting an entity also removes the references other entities hold to it, as the database
+does with its enrollment and instructor queries.
+
+Exactly one backend is active. It is chosen at startup with `select_backend` (the applications take a --backend
+option), defaulting to the STORAGE_BACKEND environment variable or "database", and is created the first time
+`get_backend` is called.
+
+Classes:
+    StorageBackend: The interface every backend implements.
+    DatabaseBackend: Stores the data in the SQLite database (crud.databaseCRUD).
+    MemoryDatabaseBackend: Serves the SQLite database from memory, flushing it to the file in the background.
+    JsonBackend: Stores the data in the JSON file (crud.jsonCRUD).
+
+Functions:
+    select_backend(name, **options): Chooses the active backend.
+    select_backend_from_args(argv): Chooses the active backend from the command line options.
+    get_backend(): Returns the active backend.
+"""
+
+import argparse
+import os
+from abc import ABC, abstractmethod
+from itertools import islice
+from classes.Course import Course, Student, Instructor
+from crud import databaseCRUD, jsonCRUD
+
+# Number of rows turned into objects at a time by the iter_* methods of the backends
+build_batch_size = 500
+
+def _build(build, rows):
+    """
+    Yields the objects built from a stream of rows by a batch constructor (e.g. Student.from_db_many), one batch
+    of `build_batch_size` rows at a time, interning the ids across the whole stream.
+    """
+    interned = {}
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, build_batch_size))
+        if not batch:
+            return
+        yield from build(batch, interned)
+
+class StorageBackend(ABC):
+    """
+    The interface of a storage backend. Subclasses implement every abstract method; `close` is optional.
+    """
+
+    name = None
+
+    @abstractmethod
+    def iter_courses(self):
+        """
+        Yields every course as a Course object.
+        """
+
+    @abstractmethod
+    def iter_students(self):
+        """
+        Yields every student as a Student object.
+        """
+
+    @abstractmethod
+    def iter_instructors(self):
+        """
+        Yields every instructor as an Instructor object.
+        """
+
+    @abstractmethod
+    def add_course(self, course: Course):
+        """
+        Adds a new course.
+
+        Returns:
+            tuple: A tuple containing:
+                - bool: True if the course was added, False otherwise.
+                - list: A list of messages indicating success or errors encountered.
+        """
+
+    @abstractmethod
+    def edit_course(self, course: Course):
+        """
+        Saves the name of an existing course.
+        """
+
+    @abstractmethod
+    def delete_course(self, course: Course):
+        """
+        Deletes a course along with the enrollments of its students and its instructor's assignment.
+        """
+
+    @abstractmethod
+    def add_student(self, student: Student):
+        """
+        Adds a new student.
+        """
+
+    @abstractmethod
+    def edit_student(self, student: Student):
+        """
+        Saves the details of an existing student.
+        """
+
+    @abstractmethod
+    def delete_student(self, student: Student):
+        """
+        Deletes a student along with their enrollments.
+        """
+
+    @abstractmethod
+    def add_instructor(self, instructor: Instructor):
+        """
+        Adds a new instructor.
+        """
+
+    @abstractmethod
+    def edit_instructor(self, instructor: Instructor):
+        """
+        Saves the details of an existing instructor.
+        """
+
+    @abstractmethod
+    def delete_instructor(self, instructor: Instructor):
+        """
+        Deletes an instructor and removes them from the courses they were assigned to.
+        """
+
+    @abstractmethod
+    def register_course(self, student: Student, course: Course):
+        """
+        Saves the registration of a student to a course, already made on both objects.
+        """
+
+    @abstractmethod
+    def unregister_course(self, student: Student, course: Course):
+        """
+        Saves the unregistration of a student from a course, already made on both objects.
+        """
+
+    @abstractmethod
+    def register_courses_bulk(self, pairs):
+        """
+        Saves the registrations of many (student, course) pairs, already made on the objects, with a single write.
+        Returns one (bool, [messages]) tuple per pair, in input order.
+        """
+
+    @abstractmethod
+    def unregister_courses_bulk(self, pairs):
+        """
+        Saves the unregistrations of many (student, course) pairs, already made on the objects, with a single write.
+        Returns one (bool, [messages]) tuple per pair, in input order.
+        """
+
+    @abstractmethod
+    def assign_instructor(self, instructor: Instructor, course: Course):
+        """
+        Saves the assignment of an instructor to a course, already made on both objects.
+        """
+
+    @abstractmethod
+    def unassign_instructor(self, instructor: Instructor, course: Course):
+        """
+        Saves the unassignment of an instructor from a course, already made on both objects.
+        """
+
+    def close(self):
+        """
+        Saves any changes the backend still holds back and releases its resources. Does nothing by default.
+        """
+
+class DatabaseBackend(StorageBackend):
+    name = "database"
+
+    def __init__(self, path: str = None):
+        """
+        Initializes the DatabaseBackend, which stores the data in the SQLite database through crud.databaseCRUD.
+
+        Args:
+            path (str): The database file to use instead of databaseCRUD.database_path.
+        """
+        if path is not None:
+            databaseCRUD.database_path = path
+
+    def iter_courses(self):
+        return _build(Course.from_db_many, databaseCRUD.iter_courses())
+
+    def iter_students(self):
+        return _build(Student.from_db_many, databaseCRUD.iter_students())
+
+    def iter_instructors(self):
+        return _build(Instructor.from_db_many, databaseCRUD.iter_instructors())
+
+    def add_course(self, course: Course):
+        return databaseCRUD.add_course(course)
+
+    def edit_course(self, course: Course):
+        return databaseCRUD.edit_course(course)
+
+    def delete_course(self, course: Course):
+        return databaseCRUD.delete_course(course)
+
+    def add_student(self, student: Student):
+        return databaseCRUD.add_student(student)
+
+    def edit_student(self, student: Student):
+        return databaseCRUD.edit_student(student)
+
+    def delete_student(self, student: Student):
+        return databaseCRUD.delete_student(student)
+
+    def add_instructor(self, instructor: Instructor):
+        return databaseCRUD.add_instructor(instructor)
+
+    def edit_instructor(self, instructor: Instructor):
+        return databaseCRUD.edit_instructor(instructor)
+
+    def delete_instructor(self, instructor: Instructor):
+        return databaseCRUD.delete_instructor(instructor)
+
+    def register_course(self, student: Student, course: Course):
+        return databaseCRUD.register_course(student, course)
+
+    def unregister_course(self, student: Student, course: Course):
+        return databaseCRUD.unregister_course(student, course)
+
+    def register_courses_bulk(self, pairs):
+        return databaseCRUD.register_courses_bulk(pairs)
+
+    def unregister_courses_bulk(self, pairs):
+        return databaseCRUD.unregister_courses_bulk(pairs)
+
+    def assign_instructor(self, instructor: Instructor, course: Course):
+        return databaseCRUD.assign_instructor(instructor, course)
+
+    def unassign_instructor(self, instructor: Instructor, course: Course):
+        return databaseCRUD.unassign_instructor(instructor, course)
+
+class MemoryDatabaseBackend(DatabaseBackend):
+    name = "memory"
+
+    def __init__(self, path: str = None, flush_interval: float = None):
+        """
+        Initializes the MemoryDatabaseBackend, which loads the SQLite database into memory and serves every
+        operation from there (databaseCRUD.memory_mode). Changes reach the file when databaseCRUD flushes it:
+        every flush interval, on close and at exit.
+
+        Args:
+            path (str): The database file to use instead of databaseCRUD.database_path.
+            flush_interval (float): Seconds between flushes to use instead of databaseCRUD.flush_interval.
+        """
+        super().__init__(path)
+        if flush_interval is not None:
+            databaseCRUD.flush_interval = flush_interval
+        databaseCRUD.memory_mode = True
+
+    def close(self):
+        return databaseCRUD.close_memory_db()
+
+class JsonBackend(StorageBackend):
+    name = "json"
+
+    def __init__(self, path: str = None):
+        """
+        Initializes the JsonBackend, which stores the data in the JSON file through crud.jsonCRUD.
+
+        Changes touching several entities (enrollments, assignments and deletes) are made in one jsonCRUD
+        transaction, so they are saved with a single write and either all land or none do.
+
+        Args:
+            path (str): The JSON file to use instead of jsonCRUD.file_path; its journal, lock and previous
+                generations are kept next to it.
+        """
+        if path is not None:
+            jsonCRUD.file_path = path
+            jsonCRUD.journal_path = path + ".log"
+            jsonCRUD.lock_path = path + ".lock"
+
+    def iter_courses(self):
+        return _build(Course.from_json_many, jsonCRUD.iter_json("Course"))
+
+    def iter_students(self):
+        return _build(Student.from_json_many, jsonCRUD.iter_json("Student"))
+
+    def iter_instructors(self):
+        return _build(Instructor.from_json_many, jsonCRUD.iter_json("Instructor"))
+
+    def add_course(self, course: Course):
+        return jsonCRUD.add_entry_json('Course', course)
+
+    def edit_course(self, course: Course):
+        return jsonCRUD.edit_entry_json('Course', course)
+
+    def delete_course(self, course: Course):
+        with jsonCRUD.transaction() as transaction:
+            stored = jsonCRUD.get_entry_json('Course', course.course_id) or {}
+            for student_id in stored.get("enrolled_students", []):
+                self._unlink('Student', student_id, "registered_courses", course.course_id)
+            self._unlink('Instructor', stored.get("instructor_id"), "assigned_courses", course.course_id)
+            valid, errors = jsonCRUD.delete_entry_json('Course', course)
+        return self._result(transaction, valid, errors)
+
+    def add_student(self, student: Student):
+        return jsonCRUD.add_entry_json('Student', student)
+
+    def edit_student(self, student: Student):
+        return jsonCRUD.edit_entry_json('Student', student)
+
+    def delete_student(self, student: Student):
+        with jsonCRUD.transaction() as transaction:
+            stored = jsonCRUD.get_entry_json('Student', student.student_id) or {}
+            for course_id in stored.get("registered_courses", []):
+                self._unlink('Course', course_id, "enrolled_students", student.student_id)
+            valid, errors = jsonCRUD.delete_entry_json('Student', student)
+        return self._result(transaction, valid, errors)
+
+    def add_instructor(self, instructor: Instructor):
+        return jsonCRUD.add_entry_json('Instructor', instructor)
+
+    def edit_instructor(self, instructor: Instructor):
+        return jsonCRUD.edit_entry_json('Instructor', instructor)
+
+    def delete_instructor(self, instructor: Instructor):
+        with jsonCRUD.transaction() as transaction:
+            stored = jsonCRUD.get_entry_json('Instructor', instructor.instructor_id) or {}
+            for course_id in stored.get("assigned_courses", []):
+                self._unlink('Course', course_id, "instructor_id", instructor.instructor_id)
+            valid, errors = jsonCRUD.delete_entry_json('Instructor', instructor)
+        return self._result(transaction, valid, errors)
+
+    def register_course(self, student: Student, course: Course):
+        return self._edit_pair('Student', student, course)
+
+    def unregister_course(self, student: Student, course: Course):
+        return self._edit_pair('Student', student, course)
+
+    def register_courses_bulk(self, pairs):
+        return self._edit_pairs('Student', pairs)
+
+    def unregister_courses_bulk(self, pairs):
+        return self._edit_pairs('Student', pairs)
+
+    def assign_instructor(self, instructor: Instructor, course: Course):
+        return self._edit_pair('Instructor', instructor, course)
+
+    def unassign_instructor(self, instructor: Instructor, course: Course):
+        return self._edit_pair('Instructor', instructor, course)
+
+    def _edit_pair(self, table_type, entry, course: Course):
+        """
+        Saves an entity and a course that were changed together, in one transaction.
+        """
+        with jsonCRUD.transaction() as transaction:
+            jsonCRUD.edit_entry_json('Course', course)
+            valid, errors = jsonCRUD.edit_entry_json(table_type, entry)
+        return self._result(transaction, valid, errors)
+
+    def _edit_pairs(self, table_type, pairs):
+        """
+        Saves many entities and courses that were changed together, in one transaction, returning the result
+        of each pair; if the transaction is not saved, every pair fails with its errors.
+        """
+        pairs = list(pairs)
+        results = []
+        with jsonCRUD.transaction() as transaction:
+            for entry, course in pairs:
+                jsonCRUD.edit_entry_json('Course', course)
+                results.append(jsonCRUD.edit_entry_json(table_type, entry))
+        if not transaction.committed:
+            return [(False, transaction.errors) for _ in pairs]
+        return results
+
+    def _unlink(self, table_type, id, field, linked_id):
+        """
+        Removes the reference to `linked_id` from a field of a stored row: the id from a list of ids, or the
+        id itself, which is cleared. The row is saved as it is stored, without validating the entity, since
+        only its references change.
+        """
+        row = jsonCRUD.get_entry_json(table_type, id)
+        if row is None:
+            return
+        value = row.get(field)
+        if isinstance(value, list):
+            if linked_id not in value:
+                return
+            value = [item for item in value if item != linked_id]
+        elif value == linked_id:
+            value = ""
+        else:
+            return
+        jsonCRUD.edit_row_json(table_type, dict(row, **{field: value}))
+
+    def _result(self, transaction, valid, errors):
+        """
+        Returns the result of the last change of a transaction, or the errors that kept it from being saved.
+        """
+        if not transaction.committed:
+            return False, transaction.errors
+        return valid, errors
+
+# Backends that can be selected by name
+backends = {backend.name: backend for backend in (DatabaseBackend, MemoryDatabaseBackend, JsonBackend)}
+
+# Name and options of the backend created by get_backend
+_selected = {"name": os.environ.get("STORAGE_BACKEND", "database"), "options": {}}
+_backend = None
+
+def select_backend(name: str, **options):
+    """
+    Chooses the active backend. Must be called at startup, before any data is read.
+
+    Args:
+        name (str): The name of the backend, a key of `backends`.
+        **options: Keyword arguments passed to the backend, e.g. path.
+
+    Raises:
+        ValueError: If there is no backend with that name.
+    """
+    global _backend
+    if name not in backends:
+        raise ValueError(f"Unknown storage backend {name!r}, expected one of {', '.join(backends)}")
+    _selected["name"] = name
+    _selected["options"] = options
+    _backend = None
+
+def select_backend_from_args(argv):
+    """
+    Chooses the active backend from the --backend and --data command line options, if given.
+
+    Args:
+        argv (list): The command line, starting with the program name.
+
+    Returns:
+        list: The command line without the backend options, for the GUI toolkit.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--backend", choices=list(backends), help="Storage backend to read and write the data with")
+    parser.add_argument("--data", help="File the backend stores the data in")
+    args, remaining = parser.parse_known_args(argv[1:])
+    if args.backend is not None or args.data is not None:
+        options = {"path": args.data} if args.data is not None else {}
+        select_backend(args.backend or _selected["name"], **options)
+    return argv[:1] + remaining
+
+def get_backend():
+    """
+    Returns the active backend, creating it on first use.
+
+    Returns:
+        StorageBackend: The active backend.
+    """
+    global _backend
+    if _backend is None:
+        _backend = backends[_selected["name"]](**_selected["options"])
+    return _backend
@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QComboBox, QPushButton, QMessageBox
 from PyQt5.QtCore import Qt
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, instructors
+from pyqtTabs.Worker import TaskRunner
 
 class AssignInstructorTab(QWidget):
     def __init__(self):
@@ -15,15 +15,20 @@ class AssignInstructorTab(QWidget):
             instructor_dropdown (QComboBox): Dropdown of the list of instructors from shared.py
             course_var (str): Selected course_id
             instructor_var (str): Selected instructor_id
+            refresh_runner (TaskRunner): Loads the courses and instructors off the GUI thread
         """
         super().__init__()
         self.course_dropdown : QComboBox = None
         self.instructor_dropdown : QComboBox = None
         self.course_var : str = None
         self.instructor_var : str = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AssignInstructorTab. Sets up the layout and adds all the components
@@ -43,7 +48,6 @@ class AssignInstructorTab(QWidget):
 
         # Select Course Dropdown
         self.course_dropdown = QComboBox()
-        self.course_dropdown.addItems([course.course_name for course in courses])
         self.course_dropdown.currentIndexChanged.connect(self.on_course_select)
         layout.addWidget(self.course_dropdown ,1, 1 )
 
@@ -53,7 +57,6 @@ class AssignInstructorTab(QWidget):
 
         # Select Instructor Dropdown
         self.instructor_dropdown = QComboBox()
-        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
         self.instructor_dropdown.currentIndexChanged.connect(self.on_instructor_select)
         layout.addWidget(self.instructor_dropdown,2, 1 )
 
@@ -84,8 +87,8 @@ class AssignInstructorTab(QWidget):
         course_id = self.course_var
         instructor_id = self.instructor_var
 
-        course = next(course for course in courses if course.course_id == course_id)
-        instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+        course = courses.get(course_id)
+        instructor = instructors.get(instructor_id)
 
         valid1, errors1 = instructor.assign_course(course)
         valid2, errors2 = course.assign_instructor(instructor)
@@ -100,27 +103,13 @@ class AssignInstructorTab(QWidget):
             QMessageBox.warning(self, "Input Error", "\n".join(errors2))
             return
         
-        valid, errors = assign_instructor(instructor,course)
+        valid, errors = get_backend().assign_instructor(instructor,course)
 
         if valid:
             QMessageBox.information(self, "Success", f"{instructor.name} assigned to {course.course_name}!")
         else:
             QMessageBox.warning(self, "Input Error", "\n".join(errors))
 
-        # Commented code that works for JSON files
-
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Instructor', instructor)
-
-        # if valid1 and valid2:
-        #     QMessageBox.information(self, "Success", f"{instructor.name} assigned to {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        # elif not valid1:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1))
-        # elif not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors2))
-
     def unassign_instructor(self):
         """
         Unassigns an instructor to a course and updates the local copy
@@ -131,8 +120,8 @@ class AssignInstructorTab(QWidget):
         course_id = self.course_var
         instructor_id = self.instructor_var
 
-        course = next(course for course in courses if course.course_id == course_id)
-        instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+        course = courses.get(course_id)
+        instructor = instructors.get(instructor_id)
 
         valid1, errors1 = instructor.unassign_course(course)
         valid2, errors2 = course.unassign_instructor(instructor)
@@ -147,27 +136,13 @@ class AssignInstructorTab(QWidget):
             QMessageBox.warning(self, "Input Error", "\n".join(errors2))
             return
         
-        valid, errors = unassign_instructor(instructor,course)
+        valid, errors = get_backend().unassign_instructor(instructor,course)
 
         if valid:
             QMessageBox.information(self, "Success", f"{instructor.name} assigned to {course.course_name}!")
         else:
             QMessageBox.warning(self, "Input Error", "\n".join(errors))
 
-        # Commented code that works for JSON files
-
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Instructor', instructor)
-
-        # if valid1 and valid2:
-        #     QMessageBox.information(self, "Success", f"{instructor.name} unassigned from {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        # elif not valid1:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1))
-        # elif not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors2))
-
     def on_course_select(self):
         """
         Updates the course_var attribute with the selected course_id
@@ -193,4 +168,11 @@ class AssignInstructorTab(QWidget):
         self.course_dropdown.clear()
         self.course_dropdown.addItems([course.course_name for course in courses])
         self.instructor_dropdown.clear()
-        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
\ No newline at end of file
+        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
+
+    def load_data(self):
+        """
+        Loads the courses and instructors on a worker thread, then fills the dropdowns with them.
+        """
+        self.refresh_runner.submit(lambda: (courses.load(), instructors.load()), lambda _: self.update_ui(),
+                                   on_error=lambda e: QMessageBox.warning(self, "Refresh Error", str(e)))
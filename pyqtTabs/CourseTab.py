@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QGridLayout
 from PyQt5.QtCore import Qt
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, students, instructors
+from pyqtTabs.Worker import TaskRunner
 
 class AddCourseTab(QWidget):
     def __init__(self):
@@ -16,6 +16,7 @@ class AddCourseTab(QWidget):
             name_input (QLineEdit): Course Name Input
             course_id_input (QLineEdit): Course ID Input
             edit_name_input (QLineEdit): Edit Course Name input
+            refresh_runner (TaskRunner): Loads the courses off the GUI thread
         """
         super().__init__()
         self.course_dropdown : QComboBox = None
@@ -23,9 +24,13 @@ class AddCourseTab(QWidget):
         self.name_input : QLineEdit = None
         self.course_id_input : QLineEdit = None
         self.edit_name_input : QLineEdit = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddCourseTab. Sets up the layout and adds all the components
@@ -71,7 +76,6 @@ class AddCourseTab(QWidget):
 
         # Course Dropdown
         self.course_dropdown = QComboBox()
-        self.course_dropdown.addItems([course.course_name for course in courses])
         self.course_dropdown.currentIndexChanged.connect(self.on_select)
         layout.addWidget(self.course_dropdown ,5, 1)
 
@@ -108,9 +112,7 @@ class AddCourseTab(QWidget):
 
             course = Course(course_id, name, "", [])
 
-            valid, errors = add_course(course)
-            # Commented Code for JSON 
-            # valid, errors = add_entry_json('Course', course)
+            valid, errors = get_backend().add_course(course)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Course {course.course_name} created successfully!")
@@ -132,28 +134,19 @@ class AddCourseTab(QWidget):
         """
         try:
             course_id = self.course_var
-            course = next(course for course in courses if course.course_id == course_id)
+            course = courses.get(course_id)
 
             for student_id in course.enrolled_students:
-                student = next(student for student in students if student.student_id == student_id)
+                student = students.get(student_id)
                 student.unregister_course(course)
-                students.remove(student)
-                students.append(student)
-                # Commented Code for JSON
-                # edit_entry_json('Student', student)
-
+                students.replace(student)
 
             if course.instructor_id:
-                instructor = next(inst for inst in instructors if inst.instructor_id == course.instructor_id)
+                instructor = instructors.get(course.instructor_id)
                 instructor.unassign_course(course)
-                instructors.remove(instructor)
-                instructors.append(instructor)
-                # Commented Code for JSON
-                # edit_entry_json('Instructor', instructor)
+                instructors.replace(instructor)
 
-            # Commented Code for JSON
-            # valid, errors = delete_entry_json('Course', course)
-            valid, errors = delete_course(course)
+            valid, errors = get_backend().delete_course(course)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Course {course.course_name} has been removed successfully!")
@@ -176,18 +169,15 @@ class AddCourseTab(QWidget):
             course_id = self.course_var
             new_name = self.edit_name_input.text()
 
-            course = next(course for course in courses if course.course_id == course_id)
+            course = courses.get(course_id)
             course.course_name = new_name
 
-            # Commented Code for JSON 
-            #valid, errors = edit_entry_json('Course', course)
-            valid, errors = edit_course(course)
+            valid, errors = get_backend().edit_course(course)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Course {course.course_name} has been edited successfully!")
                 self.edit_name_input.clear()
-                courses.remove(course)
-                courses.append(course)
+                courses.replace(course)
                 self.update_ui()
             else:
                 QMessageBox.warning(self, "Input Error", "\n".join(errors))
@@ -210,3 +200,10 @@ class AddCourseTab(QWidget):
         """
         self.course_dropdown.clear()
         self.course_dropdown.addItems([course.course_name for course in courses])
+
+    def load_data(self):
+        """
+        Loads the courses on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(courses.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: QMessageBox.warning(self, "Refresh Error", str(e)))
@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox
 from classes.Course import *
 from PyQt5.QtCore import Qt
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import instructors, courses
+from pyqtTabs.Worker import TaskRunner
 
 class AddInstructorTab(QWidget):
     def __init__(self):
@@ -20,6 +20,7 @@ class AddInstructorTab(QWidget):
             edit_name_input (QLineEdit): Edit name input
             edit_age_input (QLineEdit): Edit age input 
             edit_email_input (QLineEdit): Edit email input
+            refresh_runner (TaskRunner): Loads the instructors off the GUI thread
         """
         super().__init__()
         self.instructor_dropdown : QComboBox = None
@@ -31,9 +32,13 @@ class AddInstructorTab(QWidget):
         self.edit_name_input : QLineEdit = None
         self.edit_age_input : QLineEdit = None
         self.edit_email_input : QLineEdit = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddInstructorTab. Sets up the layout and adds all the components
@@ -95,7 +100,6 @@ class AddInstructorTab(QWidget):
 
         # Instructor Dropdown
         self.instructor_dropdown = QComboBox()
-        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
         self.instructor_dropdown.currentIndexChanged.connect(self.on_select)
         layout.addWidget(self.instructor_dropdown, 7,1)
 
@@ -150,9 +154,7 @@ class AddInstructorTab(QWidget):
 
             instructor = Instructor(name, age, email, instructor_id, [])
             
-            valid, errors = add_instructor(instructor)
-            # Commented code for JSON
-            # valid, errors = add_entry_json('Instructor', instructor)
+            valid, errors = get_backend().add_instructor(instructor)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Instructor {instructor.name} created successfully!")
@@ -176,19 +178,14 @@ class AddInstructorTab(QWidget):
         """
         try:
             instructor_id = self.instructor_var
-            instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+            instructor = instructors.get(instructor_id)
             
             for course_id in instructor.assigned_courses:
-                course = next(course for course in courses if course.course_id == course_id)
+                course = courses.get(course_id)
                 course.unassign_instructor(instructor)
-                courses.remove(course)
-                courses.append(course)
-                # Commented code for JSON
-                # edit_entry_json('Course', course)
+                courses.replace(course)
             
-            valid, errors = delete_instructor(instructor)
-            # Commented code for JSON
-            # valid, errors = delete_entry_json('Instructor', instructor)
+            valid, errors = get_backend().delete_instructor(instructor)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Instructor {instructor.name} has been removed successfully!")
@@ -215,23 +212,20 @@ class AddInstructorTab(QWidget):
             new_email = self.edit_email_input.text()
 
             instructor_id = self.instructor_var
-            instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+            instructor = instructors.get(instructor_id)
             
             instructor.name = new_name
             instructor.age = new_age
             instructor._email = new_email
 
-            valid, errors = edit_instructor(instructor)
-            # Commented code for JSON
-            # valid, errors = edit_entry_json('Instructor', instructor)
+            valid, errors = get_backend().edit_instructor(instructor)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Instructor {instructor.name} edited successfully!")
                 self.edit_name_input.clear()
                 self.edit_age_input.clear()
                 self.edit_email_input.clear()
-                instructors.remove(instructor)
-                instructors.append(instructor)
+                instructors.replace(instructor)
                 self.update_ui()
             else:
                 QMessageBox.warning(self, "Input Error", "\n".join(errors))
@@ -255,4 +249,11 @@ class AddInstructorTab(QWidget):
         Updated the UI for the instructor dropdown to relfect new data
         """
         self.instructor_dropdown.clear()
-        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
\ No newline at end of file
+        self.instructor_dropdown.addItems([instructor.name for instructor in instructors])
+
+    def load_data(self):
+        """
+        Loads the instructors on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(instructors.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: QMessageBox.warning(self, "Refresh Error", str(e)))
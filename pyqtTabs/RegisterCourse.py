@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QComboBox, QPushButton, QMessageBox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from PyQt5.QtCore import Qt
 from shared import courses, students
+from pyqtTabs.Worker import TaskRunner
 
 class RegisterCourseTab(QWidget):
     def __init__(self):
@@ -15,15 +15,20 @@ class RegisterCourseTab(QWidget):
             student_dropdown (QComboBox): Dropdown of the list of students from shared.py
             course_var (str): Selected course_id
             student_var (str): Selected student_id
+            refresh_runner (TaskRunner): Loads the dropdown data off the GUI thread
         """
         super().__init__()
         self.course_dropdown : QComboBox = None
         self.student_dropdown : QComboBox = None
         self.course_var : str = None
         self.student_var : str = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.update_ui()
+
     def init_ui(self):
         """
         Initializes the UI of the RegisterCourseTab. Sets up the layout and adds all the components
@@ -43,7 +48,6 @@ class RegisterCourseTab(QWidget):
 
         # Select Course Dropdown
         self.course_dropdown = QComboBox()
-        self.course_dropdown.addItems([course.course_name for course in courses])
         self.course_dropdown.currentIndexChanged.connect(self.on_course_select)
         layout.addWidget(self.course_dropdown,1,1)
 
@@ -53,7 +57,6 @@ class RegisterCourseTab(QWidget):
 
         # Select Student Dropdown
         self.student_dropdown = QComboBox()
-        self.student_dropdown.addItems([student.name for student in students])
         self.student_dropdown.currentIndexChanged.connect(self.on_student_select)
         layout.addWidget(self.student_dropdown,2,1)
 
@@ -84,8 +87,8 @@ class RegisterCourseTab(QWidget):
         course_id = self.course_var
         student_id = self.student_var
 
-        course = next(course for course in courses if course.course_id == course_id)
-        student = next(student for student in students if student.student_id == student_id)
+        course = courses.get(course_id)
+        student = students.get(student_id)
 
         valid1, errors1 = student.register_course(course)
         valid2, errors2 = course.enroll_student(student)
@@ -100,28 +103,12 @@ class RegisterCourseTab(QWidget):
             QMessageBox.warning(self, "Input Error", "\n".join(errors2))
             return
         
-        valid, errors = register_course(student,course)
+        valid, errors = get_backend().register_course(student,course)
 
         if valid:
             QMessageBox.information(self, "Success", f"{student.name} assigned to {course.course_name}!")
         else:
             QMessageBox.warning(self, "Input Error", "\n".join(errors))
-        
-        # Commented code for JSON
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Student', student)
-
-        # if valid1 and valid2:
-        #     QMessageBox.information(self, "Success", f"{student.name} assigned to {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        #     return
-        # elif not valid1:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1))
-        #     return
-        # elif not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors2))
-        #     return
 
     def unassign_student(self):
         """
@@ -133,8 +120,8 @@ class RegisterCourseTab(QWidget):
         course_id = self.course_var
         student_id = self.student_var
 
-        course = next(course for course in courses if course.course_id == course_id)
-        student = next(student for student in students if student.student_id == student_id)
+        course = courses.get(course_id)
+        student = students.get(student_id)
 
         valid1, errors1 = student.unregister_course(course)
         valid2, errors2 = course.unenroll_student(student)
@@ -149,28 +136,12 @@ class RegisterCourseTab(QWidget):
             QMessageBox.warning(self, "Input Error", "\n".join(errors2))
             return
         
-        valid, errors = unregister_course(student,course)
+        valid, errors = get_backend().unregister_course(student,course)
 
         if valid:
             QMessageBox.information(self, "Success", f"{student.name} unassigned to {course.course_name}!")
         else:
             QMessageBox.warning(self, "Input Error", "\n".join(errors))
-        
-        # Commented code for JSON
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Student', student)
-
-        # if valid1 and valid2:
-        #     QMessageBox.information(self, "Success", f"{student.name} unassigned from {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        #     return
-        # elif not valid1:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors1))
-        #     return
-        # elif not valid2:
-        #     QMessageBox.warning(self, "Input Error", "\n".join(errors2))
-        #     return
 
     def on_course_select(self):
         """
@@ -193,8 +164,31 @@ class RegisterCourseTab(QWidget):
     def update_ui(self):
         """
          Updates the UI for the course and student dropdown to reflect the new data
+
+         The data is loaded on a worker thread and the dropdowns are filled once it is ready.
+        """
+        self.refresh_runner.submit(self.load_dropdown_data, self.show_dropdown_data,
+                                   on_error=lambda e: QMessageBox.warning(self, "Refresh Error", str(e)))
+
+    def load_dropdown_data(self):
+        """
+        Loads the course and student names for the dropdowns. Runs on a worker thread, iterating the
+        registries' `as_list` copies, which the GUI thread replaces rather than changes.
+
+        Returns:
+            tuple: The list of course names and the list of student names.
+        """
+        return [course.course_name for course in courses], [student.name for student in students]
+
+    def show_dropdown_data(self, dropdown_data):
+        """
+        Fills the course and student dropdowns with the names returned by load_dropdown_data.
+
+        Args:
+            dropdown_data (tuple): The result of load_dropdown_data.
         """
+        course_names, student_names = dropdown_data
         self.course_dropdown.clear()
-        self.course_dropdown.addItems([course.course_name for course in courses])
+        self.course_dropdown.addItems(course_names)
         self.student_dropdown.clear()
-        self.student_dropdown.addItems([student.name for student in students])
\ No newline at end of file
+        self.student_dropdown.addItems(student_names)
\ No newline at end of file
@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from PyQt5.QtCore import Qt
 from shared import courses, students
+from pyqtTabs.Worker import TaskRunner
 
 class AddStudentTab(QWidget):
     def __init__(self):
@@ -20,6 +20,7 @@ class AddStudentTab(QWidget):
             edit_name_input (QLineEdit): Edit name input
             edit_age_input (QLineEdit): Edit age input 
             edit_email_input (QLineEdit): Edit email input
+            refresh_runner (TaskRunner): Loads the students off the GUI thread
         """
         super().__init__()
         self.student_dropdown = None
@@ -31,9 +32,13 @@ class AddStudentTab(QWidget):
         self.edit_name_input : QLineEdit = None
         self.edit_age_input : QLineEdit = None
         self.edit_email_input : QLineEdit = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddStudentTab. Sets up the layout and adds all the components
@@ -95,7 +100,6 @@ class AddStudentTab(QWidget):
 
         # Student Dropdown
         self.student_dropdown = QComboBox()
-        self.student_dropdown.addItems([student.name for student in students])
         self.student_dropdown.currentIndexChanged.connect(self.on_select)
         layout.addWidget(self.student_dropdown,7,1)
 
@@ -150,9 +154,7 @@ class AddStudentTab(QWidget):
 
             student = Student(name, age, email, student_id, [])
 
-            valid, errors = add_student(student)
-            # Commented code for JSON
-            # valid, errors = add_entry_json('Student', student)
+            valid, errors = get_backend().add_student(student)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Student {name} created successfully!")
@@ -177,19 +179,14 @@ class AddStudentTab(QWidget):
         """
         try:
             student_id = self.student_var
-            student = next(stud for stud in students if stud.student_id == student_id)
+            student = students.get(student_id)
             
             for course_id in student.registered_courses:
-                course = next(course for course in courses if course.course_id == course_id)
+                course = courses.get(course_id)
                 course.unenroll_student(student)
-                courses.remove(course)
-                courses.append(course)
-                # Commented code for JSON
-                #edit_entry_json('Course', course)
+                courses.replace(course)
             
-            valid, errors = delete_student(student)
-            # Commented code for JSON
-            # valid, errors = delete_entry_json('Student', student)
+            valid, errors = get_backend().delete_student(student)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Student {student.name} has been removed successfully!")
@@ -217,23 +214,20 @@ class AddStudentTab(QWidget):
             new_email = self.edit_email_input.text()
 
             student_id = self.student_var
-            student = next(stud for stud in students if stud.student_id == student_id)
+            student = students.get(student_id)
             
             student.name = new_name
             student.age = new_age
             student._email = new_email
 
-            valid, errors = edit_student(student)
-            # Commented code for JSON
-            # valid, errors = edit_entry_json('Student', student)
+            valid, errors = get_backend().edit_student(student)
 
             if valid:
                 QMessageBox.information(self, "Success", f"Student {student.name} edited successfully!")
                 self.edit_name_input.clear()
                 self.edit_age_input.clear()
                 self.edit_email_input.clear()
-                students.remove(student)
-                students.append(student)
+                students.replace(student)
                 self.update_ui()
             else:
                 QMessageBox.warning(self, "Input Error", "\n".join(errors))
@@ -258,4 +252,11 @@ class AddStudentTab(QWidget):
         Updated the UI for the instructor dropdown to relfect new data
         """
         self.student_dropdown.clear()
-        self.student_dropdown.addItems([student.name for student in students])
\ No newline at end of file
+        self.student_dropdown.addItems([student.name for student in students])
+
+    def load_data(self):
+        """
+        Loads the students on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(students.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: QMessageBox.warning(self, "Refresh Error", str(e)))
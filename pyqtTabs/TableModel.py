@@ -0,0 +1,101 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+class RowTableModel(QAbstractTableModel):
+    def __init__(self, batch_size: int = 1000):
+        """
+        Initializes the RowTableModel, a read-only table model that serves cells on demand from a list of row tuples.
+
+        No item objects are created per cell: the view asks for the cells it paints, and rows are exposed to it
+        in batches through canFetchMore/fetchMore as the user scrolls.
+
+        Attributes:
+            headers (list): Column headers of the table
+            rows (list): Row tuples backing the table
+            batch_size (int): Number of rows exposed to the view per fetchMore call
+            loaded_count (int): Number of rows currently exposed to the view
+        """
+        super().__init__()
+        self.headers : list = []
+        self.rows : list = []
+        self.batch_size : int = batch_size
+        self.loaded_count : int = 0
+
+    def set_headers(self, headers):
+        """
+        Replaces the column headers and clears the rows.
+
+        Args:
+            headers (list): List of headers to display.
+        """
+        self.beginResetModel()
+        self.headers = list(headers)
+        self.rows = []
+        self.loaded_count = 0
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """
+        Replaces the rows backing the table. Only the first batch is exposed to the view until it asks for more.
+
+        Args:
+            rows (list): List of row tuples to display.
+        """
+        self.beginResetModel()
+        self.rows = rows
+        self.loaded_count = min(len(rows), self.batch_size)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of rows currently exposed to the view.
+        """
+        if parent.isValid():
+            return 0
+        return self.loaded_count
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Returns the number of columns.
+        """
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the text of a single cell, converting it only when the view asks for it.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self.rows[index.row()][index.column()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Returns the column headers; rows are left unlabelled.
+        """
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        if section < len(self.headers):
+            return self.headers[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """
+        Returns whether there are rows that have not been exposed to the view yet.
+        """
+        if parent.isValid():
+            return False
+        return self.loaded_count < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Exposes the next batch of rows to the view.
+        """
+        if parent.isValid():
+            return
+        count = min(self.batch_size, len(self.rows) - self.loaded_count)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded_count, self.loaded_count + count - 1)
+        self.loaded_count += count
+        self.endInsertRows()
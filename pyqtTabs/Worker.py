@@ -0,0 +1,106 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+class TaskRunner(QObject):
+    finished = pyqtSignal(int, object, object)
+
+    def __init__(self, parent: QObject = None):
+        """
+        Initializes the TaskRunner, which runs work off the GUI thread and posts the result back to it.
+
+        Every submit supersedes the previous one: a task that has not started yet is skipped, and the
+        result of one that is already running is dropped, so only the latest result reaches its callback.
+        Tasks run one at a time on the runner's own thread pool.
+
+        Attributes:
+            pool (QThreadPool): Thread pool the tasks run on
+            timer (QTimer): Single shot timer used to debounce submits
+            generation (int): Number of the latest submitted task
+            pending (tuple): The (function, callback, on_error) waiting for the timer
+            callbacks (dict): The (callback, on_error) of each started task, keyed by generation
+        """
+        super().__init__(parent)
+        self.pool : QThreadPool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer : QTimer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.start_pending)
+        self.generation : int = 0
+        self.pending : tuple = None
+        self.callbacks : dict = {}
+
+        self.finished.connect(self.on_finished)
+
+    def submit(self, function, callback, delay: int = 0, on_error=None):
+        """
+        Schedules `function` to run on a worker thread and `callback` to receive its result on the GUI thread.
+
+        Args:
+            function (callable): The work to run, taking no arguments.
+            callback (callable): Called on the GUI thread with the result of `function`.
+            delay (int): Milliseconds to wait for another submit before starting, used to debounce keystrokes.
+            on_error (callable): Called on the GUI thread with the exception if `function` raises.
+        """
+        self.generation += 1
+        self.pending = (function, callback, on_error)
+        self.timer.start(delay)
+
+    def cancel(self):
+        """
+        Supersedes every submitted task without starting a new one.
+        """
+        self.generation += 1
+        self.pending = None
+        self.timer.stop()
+
+    def start_pending(self):
+        """
+        Starts the task waiting for the debounce timer.
+        """
+        if self.pending is None:
+            return
+        function, callback, on_error = self.pending
+        self.pending = None
+        self.callbacks = {self.generation: (callback, on_error)}
+        self.pool.start(Task(self, self.generation, function))
+
+    def on_finished(self, generation: int, result, error):
+        """
+        Delivers the result of a task to its callback, unless a newer task was submitted since.
+        """
+        if generation != self.generation or generation not in self.callbacks:
+            return
+        callback, on_error = self.callbacks.pop(generation)
+        if error is None:
+            callback(result)
+        elif on_error is not None:
+            on_error(error)
+        else:
+            raise error
+
+class Task(QRunnable):
+    def __init__(self, runner: TaskRunner, generation: int, function):
+        """
+        Initializes the Task, a single unit of work started by a TaskRunner.
+
+        Attributes:
+            runner (TaskRunner): The runner the result is posted back to
+            generation (int): Number of the submit that created the task
+            function (callable): The work to run
+        """
+        super().__init__()
+        self.runner : TaskRunner = runner
+        self.generation : int = generation
+        self.function = function
+
+    def run(self):
+        """
+        Runs the work on the worker thread, skipping it if a newer task was submitted before it started.
+        """
+        if self.generation != self.runner.generation:
+            return
+        try:
+            result = self.function()
+        except Exception as e:
+            self.runner.finished.emit(self.generation, None, e)
+        else:
+            self.runner.finished.emit(self.generation, result, None)
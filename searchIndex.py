@@ -0,0 +1,123 @@
+"""
+This module provides the search index used by the View All tabs of both applications.
+
+A row matches a query when the query is a substring of the lowercased `str(row)`, which is what the tabs
+have always searched. The lowercased strings are computed once per row and joined into a single text, so a
+new query is answered by `str.find` over that text instead of a Python-level scan of every row. When the
+query grows (the user typed another character), only the rows that matched the previous query are checked,
+and the results of recent queries are kept so that deleting a character is answered without searching.
+
+The tabs build new indexes from the reformatted rows each time the data is refreshed. When a single row is
+edited, `update_row` replaces it in place and forgets the joined text and the results of previous queries, which
+may no longer hold.
+
+Classes:
+    SearchIndex: A substring index over a list of table rows.
+"""
+
+from bisect import bisect_right
+
+# Separates rows in the joined text, so a match never spans two rows
+SEPARATOR = "\x00"
+
+# Number of recent query results kept by each index
+RECENT_QUERIES = 32
+
+class SearchIndex:
+    def __init__(self, rows: list):
+        """
+        Initializes the SearchIndex over the given rows.
+
+        Attributes:
+            rows (list): Rows of the table, in display order
+            texts (list): Lowercased string of each row
+            last_query (str): The previous query that was searched
+            last_matches (list): Positions of the rows that matched the previous query
+            recent (dict): Positions of the matching rows of recent queries, keyed by query
+        """
+        self.rows : list = rows
+        self.texts : list = [str(row).lower() for row in rows]
+        self.last_query : str = None
+        self.last_matches : list = None
+        self.recent : dict = {}
+        self._text : str = None
+        self._starts : list = None
+
+    def search(self, query: str):
+        """
+        Returns the rows matching the query, in display order.
+
+        Args:
+            query (str): The text to look for, case-insensitively.
+
+        Returns:
+            list: The matching rows.
+        """
+        query = query.lower()
+        if not query:
+            self.last_query = None
+            self.last_matches = None
+            return list(self.rows)
+
+        if query in self.recent:
+            matches = self.recent[query]
+        elif self.last_query is not None and self.last_query in query:
+            texts = self.texts
+            matches = [position for position in self.last_matches if query in texts[position]]
+        else:
+            matches = self._find(query)
+
+        self.last_query = query
+        self.last_matches = matches
+        self.recent[query] = matches
+        if len(self.recent) > RECENT_QUERIES:
+            del self.recent[next(iter(self.recent))]
+        return [self.rows[position] for position in matches]
+
+    def update_row(self, position: int, row):
+        """
+        Replaces the row at `position` after it was edited, keeping the index in sync.
+
+        Args:
+            position (int): The position of the row in the table.
+            row (tuple): The new row data.
+        """
+        self.rows[position] = row
+        self.texts[position] = str(row).lower()
+        self._text = None
+        self.last_query = None
+        self.last_matches = None
+        self.recent = {}
+
+    def _find(self, query: str):
+        """
+        Finds the positions of the rows containing the query by scanning the joined text.
+
+        Jumping from match to match is only worth it while matches are sparse; once they are dense,
+        the remaining rows are checked one by one.
+        """
+        if SEPARATOR in query:
+            return []
+        if self._text is None:
+            self._text = SEPARATOR.join(self.texts)
+            self._starts = []
+            start = 0
+            for text in self.texts:
+                self._starts.append(start)
+                start += len(text) + 1
+
+        text, starts, texts = self._text, self._starts, self.texts
+        dense = len(texts) // 64
+        matches = []
+        index = text.find(query)
+        while index != -1:
+            position = bisect_right(starts, index) - 1
+            matches.append(position)
+            if len(matches) > dense:
+                matches.extend(other for other in range(position + 1, len(texts)) if query in texts[other])
+                break
+            # Continue from the next row; one match per row is enough
+            if position + 1 >= len(starts):
+                break
+            index = text.find(query, starts[position + 1])
+        return matches
@@ -1,17 +1,19 @@
 """
 This module serves as the central location for maintaining the local copy of data shared throughout the application.
 
-It fetches data for courses, instructors, and students either from a JSON file or a database, depending on the active code section.
+It fetches data for courses, instructors, and students through the active storage backend (see crud.storageBackend),
+either a JSON file or a database. Nothing is fetched at import time: each entity set is loaded from the backend the first
+time it is used, so importing this module (and every tab that imports it) does not block on a full load.
 
 Imports:
-    - load_json (from crud.jsonCRUD): Function to load data from a JSON file (currently commented out).
-    - fetch_courses, fetch_instructors, fetch_students (from crud.databaseCRUD): Functions to fetch data from the database.
+    - get_backend (from crud.storageBackend): Function returning the active storage backend, which streams the entities.
     - Course, Instructor, Student (from classes.Course): Classes representing the main data structures.
 
 Attributes:
-    courses (list): A list of Course objects fetched from the database (or JSON).
-    instructors (list): A list of Instructor objects fetched from the database (or JSON).
-    students (list): A list of Student objects fetched from the database (or JSON).
+    repository (Repository): The object holding the lazily loaded entity sets.
+    courses (Registry): Course objects keyed by course_id, fetched from the backend on first access.
+    instructors (Registry): Instructor objects keyed by instructor_id, fetched from the backend on first access.
+    students (Registry): Student objects keyed by student_id, fetched from the backend on first access.
 
 Usage:
     The module provides shared data that is accessed throughout the application, with `courses`, `instructors`, and `students`
@@ -19,16 +21,206 @@ Usage:
 
 """
 
-from crud.jsonCRUD import load_json
-from crud.databaseCRUD import fetch_courses , fetch_instructors , fetch_students
+from crud.storageBackend import get_backend
 from classes.Course import *
+from collections.abc import Sequence
+import threading
 
-# Commented code that works for the JSON File
-# data = load_json()
-# courses = [Course.from_json(course) for course in data["Course"]]
-# instructors = [Instructor.from_json(instructor) for instructor in data["Instructor"]]
-# students = [Student.from_json(student) for student in data["Student"]]
+class Registry(Sequence):
+    def __init__(self, key: str, loader):
+        """
+        Initializes an empty Registry, an insertion-ordered collection of entities indexed by their id.
 
-courses = [Course.from_db(course) for course in fetch_courses()]
-instructors = [Instructor.from_db(instructor) for instructor in fetch_instructors()]
-students = [Student.from_db(students) for students in fetch_students()]
+        It keeps the list behaviour the tabs rely on (iteration, positional indexing for the dropdowns,
+        append and remove) while looking up, adding and removing entities by id in O(1). The entities
+        are loaded by calling `loader` the first time the registry is used.
+
+        The registry can be read from worker threads while the GUI thread changes it: loading and every
+        change hold `lock`, and the list returned by `as_list` is never changed in place, so it can be
+        iterated without the lock.
+
+        Views of the entities (e.g. the View All tables) follow the changes through `subscribe`; an entity
+        edited in place is reported with `replace`.
+
+        Args:
+            key (str): The name of the id attribute, e.g. 'student_id'.
+            loader (callable): A function returning an iterable of the entities.
+
+        Attributes:
+            by_id (dict): The entities keyed by id, in insertion order.
+            loaded (bool): Whether the entities returned by `loader` are all in `by_id`.
+            lock (threading.RLock): Held while the entities are loaded or changed.
+            listeners (list): The functions called after each change, see `subscribe`.
+        """
+        self.key = key
+        self.loader = loader
+        self.loaded = False
+        self.by_id : dict = {}
+        self.lock = threading.RLock()
+        self.listeners : list = []
+        self._items : list = None
+
+    def load(self):
+        """
+        Loads the entities if they have not been loaded yet.
+
+        Returns:
+            dict: The entities keyed by id.
+        """
+        with self.lock:
+            if not self.loaded:
+                by_id = {}
+                for item in self.loader():
+                    by_id[getattr(item, self.key)] = item
+                self.by_id = by_id
+                self.loaded = True
+        return self.by_id
+
+    def as_list(self):
+        """
+        Returns the entities as a list in insertion order, rebuilt only after the registry changes.
+
+        Returns:
+            list: The entities in insertion order.
+        """
+        with self.lock:
+            if self._items is None:
+                self._items = list(self.load().values())
+            return self._items
+
+    def get(self, id, default=None):
+        """
+        Looks up an entity by its id.
+
+        Args:
+            id (str): The id of the entity.
+            default: The value returned if no entity has that id.
+
+        Returns:
+            object: The entity with that id, or `default`.
+        """
+        return self.load().get(id, default)
+
+    def append(self, item):
+        """
+        Adds an entity at the end of the registry, replacing any entity with the same id.
+
+        Args:
+            item (object): The entity to add.
+        """
+        with self.lock:
+            by_id = self.load()
+            id = getattr(item, self.key)
+            by_id.pop(id, None)
+            by_id[id] = item
+            self._items = None
+        self._notify(item, False)
+
+    def replace(self, item):
+        """
+        Records that an entity was edited, keeping its position in the registry.
+
+        Args:
+            item (object): The edited entity.
+
+        Raises:
+            ValueError: If no entity with that id is in the registry.
+        """
+        with self.lock:
+            by_id = self.load()
+            id = getattr(item, self.key)
+            if id not in by_id:
+                raise ValueError(f"{id} not in registry")
+            by_id[id] = item
+            self._items = None
+        self._notify(item, True)
+
+    def extend(self, items):
+        """
+        Adds every entity in `items` at the end of the registry.
+
+        Args:
+            items (iterable): The entities to add.
+        """
+        with self.lock:
+            for item in items:
+                self.append(item)
+
+    def remove(self, item):
+        """
+        Removes an entity from the registry.
+
+        Args:
+            item (object): The entity to remove.
+
+        Raises:
+            ValueError: If the entity is not in the registry.
+        """
+        with self.lock:
+            by_id = self.load()
+            id = getattr(item, self.key)
+            if by_id.get(id) is not item:
+                raise ValueError(f"{id} not in registry")
+            del by_id[id]
+            self._items = None
+        self._notify(item, False)
+
+    def clear(self):
+        """
+        Removes every entity from the registry.
+        """
+        with self.lock:
+            self.load().clear()
+            self._items = None
+        self._notify(None, False)
+
+    def subscribe(self, listener):
+        """
+        Registers a function to call after each change, on the thread making it, with the entity that changed
+        (None when the registry is cleared) and whether it was edited in place rather than added or removed.
+
+        Args:
+            listener (callable): A function taking (item, edited).
+        """
+        self.listeners.append(listener)
+
+    def _notify(self, item, edited):
+        """
+        Calls every listener with a change.
+        """
+        for listener in self.listeners:
+            listener(item, edited)
+
+    def __getitem__(self, index):
+        return self.as_list()[index]
+
+    def __len__(self):
+        return len(self.load())
+
+    def __iter__(self):
+        return iter(self.as_list())
+
+    def __contains__(self, item):
+        return self.load().get(getattr(item, self.key, None)) is item
+
+    def __repr__(self):
+        return repr(self.as_list())
+
+class Repository:
+    def __init__(self):
+        """
+        Initializes the Repository with one lazily loaded registry per entity set.
+
+        Attributes:
+            courses (Registry): Course objects keyed by course_id, loaded on first access.
+            instructors (Registry): Instructor objects keyed by instructor_id, loaded on first access.
+            students (Registry): Student objects keyed by student_id, loaded on first access.
+        """
+        self.courses = Registry("course_id", lambda: get_backend().iter_courses())
+        self.instructors = Registry("instructor_id", lambda: get_backend().iter_instructors())
+        self.students = Registry("student_id", lambda: get_backend().iter_students())
+
+repository = Repository()
+courses = repository.courses
+instructors = repository.instructors
+students = repository.students
@@ -0,0 +1,75 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from crud import binarySnapshot
+from crud.binarySnapshot import SnapshotError
+
+REPO_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data.json")
+
+DOCUMENT = {
+    "_version": 7,
+    "Student": [
+        {"name": "Zein Zebib", "age": 20, "_email": "zein@mail.com", "student_id": "00001",
+         "registered_courses": ["10001"]},
+        # Same keys in another order, a missing field and an extra one
+        {"student_id": "00002", "name": "Ali Haidar", "age": 21, "_email": "ali@mail.com",
+         "registered_courses": []},
+        {"name": "No Courses", "age": 22, "_email": "none@mail.com", "student_id": "00003"},
+        {"name": "Extra", "age": 23, "_email": "extra@mail.com", "student_id": "00004",
+         "registered_courses": [], "note": {"nested": [1, 2.5, None, True]}},
+        {},
+        # Values that are not rows
+        "00005", 6, None, ["00007"],
+    ],
+    "Course": [],
+    "Instructor": [{"name": "Élodie 日本 😀", "age": 40, "_email": "e@mail.com", "instructor_id": "01001",
+                    "assigned_courses": ["10001", "10002"]}],
+    "Meta": {"created": "2024-01-01", "tags": ["a", "b"]},
+    "Flag": False,
+    "Nothing": None,
+}
+
+class BinarySnapshotTest(unittest.TestCase):
+    def _assert_same(self, copy, data):
+        self.assertEqual(copy, data)
+        # Equal dicts can differ in key order, which the snapshot keeps too
+        self.assertEqual(json.dumps(copy), json.dumps(data))
+
+    def test_round_trip(self):
+        self._assert_same(binarySnapshot.loads(binarySnapshot.dumps(DOCUMENT)), DOCUMENT)
+        self._assert_same(binarySnapshot.loads(binarySnapshot.dumps({})), {})
+
+    def test_round_trip_repository_data(self):
+        with open(REPO_DATA) as f:
+            data = json.load(f)
+        self._assert_same(binarySnapshot.loads(binarySnapshot.dumps(data)), data)
+
+    def test_truncated_payload_raises(self):
+        payload = binarySnapshot.dumps(DOCUMENT)
+        for length in range(len(payload)):
+            with self.subTest(length=length):
+                with self.assertRaises(SnapshotError):
+                    binarySnapshot.loads(payload[:length])
+
+    def test_not_a_snapshot_raises(self):
+        with open(REPO_DATA, "rb") as f:
+            payload = f.read()
+        with self.assertRaises(SnapshotError):
+            binarySnapshot.loads(payload)
+        self.assertTrue(issubclass(SnapshotError, ValueError))
+
+    def test_file_conversion(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        json_path = os.path.join(directory, "data.json")
+        binary_path = os.path.join(directory, "data.bin")
+        with open(json_path, "w") as f:
+            json.dump(DOCUMENT, f, indent=4)
+
+        binarySnapshot.json_to_binary(json_path, binary_path)
+        os.remove(json_path)
+        binarySnapshot.binary_to_json(binary_path, json_path)
+        with open(json_path) as f:
+            self._assert_same(json.load(f), DOCUMENT)
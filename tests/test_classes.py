@@ -0,0 +1,179 @@
+import json
+import unittest
+from classes.Course import Course, Instructor, Student
+from classes.IdSet import IdSet
+from classes.Person import Person
+
+class SlotsTest(unittest.TestCase):
+    def _assert_round_trip(self, entity, keys):
+        data = entity.to_dict()
+        self.assertEqual(list(data), keys)
+        self.assertFalse(hasattr(entity, "__dict__"))
+
+        copy = type(entity).from_dict(data)
+        self.assertIs(type(copy), type(entity))
+        self.assertEqual(copy.to_dict(), data)
+        for key, value in data.items():
+            if isinstance(value, list):
+                value.append("99999")
+                self.assertNotIn("99999", getattr(entity, key))
+                self.assertNotIn("99999", getattr(copy, key))
+
+    def test_person_round_trip(self):
+        self._assert_round_trip(Person("Zein Zebib", 20, "zein@mail.com"), ["name", "age", "_email"])
+
+    def test_student_round_trip(self):
+        self._assert_round_trip(Student("Zein Zebib", 20, "zein@mail.com", "00001", ["10002", "10001"]),
+                                ["name", "age", "_email", "student_id", "registered_courses"])
+
+    def test_instructor_round_trip(self):
+        self._assert_round_trip(Instructor("Ali Haidar", 40, "ali@mail.com", "01001", ["10001", "10003"]),
+                                ["name", "age", "_email", "instructor_id", "assigned_courses"])
+
+    def test_course_round_trip(self):
+        self._assert_round_trip(Course("10001", "EECE435", "01001", ["00002", "00001"]),
+                                ["course_id", "course_name", "instructor_id", "enrolled_students"])
+        self._assert_round_trip(Course("10002", "SOAN230", "", []),
+                                ["course_id", "course_name", "instructor_id", "enrolled_students"])
+
+def _fields(entity):
+    """
+    Returns every slot of an entity, with the id sets as lists of their ids in order.
+    """
+    fields = {}
+    for klass in type(entity).__mro__:
+        for slot in getattr(klass, "__slots__", ()):
+            value = getattr(entity, slot)
+            fields[slot] = (type(value), list(value)) if isinstance(value, dict) else value
+    return fields
+
+def _id(text):
+    """
+    Returns a new string equal to `text`, as the database driver returns for every row.
+    """
+    return "".join(list(text))
+
+class BatchBuildTest(unittest.TestCase):
+    def setUp(self):
+        self.db_rows = {
+            Student: [(_id("00001"), "Zein Zebib", 20, "zein@mail.com", _id("10001") + "," + _id("10002")),
+                      (_id("00002"), "James Franco", 21, "james@mail.com", None),
+                      (_id("00003"), "John Doe", 22, "john@mail.com", _id("10002"))],
+            Instructor: [(_id("01001"), "Ali Haidar", 40, "ali@mail.com", _id("10001")),
+                         (_id("01002"), "Rita Nassar", 41, "rita@mail.com", None)],
+            Course: [(_id("10001"), "EECE435", _id("01001"), _id("00001")),
+                     (_id("10002"), "SOAN230", None, _id("00001") + "," + _id("00003"))],
+        }
+
+    def test_from_db_many_matches_from_db(self):
+        for cls, rows in self.db_rows.items():
+            self.assertEqual([_fields(entity) for entity in cls.from_db_many(rows)],
+                             [_fields(cls.from_db(row)) for row in rows], cls.__name__)
+
+    def test_from_json_many_matches_from_json(self):
+        for cls, rows in self.db_rows.items():
+            objects = [cls.from_db(row).to_dict() for row in rows]
+            self.assertEqual([_fields(entity) for entity in cls.from_json_many(objects)],
+                             [_fields(cls.from_json(data)) for data in objects], cls.__name__)
+
+    def test_ids_are_shared_through_interned(self):
+        interned = {}
+        students = Student.from_db_many(self.db_rows[Student][:2], interned)
+        students += Student.from_db_many(self.db_rows[Student][2:], interned)
+        courses = Course.from_json_many([course.to_dict() for course in Course.from_db_many(self.db_rows[Course])],
+                                        interned)
+
+        registered = [course_id for student in students for course_id in student.registered_courses]
+        enrolled = [student_id for course in courses for student_id in course.enrolled_students]
+        for id in registered + enrolled + [student.student_id for student in students]:
+            self.assertIs(id, interned[id])
+        self.assertIs(courses[1].course_id, list(students[0].registered_courses)[1])
+        self.assertIs(list(courses[0].enrolled_students)[0], students[0].student_id)
+        self.assertIsNot(_id("00001"), students[0].student_id)
+
+def _loop_report(entities):
+    """
+    Returns the report of `validate_many`, built by calling `validate` on each entity.
+    """
+    errors = {}
+    for position, entity in enumerate(entities):
+        valid, messages = entity.validate()
+        if not valid:
+            errors[position] = messages
+    return not errors, errors
+
+class ValidateManyTest(unittest.TestCase):
+    ages = [20, 17, 16, 0, 16.5, 17.0, 30.25, True, False, None, ""]
+    names = ["Zein Zebib", "Z", "", "Zo"]
+    emails = ["zein@mail.com", "", "\n", "zein@mail.com\n", "zein@mail.com\nali@mail.com", "zein\n@mail.com",
+              "\nzein@mail.com", "zein.mail.com", "zein@mail", "zein@mail.com ", "ali+tag@sub.mail.com"]
+
+    def _assert_same_report(self, entities):
+        self.assertEqual(type(entities[0]).validate_many(entities), _loop_report(entities))
+
+    def test_students_match_validate(self):
+        students = [Student(self.names[index % len(self.names)], self.ages[index % len(self.ages)],
+                            self.emails[index % len(self.emails)], f"{index:05d}", [])
+                    for index in range(len(self.ages) * len(self.names) * len(self.emails))]
+        self._assert_same_report(students)
+        for start in range(len(self.emails)):
+            with self.subTest(start=start):
+                self._assert_same_report(students[start:start + 1])
+                self._assert_same_report(students[start:start + 3])
+
+    def test_int_ages_match_validate(self):
+        students = [Student("Zein Zebib", age, "zein@mail.com", "00001", []) for age in range(-2, 40)]
+        self._assert_same_report(students)
+
+    def test_instructors_match_validate(self):
+        instructors = [Instructor(name, age, email, "01001", []) for name in self.names for age in self.ages
+                       for email in self.emails]
+        self._assert_same_report(instructors)
+
+    def test_courses_match_validate(self):
+        courses = [Course(course_id, name, "", []) for course_id in ("10001", "1000", "100001", "")
+                   for name in ("EECE435", "EECE4350", "EECE43", "")]
+        self._assert_same_report(courses)
+
+    def test_empty(self):
+        self.assertEqual(Student.validate_many([]), (True, {}))
+        self.assertEqual(Course.validate_many([]), (True, {}))
+
+class IdSetTest(unittest.TestCase):
+    def test_order_on_discard_and_re_add(self):
+        ids = IdSet.fromkeys(["10003", "10001", "10002", "10001"])
+        self.assertEqual(list(ids), ["10003", "10001", "10002"])
+
+        self.assertFalse(ids.add("10003"))
+        self.assertEqual(list(ids), ["10003", "10001", "10002"])
+        self.assertTrue(ids.discard("10003"))
+        self.assertFalse(ids.discard("10003"))
+        self.assertEqual(list(ids), ["10001", "10002"])
+        # A re-added id goes to the end, not back to its old position
+        self.assertTrue(ids.add("10003"))
+        self.assertEqual(list(ids), ["10001", "10002", "10003"])
+        self.assertTrue(ids.discard("10002"))
+        self.assertTrue(ids.add("10004"))
+        self.assertTrue(ids.add("10002"))
+        self.assertEqual(list(ids), ["10001", "10003", "10004", "10002"])
+        self.assertEqual(repr(ids), "IdSet(['10001', '10003', '10004', '10002'])")
+
+    def test_to_dict_emits_plain_lists(self):
+        student = Student("Zein Zebib", 20, "zein@mail.com", "00001", ["10002", "10001"])
+        instructor = Instructor("Ali Haidar", 40, "ali@mail.com", "01001", ["10001", "10003"])
+        course = Course("10001", "EECE435", "01001", ["00002", "00001"])
+        for entity, key in ((student, "registered_courses"), (instructor, "assigned_courses"),
+                            (course, "enrolled_students")):
+            with self.subTest(key=key):
+                ids = getattr(entity, key)
+                self.assertIsInstance(ids, IdSet)
+                first = next(iter(ids))
+                ids.discard(first)
+                ids.add("99999")
+                ids.add(first)
+
+                value = entity.to_dict()[key]
+                self.assertIs(type(value), list)
+                self.assertEqual(value, list(ids))
+                self.assertEqual(value[-2:], ["99999", first])
+                self.assertEqual(json.loads(json.dumps(entity.to_dict()))[key], value)
@@ -0,0 +1,9 @@
+import unittest
+from columnarStore import ColumnarStore
+
+class ColumnarStoreTest(unittest.TestCase):
+    def test_unassigned_course_has_empty_instructor_id(self):
+        store = ColumnarStore([("10001", "EECE435", "", None)], [], [])
+        self.assertEqual(store.course(0).instructor_id, "")
+        self.assertEqual(store.course(0).to_dict(), {"course_id": "10001", "course_name": "EECE435",
+                                                     "instructor_id": "", "enrolled_students": []})
@@ -0,0 +1,130 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from classes.Course import Course, Student
+from crud import databaseCRUD
+
+REPO_DATABASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "database.db")
+
+class DatabaseTestCase(unittest.TestCase):
+    """
+    Runs each test on a copy of the repository database, restoring the module settings afterwards.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "database.db")
+        shutil.copyfile(REPO_DATABASE, self.path)
+        self.settings = (databaseCRUD.database_path, databaseCRUD.memory_mode, databaseCRUD.flush_interval)
+        databaseCRUD.database_path = self.path
+
+    def tearDown(self):
+        databaseCRUD.close_memory_db()
+        databaseCRUD.close_db()
+        databaseCRUD.database_path, databaseCRUD.memory_mode, databaseCRUD.flush_interval = self.settings
+        shutil.rmtree(self.directory)
+
+class MemoryModeTest(DatabaseTestCase):
+    def test_loads_wal_mode_file(self):
+        students = databaseCRUD.fetch_students()
+        databaseCRUD.close_db()
+        with sqlite3.connect(self.path) as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        databaseCRUD.memory_mode = True
+        databaseCRUD.flush_interval = None
+        self.assertEqual(databaseCRUD.fetch_students(), students)
+        valid, errors = databaseCRUD.add_student(Student("Memory Student", 20, "memory@mail.com", "mem01", []))
+        self.assertTrue(valid, errors)
+
+        valid, errors = databaseCRUD.close_memory_db()
+        self.assertTrue(valid, errors)
+        conn = sqlite3.connect(self.path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("SELECT name FROM Student WHERE student_id = 'mem01'").fetchone(),
+                             ("Memory Student",))
+        finally:
+            conn.close()
+
+class MigrationTest(DatabaseTestCase):
+    def test_empty_database_is_migrated_once_its_tables_exist(self):
+        databaseCRUD.database_path = os.path.join(self.directory, "empty.db")
+        conn = databaseCRUD.connect_db()
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+
+        conn.execute("CREATE TABLE Course (course_id TEXT PRIMARY KEY, course_name TEXT, instructor_id TEXT)")
+        conn.execute("CREATE TABLE Enrollment (student_id TEXT, course_id TEXT)")
+        conn.commit()
+        databaseCRUD.close_db()
+
+        conn = databaseCRUD.connect_db()
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], len(databaseCRUD.migrations))
+        indexes = {name for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("idx_enrollment_student_id", indexes)
+
+    def test_migrated_database_serves_hot_queries_with_indexes(self):
+        for query in (databaseCRUD.FETCH_COURSES_PAGE_QUERY, databaseCRUD.FETCH_STUDENTS_PAGE_QUERY,
+                      databaseCRUD.FETCH_INSTRUCTORS_PAGE_QUERY):
+            self.assertIn(query, databaseCRUD.hot_queries)
+        conn = databaseCRUD.connect_db()
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], len(databaseCRUD.migrations))
+        valid, errors = databaseCRUD.check_query_plans()
+        self.assertTrue(valid, errors)
+
+        conn.execute("DROP INDEX idx_enrollment_student_id")
+        # A connection keeps the plans of the EXPLAIN statements it already prepared, so check on a new one
+        databaseCRUD.close_db()
+        valid, errors = databaseCRUD.check_query_plans()
+        self.assertFalse(valid)
+        self.assertTrue(any("Enrollment" in error for error in errors), errors)
+
+class ConnectionPoolTest(DatabaseTestCase):
+    def test_close_all_db_closes_every_thread_connection(self):
+        opened = []
+        thread = threading.Thread(target=lambda: opened.append(databaseCRUD.connect_db()))
+        thread.start()
+        thread.join()
+        own = databaseCRUD.connect_db()
+
+        databaseCRUD.close_all_db()
+        for conn in (opened[0], own):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_connections_of_finished_threads_are_closed(self):
+        opened = []
+        thread = threading.Thread(target=lambda: opened.append(databaseCRUD.connect_db()))
+        thread.start()
+        thread.join()
+
+        databaseCRUD.connect_db()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+class EnrollmentBulkTest(DatabaseTestCase):
+    def test_register_courses_bulk_returns_one_result_per_pair(self):
+        registered = Student("Zein Zebib", 20, "zein@mail.com", "00001", [])
+        first, second = (Student(f"Bulk Student {index}", 20, f"bulk{index}@mail.com", f"bulk{index}", [])
+                         for index in range(2))
+        for student in (first, second):
+            valid, errors = databaseCRUD.add_student(student)
+            self.assertTrue(valid, errors)
+        course, other = Course("00001", "EECE435", "", []), Course("00002", "SOAN230", "", [])
+
+        pairs = [(registered, course), (first, course), (first, course), (second, other)]
+        results = databaseCRUD.register_courses_bulk(pair for pair in pairs)
+
+        self.assertEqual([valid for valid, _ in results], [False, True, False, True])
+        self.assertEqual(results[1][1], ["Added student Bulk Student 0 to course EECE435"])
+        self.assertIn("UNIQUE", results[2][1][0])
+        with sqlite3.connect(self.path) as conn:
+            rows = conn.execute("SELECT course_id, student_id FROM Enrollment WHERE student_id LIKE 'bulk%' "
+                                "ORDER BY student_id").fetchall()
+        self.assertEqual(rows, [("00001", "bulk0"), ("00002", "bulk1")])
+
+if __name__ == "__main__":
+    unittest.main()
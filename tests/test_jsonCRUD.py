@@ -0,0 +1,230 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import errno
+import json
+import unittest
+from unittest import mock
+from classes.Course import Course, Student
+from crud import jsonCRUD
+
+REPO_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data.json")
+
+def _configure(directory, storage_mode):
+    jsonCRUD.file_path = os.path.join(directory, "data.json")
+    jsonCRUD.journal_path = os.path.join(directory, "data.json.log")
+    jsonCRUD.lock_path = os.path.join(directory, "data.json.lock")
+    jsonCRUD.storage_mode = storage_mode
+    jsonCRUD._discard_changes()
+
+def _enroll_worker(directory, storage_mode, worker, count):
+    """
+    Enrolls `count` new ids into course 10001, each with a read-modify-write transaction retried on conflict.
+    """
+    _configure(directory, storage_mode)
+    for number in range(count):
+        student_id = f"{worker}{number:04d}"
+        while True:
+            with jsonCRUD.transaction() as current:
+                course = Course.from_json(jsonCRUD.get_entry_json("Course", "10001"))
+                course.enrolled_students.add(student_id)
+                jsonCRUD.edit_entry_json("Course", course)
+            if current.committed:
+                break
+
+class JsonTestCase(unittest.TestCase):
+    """
+    Runs each test on a copy of the repository data, restoring the module settings afterwards.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        shutil.copyfile(REPO_DATA, os.path.join(self.directory, "data.json"))
+        self.settings = (jsonCRUD.file_path, jsonCRUD.journal_path, jsonCRUD.lock_path, jsonCRUD.storage_mode)
+
+    def tearDown(self):
+        jsonCRUD.file_path, jsonCRUD.journal_path, jsonCRUD.lock_path, jsonCRUD.storage_mode = self.settings
+        jsonCRUD._discard_changes()
+        shutil.rmtree(self.directory)
+
+class ConcurrentTransactionTest(JsonTestCase):
+    processes = 4
+    transactions = 60
+
+    def _run_workers(self, storage_mode):
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_enroll_worker,
+                                   args=(self.directory, storage_mode, worker, self.transactions))
+                   for worker in range(1, self.processes + 1)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+        _configure(self.directory, storage_mode)
+        enrolled = jsonCRUD.get_entry_json("Course", "10001")["enrolled_students"]
+        expected = {f"{worker}{number:04d}" for worker in range(1, self.processes + 1)
+                    for number in range(self.transactions)}
+        self.assertEqual(len(enrolled), len(set(enrolled)))
+        missing = expected - set(enrolled)
+        self.assertFalse(missing, f"{len(missing)} of {len(expected)} enrollments were lost")
+
+    def test_snapshot_mode_keeps_every_update(self):
+        self._run_workers("snapshot")
+
+    def test_journal_mode_keeps_every_update(self):
+        self._run_workers("journal")
+
+class FailedWriteTest(JsonTestCase):
+    def _assert_not_cached(self, storage_mode, change):
+        _configure(self.directory, storage_mode)
+        jsonCRUD.load_json()
+        with mock.patch.object(jsonCRUD.os, "fsync", side_effect=OSError(errno.ENOSPC, "No space left on device")):
+            with self.assertRaises(OSError):
+                change()
+        self.assertIsNone(jsonCRUD.get_entry_json("Student", "full1"))
+
+    def _add_student(self):
+        jsonCRUD.add_entry_json("Student", Student("Disk Full", 20, "full@mail.com", "full1", []))
+
+    def _add_student_in_transaction(self):
+        with jsonCRUD.transaction():
+            self._add_student()
+
+    def test_snapshot_mode_forgets_unsaved_change(self):
+        self._assert_not_cached("snapshot", self._add_student)
+
+    def test_journal_mode_forgets_unsaved_change(self):
+        self._assert_not_cached("journal", self._add_student)
+
+    def test_transaction_forgets_unsaved_changes(self):
+        self._assert_not_cached("snapshot", self._add_student_in_transaction)
+        self._assert_not_cached("journal", self._add_student_in_transaction)
+
+class DeleteOrderTest(JsonTestCase):
+    def _assert_keeps_order(self, storage_mode):
+        _configure(self.directory, storage_mode)
+        ids = [row["student_id"] for row in jsonCRUD.load_json()["Student"]]
+        valid, errors = jsonCRUD.delete_entry_json("Student", Student("", 0, "", ids[0], []))
+        self.assertTrue(valid, errors)
+
+        for data in (jsonCRUD.load_json(), self._reload()):
+            self.assertEqual([row["student_id"] for row in data["Student"]], ids[1:])
+        for student_id in ids[1:]:
+            self.assertEqual(jsonCRUD.get_entry_json("Student", student_id)["student_id"], student_id)
+
+    def _reload(self):
+        jsonCRUD._discard_changes()
+        return jsonCRUD.load_json()
+
+    def test_snapshot_mode_keeps_order(self):
+        self._assert_keeps_order("snapshot")
+
+    def test_journal_mode_keeps_order(self):
+        self._assert_keeps_order("journal")
+
+class JournalTest(JsonTestCase):
+    def setUp(self):
+        super().setUp()
+        _configure(self.directory, "journal")
+
+    def _add_student(self, student_id):
+        valid, errors = jsonCRUD.add_entry_json("Student", Student("Journal Student", 20, "journal@mail.com",
+                                                                   student_id, []))
+        self.assertTrue(valid, errors)
+
+    def _reload(self):
+        jsonCRUD._discard_changes()
+        return jsonCRUD.load_json()
+
+    def test_torn_last_line_is_ignored(self):
+        self._add_student("jrn01")
+        with open(jsonCRUD.journal_path, "a") as f:
+            f.write('{"op":"add","table":"Student","id":"torn","entry":{"na')
+
+        self._reload()
+        self.assertIsNotNone(jsonCRUD.get_entry_json("Student", "jrn01"))
+        self.assertIsNone(jsonCRUD.get_entry_json("Student", "torn"))
+
+        # The next change replaces the torn line instead of being appended to it
+        self._add_student("jrn02")
+        self._reload()
+        self.assertIsNotNone(jsonCRUD.get_entry_json("Student", "jrn02"))
+        with open(jsonCRUD.journal_path) as f:
+            self.assertEqual([json.loads(line)["id"] for line in f], ["jrn01", "jrn02"])
+
+    def test_replay_after_crash_between_snapshot_and_truncate_is_idempotent(self):
+        ids = [row["student_id"] for row in jsonCRUD.load_json()["Student"]]
+        self._add_student("jrn01")
+        student = Student.from_json(jsonCRUD.get_entry_json("Student", "jrn01"))
+        student.age = 21
+        self.assertTrue(jsonCRUD.edit_entry_json("Student", student)[0])
+        self.assertTrue(jsonCRUD.delete_entry_json("Student", Student("", 0, "", ids[0], []))[0])
+        self._add_student("jrn02")
+        with open(jsonCRUD.journal_path) as f:
+            journal = f.read()
+
+        jsonCRUD.compact_journal()
+        with open(jsonCRUD.file_path) as f:
+            snapshot = json.load(f)
+        # The crash left the journal as it was before the snapshot
+        with open(jsonCRUD.journal_path, "w") as f:
+            f.write(journal)
+
+        self.assertEqual(self._reload(), snapshot)
+        self.assertEqual([row["student_id"] for row in snapshot["Student"]], ids[1:] + ["jrn01", "jrn02"])
+        self.assertEqual(jsonCRUD.get_entry_json("Student", "jrn01")["age"], 21)
+
+    def test_journal_is_compacted_at_threshold(self):
+        threshold = jsonCRUD.compact_threshold
+        self.addCleanup(setattr, jsonCRUD, "compact_threshold", threshold)
+        jsonCRUD.compact_threshold = 3
+
+        self._add_student("jrn01")
+        self._add_student("jrn02")
+        self.assertGreater(os.path.getsize(jsonCRUD.journal_path), 0)
+        with open(jsonCRUD.file_path) as f:
+            self.assertNotIn("jrn01", [row["student_id"] for row in json.load(f)["Student"]])
+
+        self._add_student("jrn03")
+        self.assertEqual(os.path.getsize(jsonCRUD.journal_path), 0)
+        with open(jsonCRUD.file_path) as f:
+            self.assertEqual([row["student_id"] for row in json.load(f)["Student"]][-3:], ["jrn01", "jrn02", "jrn03"])
+        self.assertEqual([row["student_id"] for row in self._reload()["Student"]][-3:], ["jrn01", "jrn02", "jrn03"])
+
+class GenerationTest(JsonTestCase):
+    def setUp(self):
+        super().setUp()
+        _configure(self.directory, "snapshot")
+
+    def _versions(self):
+        """
+        Returns the version of file_path.1, file_path.2, ... as long as they exist.
+        """
+        versions = []
+        while os.path.exists(f"{jsonCRUD.file_path}.{len(versions) + 1}"):
+            with open(f"{jsonCRUD.file_path}.{len(versions) + 1}") as f:
+                versions.append(json.load(f).get(jsonCRUD.version_key, 0))
+        return versions
+
+    def test_history_is_capped_at_history_size(self):
+        for number in range(jsonCRUD.history_size + 2):
+            student = Student("History Student", 20, "history@mail.com", f"his{number:02d}", [])
+            self.assertTrue(jsonCRUD.add_entry_json("Student", student)[0])
+
+        version = jsonCRUD.load_json()[jsonCRUD.version_key]
+        self.assertEqual(self._versions(), [version - generation for generation in range(1, jsonCRUD.history_size + 1)])
+
+    def test_truncated_snapshot_falls_back_to_previous_generation(self):
+        student = Student("History Student", 20, "history@mail.com", "his01", [])
+        self.assertTrue(jsonCRUD.add_entry_json("Student", student)[0])
+        with open(f"{jsonCRUD.file_path}.1") as f:
+            previous = json.load(f)
+        with open(jsonCRUD.file_path, "r+") as f:
+            f.truncate(os.path.getsize(jsonCRUD.file_path) // 2)
+
+        jsonCRUD._discard_changes()
+        self.assertEqual(jsonCRUD.load_json(), previous)
+        self.assertIsNone(jsonCRUD.get_entry_json("Student", "his01"))
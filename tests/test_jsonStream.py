@@ -0,0 +1,81 @@
+import functools
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from crud import jsonStream
+from crud.jsonStream import JsonStream, iter_table
+
+# From one byte, so every token and multibyte character is cut by a chunk boundary, to the default 1 MiB
+CHUNK_SIZES = [1, 2, 3, 5, 7, 64, 4096, 1 << 20]
+
+DOCUMENT = {
+    "_version": 12,
+    "Meta": {"nested": [1, [2, 3], {"a": []}], "empty": {}, "flags": [True, False, None], "numbers": [-1.5e3, 0, 7]},
+    "Course": [],
+    "Student": [
+        {"name": "Zein \"Z\" Zebib", "age": 20, "_email": "zein@mail.com", "student_id": "00001",
+         "registered_courses": ["10001", "10002"]},
+        {"name": "Back\\slash / and\ttab\nnewline", "age": 21, "_email": "back@mail.com", "student_id": "00002",
+         "registered_courses": []},
+        {"name": "Élodie Müller", "age": 22, "_email": "élodie@mail.com", "student_id": "00003",
+         "registered_courses": ["10003"]},
+        {"name": "日本語 😀 \u0000\u001f", "age": 23, "_email": "kanji@mail.com", "student_id": "00004",
+         "registered_courses": ["]", "}", ",", "\"[{"]},
+    ],
+    "Instructor": [
+        {"name": "Ali Haidar", "age": 40, "_email": "ali@mail.com", "instructor_id": "01001",
+         "assigned_courses": ["10001"]},
+    ],
+}
+
+class JsonStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, **dump_options):
+        path = os.path.join(self.directory, "data.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(DOCUMENT, f, **dump_options)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), DOCUMENT)
+        return path
+
+    def test_iter_table_matches_json_load(self):
+        for dump_options in ({"indent": 4}, {"indent": 4, "ensure_ascii": False}, {"separators": (",", ":")},
+                             {"separators": (",", ":"), "ensure_ascii": False}):
+            path = self._write(**dump_options)
+            for chunk_size in CHUNK_SIZES:
+                stream = functools.partial(JsonStream, chunk_size=chunk_size)
+                with mock.patch.object(jsonStream, "JsonStream", stream):
+                    for table_type in ("Course", "Student", "Instructor"):
+                        with self.subTest(dump_options=dump_options, chunk_size=chunk_size, table_type=table_type):
+                            self.assertEqual(list(iter_table(path, table_type)), DOCUMENT[table_type])
+                    with self.subTest(dump_options=dump_options, chunk_size=chunk_size, table_type="Missing"):
+                        with self.assertRaises(KeyError):
+                            list(iter_table(path, "Missing"))
+
+    def test_value_matches_json_load(self):
+        path = self._write(indent=4, ensure_ascii=False)
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                with JsonStream(path, chunk_size) as stream:
+                    self.assertEqual(stream.value(), DOCUMENT)
+                    self.assertEqual(stream.peek(), "")
+
+    def test_invalid_json_raises(self):
+        path = os.path.join(self.directory, "data.json")
+        for text in ('{"Student": [{"name": "Zein"', '{"Student": [{"name": "Zein"},', '{"Student" [', ""):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            for chunk_size in (1, 4096):
+                with self.subTest(text=text, chunk_size=chunk_size):
+                    stream = functools.partial(JsonStream, chunk_size=chunk_size)
+                    with mock.patch.object(jsonStream, "JsonStream", stream):
+                        with self.assertRaises(json.JSONDecodeError):
+                            list(iter_table(path, "Student"))
@@ -0,0 +1,85 @@
+import random
+import unittest
+from unittest import mock
+from classes.Course import Course, Instructor, Student
+from searchIndex import SearchIndex
+from shared import Registry
+from tkinterTabs.ViewAll import ViewAllTab
+
+WORDS = ["alpha", "Beta", "gamma", "Délta", "EECE435", "ünïcode"]
+
+def _scan(rows, query):
+    """
+    Filters the rows the way the View All tabs did before the index: a substring of the lowercased row.
+    """
+    return [row for row in rows if query.lower() in str(row).lower()]
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0)
+        self.rows = [(f"{index:05d}", " ".join(generator.choice(WORDS) for _ in range(3)), 18 + index % 10)
+                     for index in range(3000)]
+
+    def _assert_matches_scan(self, index, rows, queries):
+        for query in queries:
+            self.assertEqual(index.search(query), _scan(rows, query), query)
+
+    def test_growing_queries_narrow_the_previous_matches(self):
+        index = SearchIndex(list(self.rows))
+        self._assert_matches_scan(index, self.rows, ["a", "al", "alp", "alpha", "alpha b", "alpha beta", "00", "001"])
+        self.assertEqual(index.last_query, "001")
+
+    def test_shorter_queries_are_answered_from_recent_results(self):
+        index = SearchIndex(list(self.rows))
+        self._assert_matches_scan(index, self.rows, ["délta", "délt", "dél", "DÉLTA", "ü", "", "'0", "\x00"])
+        self.assertIn("délt", index.recent)
+
+    def test_edited_rows_are_found_by_later_searches(self):
+        rows = list(self.rows)
+        index = SearchIndex(list(self.rows))
+        self._assert_matches_scan(index, rows, ["alph", "alpha", "gamma", "z"])
+
+        for position in range(0, len(rows), 7):
+            row = (rows[position][0], "zeta " + rows[position][1].replace("alpha", "omega"), rows[position][2])
+            index.update_row(position, row)
+            rows[position] = row
+        self.assertEqual(index.rows, rows)
+        self._assert_matches_scan(index, rows, ["alpha", "alph", "z", "ze", "zeta", "omega", "gamma", ""])
+
+class ViewAllEditTest(unittest.TestCase):
+    def setUp(self):
+        courses = [Course("10001", "EECE435", "01001", ["00001"]), Course("10002", "SOAN230", "", [])]
+        students = [Student("Zein Zebib", 20, "zein@mail.com", "00001", ["10001"]),
+                    Student("James Franco", 21, "james@mail.com", "00002", [])]
+        instructors = [Instructor("Ali Haidar", 40, "ali@mail.com", "01001", ["10001"])]
+        self.tab = ViewAllTab.__new__(ViewAllTab)
+        self.tab.table = None
+        self.tab.courses = Registry("course_id", lambda: courses)
+        self.tab.students = Registry("student_id", lambda: students)
+        self.tab.instructors = Registry("instructor_id", lambda: instructors)
+        self.tab.students_data, self.tab.instructors_data, self.tab.courses_data, self.tab.search_indexes = \
+            self.tab.load_table_data(self.tab.snapshot_table_data())
+        self.tab.row_positions = {}
+        self.tab.load_data = mock.Mock()
+        for registry in (self.tab.students, self.tab.instructors, self.tab.courses):
+            registry.subscribe(self.tab.on_registry_changed)
+
+    def test_edited_student_row_is_updated_in_place(self):
+        self.assertEqual(self.tab.search_indexes['Student'].search("zein"), [self.tab.students_data[0]])
+        student = self.tab.students.get("00001")
+        student.name = "Karim Zebib"
+        student.register_course(self.tab.courses.get("10002"))
+        self.tab.students.replace(student)
+
+        expected = ("00001", "Karim Zebib", 20, "zein@mail.com", "EECE435 SOAN230")
+        self.assertEqual(self.tab.students_data[0], expected)
+        self.assertEqual(self.tab.search_indexes['Student'].search("zein"), [expected])
+        self.assertEqual(self.tab.search_indexes['Student'].search("karim"), [expected])
+        self.tab.load_data.assert_not_called()
+
+    def test_other_changes_reload_the_data(self):
+        course = self.tab.courses.get("10001")
+        course.course_name = "EECE430"
+        self.tab.courses.replace(course)
+        self.tab.students.append(Student("New Student", 20, "new@mail.com", "00003", []))
+        self.assertEqual(self.tab.load_data.call_count, 2)
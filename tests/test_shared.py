@@ -0,0 +1,53 @@
+import threading
+import time
+import unittest
+from shared import Registry
+
+class Item:
+    def __init__(self, item_id):
+        self.item_id = item_id
+
+class RegistryTest(unittest.TestCase):
+    def test_concurrent_reader_waits_for_the_load(self):
+        started = threading.Event()
+
+        def loader():
+            started.set()
+            for number in range(100):
+                time.sleep(0.001)
+                yield Item(number)
+
+        registry = Registry("item_id", loader)
+        worker = threading.Thread(target=registry.load)
+        worker.start()
+        started.wait()
+        self.assertEqual(len(registry), 100)
+        self.assertTrue(registry.loaded)
+        worker.join()
+
+    def test_failed_load_is_retried(self):
+        def loader():
+            yield Item(1)
+            raise OSError("disk error")
+
+        registry = Registry("item_id", loader)
+        with self.assertRaises(OSError):
+            registry.load()
+        self.assertFalse(registry.loaded)
+        registry.loader = lambda: [Item(1), Item(2)]
+        self.assertEqual([item.item_id for item in registry], [1, 2])
+
+    def test_changes_are_reported_to_listeners(self):
+        first, second = Item(1), Item(2)
+        registry = Registry("item_id", lambda: [first, second])
+        changes = []
+        registry.subscribe(lambda item, edited: changes.append((item, edited)))
+
+        registry.replace(first)
+        self.assertEqual([item.item_id for item in registry], [1, 2])
+        registry.remove(second)
+        registry.append(second)
+        registry.clear()
+        self.assertEqual(changes, [(first, True), (second, False), (second, False), (None, False)])
+        with self.assertRaises(ValueError):
+            registry.replace(first)
@@ -0,0 +1,47 @@
+import json
+import os
+import unittest
+from classes.Course import Course, Student
+from crud import jsonCRUD
+from crud.storageBackend import JsonBackend, StorageBackend
+from tests.test_jsonCRUD import JsonTestCase
+
+class StorageBackendTest(unittest.TestCase):
+    def test_interface_cannot_be_instantiated(self):
+        with self.assertRaises(TypeError):
+            StorageBackend()
+
+class JsonBackendTest(JsonTestCase):
+    def test_delete_course_unlinks_rows_that_no_longer_validate(self):
+        path = os.path.join(self.directory, "data.json")
+        with open(path) as f:
+            data = json.load(f)
+        # Stored before emails were validated
+        data["Student"][0]["_email"] = "not an email"
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        backend = JsonBackend(path)
+        valid, errors = backend.delete_course(Course.from_json(jsonCRUD.get_entry_json("Course", "10001")))
+        self.assertTrue(valid, errors)
+        student = jsonCRUD.get_entry_json("Student", "00001")
+        self.assertNotIn("10001", student["registered_courses"])
+        self.assertEqual(student["_email"], "not an email")
+        instructor = jsonCRUD.get_entry_json("Instructor", "01001")
+        self.assertNotIn("10001", instructor["assigned_courses"])
+
+    def test_register_courses_bulk_saves_every_pair_in_one_transaction(self):
+        backend = JsonBackend(os.path.join(self.directory, "data.json"))
+        students = [Student.from_json(jsonCRUD.get_entry_json("Student", student_id))
+                    for student_id in ("00002", "00003")]
+        course = Course.from_json(jsonCRUD.get_entry_json("Course", "10001"))
+        for student in students:
+            student.register_course(course)
+            course.enroll_student(student)
+
+        results = backend.register_courses_bulk((student, course) for student in students)
+        self.assertEqual([valid for valid, _ in results], [True, True])
+        jsonCRUD._discard_changes()
+        self.assertEqual(jsonCRUD.get_entry_json("Course", "10001")["enrolled_students"], ["00001", "00002", "00003"])
+        for student_id in ("00002", "00003"):
+            self.assertIn("10001", jsonCRUD.get_entry_json("Student", student_id)["registered_courses"])
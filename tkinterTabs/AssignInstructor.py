@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, instructors
+from tkinterTabs.Worker import TaskRunner
 
 class AssignInstructorTab(tk.Frame):
     def __init__(self, parent):
@@ -15,15 +15,20 @@ class AssignInstructorTab(tk.Frame):
             instructor_dropdown (ttk.Combobox): Dropdown of the list of instructors from shared.py
             course_var (tk.StringVar): Selected course_id
             instructor_var (tk.StringVar): Selected instructor_id
+            refresh_runner (TaskRunner): Loads the courses and instructors off the main loop
         """
         super().__init__(parent)
         self.course_dropdown : ttk.Combobox = None
         self.instructor_dropdown : ttk.Combobox = None
         self.course_var : tk.StringVar = tk.StringVar()
         self.instructor_var : tk.StringVar = tk.StringVar()
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AssignInstructorTab. Sets up the layout and adds all the components
@@ -34,14 +39,14 @@ class AssignInstructorTab(tk.Frame):
         # Course Dropdown Label
         tk.Label(self, text="Select Course: ").grid(row=1, column=0, padx=0, pady=5)
         # Course Dropdown
-        self.course_dropdown = ttk.Combobox(self, values=[course.course_name for course in courses], state='readonly')
+        self.course_dropdown = ttk.Combobox(self, state='readonly')
         self.course_dropdown.grid(row=1, column=1, padx=0, pady=5)
         self.course_dropdown.bind("<<ComboboxSelected>>", self.on_course_select)
 
         # Instructor Dropdown Label
         tk.Label(self, text="Select Instructor: ").grid(row=2, column=0, padx=0, pady=5)
         # Instructor Dropdown
-        self.instructor_dropdown = ttk.Combobox(self, values=[instructor.name for instructor in instructors], state='readonly')
+        self.instructor_dropdown = ttk.Combobox(self, state='readonly')
         self.instructor_dropdown.grid(row=2, column=1, padx=0, pady=5)
         self.instructor_dropdown.bind("<<ComboboxSelected>>", self.on_instructor_select)
 
@@ -67,8 +72,8 @@ class AssignInstructorTab(tk.Frame):
         course_id = self.course_var.get()
         instructor_id = self.instructor_var.get()
 
-        course : Course = next(course for course in courses if course.course_id == course_id)
-        instructor : Instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+        course : Course = courses.get(course_id)
+        instructor : Instructor = instructors.get(instructor_id)
 
         valid1, errors1 = instructor.assign_course(course)
         valid2, errors2 = course.assign_instructor(instructor)
@@ -83,25 +88,12 @@ class AssignInstructorTab(tk.Frame):
             messagebox.showwarning("Input Error", "\n".join(errors2))
             return
         
-        valid, errors = assign_instructor(instructor,course)
+        valid, errors = get_backend().assign_instructor(instructor,course)
         if valid:
             messagebox.showinfo("Success", f"{instructor.name} assigned to {course.course_name}!")
         else:
             messagebox.showwarning("Input Error", "\n".join(errors))
 
-        # Commented code for JSON
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Instructor', instructor)
-
-        # if valid1 and valid2:
-        #     messagebox.showinfo("Success", f"{instructor.name} assigned to {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     messagebox.showwarning("Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        # elif not valid1:
-        #     messagebox.showwarning("Input Error", "\n".join(errors1))
-        # elif not valid2:
-        #     messagebox.showwarning("Input Error", "\n".join(errors2))
-
     def unassign_instructor(self):
         """
         Unassigns an instructor to a course and updates the local copy
@@ -112,8 +104,8 @@ class AssignInstructorTab(tk.Frame):
         course_id = self.course_var.get()
         instructor_id = self.instructor_var.get()
 
-        course : Course = next(course for course in courses if course.course_id == course_id)
-        instructor : Instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+        course : Course = courses.get(course_id)
+        instructor : Instructor = instructors.get(instructor_id)
 
         valid1, errors1 = instructor.unassign_course(course)
         valid2, errors2 = course.unassign_instructor(instructor)
@@ -128,25 +120,12 @@ class AssignInstructorTab(tk.Frame):
             messagebox.showwarning("Input Error", "\n".join(errors2))
             return
         
-        valid, errors = unassign_instructor(instructor,course)
+        valid, errors = get_backend().unassign_instructor(instructor,course)
         if valid:
             messagebox.showinfo("Success", f"{instructor.name} unassigned from {course.course_name}!")
         else:
             messagebox.showwarning("Input Error", "\n".join(errors))
 
-        # Commented code for JSON
-        # valid1, errors1 = edit_entry_json('Course', course)
-        # valid2, errors2 = edit_entry_json('Instructor', instructor)
-
-        # if valid1 and valid2:
-        #     messagebox.showinfo("Success", f"{instructor.name} unassigned from {course.course_name}!")
-        # elif not valid1 and not valid2:
-        #     messagebox.showwarning("Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-        # elif not valid1:
-        #     messagebox.showwarning("Input Error", "\n".join(errors1))
-        # elif not valid2:
-        #     messagebox.showwarning("Input Error", "\n".join(errors2))
-
     def on_course_select(self, event):
         """
         Updates the course_var attribute with the selected course_id
@@ -170,4 +149,11 @@ class AssignInstructorTab(tk.Frame):
         Updates the UI for the course and instructor dropdown to reflect new data
         """
         self.course_dropdown['values'] = [course.course_name for course in courses]
-        self.instructor_dropdown['values'] = [instructor.name for instructor in instructors]
\ No newline at end of file
+        self.instructor_dropdown['values'] = [instructor.name for instructor in instructors]
+
+    def load_data(self):
+        """
+        Loads the courses and instructors on a worker thread, then fills the dropdowns with them.
+        """
+        self.refresh_runner.submit(lambda: (courses.load(), instructors.load()), lambda _: self.update_ui(),
+                                   on_error=lambda e: messagebox.showwarning("Refresh Error", str(e)))
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, students, instructors
+from tkinterTabs.Worker import TaskRunner
 
 class AddCourseTab(tk.Frame):
     def __init__(self, parent):
@@ -17,6 +17,7 @@ class AddCourseTab(tk.Frame):
             name_input (tk.Entry): Course Name Input
             course_id_input (tk.Entry): Course ID Input
             edit_name_input (tk.Entry): Edit Course Name input
+            refresh_runner (TaskRunner): Loads the courses off the main loop
         """
         super().__init__(parent)
         self.course_dropdown : ttk.Combobox = None
@@ -25,9 +26,13 @@ class AddCourseTab(tk.Frame):
         self.name_input : tk.Entry = None
         self.course_id_input : tk.Entry = None
         self.edit_name_input : tk.Entry = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddCourseTab. Sets up the layout and adds all the components
@@ -57,7 +62,7 @@ class AddCourseTab(tk.Frame):
         # Course Dropdown Label
         tk.Label(self, text="Select Course: ").grid(row=7, column=0, padx=0, pady=5)
         # Course Dropdown
-        self.course_dropdown = ttk.Combobox(self, values=[course.course_name for course in courses], state='readonly')
+        self.course_dropdown = ttk.Combobox(self, state='readonly')
         self.course_dropdown.grid(row=7, column=1, padx=0, pady=5)
         self.course_dropdown.bind("<<ComboboxSelected>>", self.on_select)
 
@@ -87,8 +92,7 @@ class AddCourseTab(tk.Frame):
             course_id = self.course_id_input.get()
 
             course : Course = Course(course_id, name, "", [])
-            # valid, errors = add_entry_json('Course', course)
-            valid, errors = add_course(course)
+            valid, errors = get_backend().add_course(course)
 
             if valid:
                 messagebox.showinfo("Success", f"Course {course.course_name} created successfully!")
@@ -111,30 +115,25 @@ class AddCourseTab(tk.Frame):
         try:
             course_id = self.course_var.get()
 
-            course : Course = next(course for course in courses if course.course_id == course_id)
+            course : Course = courses.get(course_id)
 
             for student_id in course.enrolled_students:
-                student : Student = next(student for student in students if student.student_id == student_id)
+                student : Student = students.get(student_id)
                 valid, errors = student.unregister_course(course)
-                # valid, errors = edit_entry_json('Student', student)
                 if not valid:
                     messagebox.showwarning("Input Error", "\n".join(errors))
                     return
-                students.remove(student)
-                students.append(student)
+                students.replace(student)
 
             if course.instructor_id:
-                instructor : Instructor = next(inst for inst in instructors if inst.instructor_id == course.instructor_id)
+                instructor : Instructor = instructors.get(course.instructor_id)
                 valid, errors = instructor.unassign_course(course)
-                # valid, errors = edit_entry_json('Instructor', instructor)
                 if not valid:
                     messagebox.showwarning("Input Error", "\n".join(errors))
                     return
-                instructors.remove(instructor)
-                instructors.append(instructor)
+                instructors.replace(instructor)
 
-            # valid, errors = delete_entry_json('Course',course)
-            valid, errors = delete_course(course)
+            valid, errors = get_backend().delete_course(course)
 
             if valid:
                 messagebox.showinfo("Success", f"Course {course.course_name} has been removed successfully!")
@@ -157,18 +156,16 @@ class AddCourseTab(tk.Frame):
             course_id = self.course_var.get()
             new_name = self.edit_name_input.get()
 
-            course : Course = next(course for course in courses if course.course_id == course_id)
+            course : Course = courses.get(course_id)
 
             course.course_name = new_name
 
-            # valid, errors = edit_entry_json('Course',course)
-            valid, errors = edit_course(course)
+            valid, errors = get_backend().edit_course(course)
 
             if valid:
                 messagebox.showinfo("Success", f"Course {course.course_name} has been edited successfully!")
                 self.edit_name_input.delete(0, tk.END)
-                courses.remove(course)
-                courses.append(course)
+                courses.replace(course)
                 self.update_ui()
             else:
                 messagebox.showwarning("Input Error", "\n".join(errors))
@@ -191,3 +188,9 @@ class AddCourseTab(tk.Frame):
         """
         self.course_dropdown['values'] = [course.course_name for course in courses]
 
+    def load_data(self):
+        """
+        Loads the courses on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(courses.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: messagebox.showwarning("Refresh Error", str(e)))
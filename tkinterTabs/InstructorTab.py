@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import instructors, courses
+from tkinterTabs.Worker import TaskRunner
 
 class AddInstructorTab(tk.Frame):
     def __init__(self, parent):
@@ -23,6 +23,7 @@ class AddInstructorTab(tk.Frame):
             edit_name_input (tk.Entry): Edit name input
             edit_age_input (tk.Entry): Edit age input
             edit_email_input (tk.Entry): Edit email input
+            refresh_runner (TaskRunner): Loads the instructors off the main loop
         """
         super().__init__(parent)
         self.instructor_dropdown : ttk.Combobox = None
@@ -37,9 +38,13 @@ class AddInstructorTab(tk.Frame):
         self.edit_name_input : tk.Entry = None
         self.edit_age_input : tk.Entry = None
         self.edit_email_input : tk.Entry = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddInstructorTab. Sets up the layout and adds all the components
@@ -81,7 +86,7 @@ class AddInstructorTab(tk.Frame):
         # Instructor Dropdown Title
         tk.Label(self, text="Select Instructor:").grid(row=7, column=0, padx=0, pady=5)
         # Instructor Dropdown
-        self.instructor_dropdown = ttk.Combobox(self, values=[instructor.name for instructor in instructors], state='readonly')
+        self.instructor_dropdown = ttk.Combobox(self, state='readonly')
         self.instructor_dropdown.grid(row=7, column=1, padx=0, pady=5)
         self.instructor_dropdown.bind("<<ComboboxSelected>>", self.on_select)
 
@@ -126,8 +131,7 @@ class AddInstructorTab(tk.Frame):
 
             instructor : Instructor = Instructor(name, age, email, instructor_id, [])
 
-            # valid, errors = add_entry_json('Instructor', instructor)
-            valid, errors = add_instructor(instructor)
+            valid, errors = get_backend().add_instructor(instructor)
 
             if valid:
                 messagebox.showinfo("Success", f"Instructor {instructor.name} created successfully!")
@@ -153,20 +157,17 @@ class AddInstructorTab(tk.Frame):
         try:
             instructor_id = self.instructor_var.get()
 
-            instructor : Instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+            instructor : Instructor = instructors.get(instructor_id)
 
             for course_id in instructor.assigned_courses:
-                course : Course = next(course for course in courses if course.course_id == course_id)
+                course : Course = courses.get(course_id)
                 valid, errors = course.unassign_instructor(instructor)
-                # valid, errors = edit_entry_json('Course', course)
                 if not valid:
                     messagebox.showwarning("Input Error", "\n".join(errors))
                     return
-                courses.remove(course)
-                courses.append(course)
+                courses.replace(course)
 
-            # valid, errors = delete_entry_json('Instructor', instructor)
-            valid, errors = delete_instructor(instructor)
+            valid, errors = get_backend().delete_instructor(instructor)
 
             if valid:
                 messagebox.showinfo("Success", f"Instructor {instructor.name} has been removed successfully!")
@@ -194,22 +195,20 @@ class AddInstructorTab(tk.Frame):
             new_email = self.edit_email_input.get()
 
             instructor_id = self.instructor_var.get()
-            instructor : Instructor = next(inst for inst in instructors if inst.instructor_id == instructor_id)
+            instructor : Instructor = instructors.get(instructor_id)
 
             instructor.name = new_name
             instructor.age = new_age
             instructor._email = new_email
 
-            # valid, errors = edit_entry_json('Instructor', instructor)
-            valid, errors = edit_instructor(instructor)
+            valid, errors = get_backend().edit_instructor(instructor)
 
             if valid:
                 messagebox.showinfo("Success", f"Instructor {instructor.name} edited successfully!")
                 self.edit_name_input.delete(0, tk.END)
                 self.edit_age_input.delete(0, tk.END)
                 self.edit_email_input.delete(0, tk.END)
-                instructors.remove(instructor)
-                instructors.append(instructor)
+                instructors.replace(instructor)
                 self.update_ui()
             else:
                 messagebox.showwarning("Input Error", "\n".join(errors))
@@ -234,3 +233,10 @@ class AddInstructorTab(tk.Frame):
         Updated the UI for the instructor dropdown to relfect new data
         """
         self.instructor_dropdown['values'] = [instructor.name for instructor in instructors]
+
+    def load_data(self):
+        """
+        Loads the instructors on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(instructors.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: messagebox.showwarning("Refresh Error", str(e)))
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, students
+from tkinterTabs.Worker import TaskRunner
 
 class RegisterCourseTab(tk.Frame):
     def __init__(self, parent):
@@ -15,15 +15,20 @@ class RegisterCourseTab(tk.Frame):
             student_dropdown (ttk.Combobox): Dropdown of the list of students from shared.py
             course_var (tk.StringVar): Selected course_id
             student_var (tk.StringVar): Selected student_id
+            refresh_runner (TaskRunner): Loads the dropdown data off the main loop
         """
         super().__init__(parent)
         self.course_dropdown : ttk.Combobox = None
         self.student_dropdown : ttk.Combobox = None
         self.course_var : tk.StringVar = tk.StringVar()
         self.student_var : tk.StringVar = tk.StringVar()
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.update_ui()
+
     def init_ui(self):
         """
         Initializes the UI of the RegisterCourseTab. Sets up the layout and adds all the components
@@ -34,14 +39,14 @@ class RegisterCourseTab(tk.Frame):
         # Course Dropdown Label
         tk.Label(self, text="Select Course: ").grid(row=1, column=0, padx=0, pady=5)
         # Course Dropdown
-        self.course_dropdown = ttk.Combobox(self, values=[course.course_name for course in courses], state='readonly')
+        self.course_dropdown = ttk.Combobox(self, state='readonly')
         self.course_dropdown.grid(row=1, column=1, padx=0, pady=5)
         self.course_dropdown.bind("<<ComboboxSelected>>", self.on_course_select)
 
         # Student Dropdown Label
         tk.Label(self, text="Select Student: ").grid(row=2, column=0, padx=0, pady=5)
         # Student Label
-        self.student_dropdown = ttk.Combobox(self, values=[student.name for student in students], state='readonly')
+        self.student_dropdown = ttk.Combobox(self, state='readonly')
         self.student_dropdown.grid(row=2, column=1, padx=0, pady=5)
         self.student_dropdown.bind("<<ComboboxSelected>>", self.on_student_select)
 
@@ -68,8 +73,8 @@ class RegisterCourseTab(tk.Frame):
             course_id = self.course_var.get()
             student_id = self.student_var.get()
 
-            course : Course = next(course for course in courses if course.course_id == course_id)
-            student : Student = next(student for student in students if student.student_id == student_id)
+            course : Course = courses.get(course_id)
+            student : Student = students.get(student_id)
 
             valid1, errors1 = student.register_course(course)
             valid2, errors2 = course.enroll_student(student)
@@ -84,24 +89,12 @@ class RegisterCourseTab(tk.Frame):
                 messagebox.showwarning("Input Error", "\n".join(errors2))
                 return
             
-            valid, errors = register_course(student,course)
+            valid, errors = get_backend().register_course(student,course)
             if valid:
                 messagebox.showinfo("Success", f"{student.name} assigned to {course.course_name}!")
             else:
                 messagebox.showwarning("Input Error", "\n".join(errors))
 
-            # valid1, errors1 = edit_entry_json('Course', course)
-            # valid2, errors2 = edit_entry_json('Student', student)
-
-            # if valid1 and valid2:
-            #     messagebox.showinfo("Success", f"{student.name} assigned to {course.course_name}!")
-            # elif not valid1 and not valid2:
-            #     messagebox.showwarning("Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-            # elif not valid1:
-            #     messagebox.showwarning("Input Error", "\n".join(errors1))
-            # elif not valid2:
-            #     messagebox.showwarning("Input Error", "\n".join(errors2))
-
         except Exception as e:
             messagebox.showwarning("Exception", str(e))
 
@@ -116,8 +109,8 @@ class RegisterCourseTab(tk.Frame):
             course_id = self.course_var.get()
             student_id = self.student_var.get()
 
-            course : Course = next(course for course in courses if course.course_id == course_id)
-            student : Student = next(student for student in students if student.student_id == student_id)
+            course : Course = courses.get(course_id)
+            student : Student = students.get(student_id)
 
             valid1, errors1 = student.unregister_course(course)
             valid2, errors2 = course.unenroll_student(student)
@@ -132,24 +125,12 @@ class RegisterCourseTab(tk.Frame):
                 messagebox.showwarning("Input Error", "\n".join(errors2))
                 return
             
-            valid, errors = unregister_course(student,course)
+            valid, errors = get_backend().unregister_course(student,course)
             if valid:
                 messagebox.showinfo("Success", f"{student.name} unassigned from {course.course_name}!")
             else:
                 messagebox.showwarning("Input Error", "\n".join(errors))
 
-            # valid1, errors1 = edit_entry_json('Course', course)
-            # valid2, errors2 = edit_entry_json('Student', student)
-
-            # if valid1 and valid2:
-            #     messagebox.showinfo("Success", f"{student.name} unassigned from {course.course_name}!")
-            # elif not valid1 and not valid2:
-            #     messagebox.showwarning("Input Error", "\n".join(errors1) + "\n" + "\n".join(errors2))
-            # elif not valid1:
-            #     messagebox.showwarning("Input Error", "\n".join(errors1))
-            # elif not valid2:
-            #     messagebox.showwarning("Input Error", "\n".join(errors2))
-
         except Exception as e:
             messagebox.showwarning("Exception", str(e))
 
@@ -174,6 +155,29 @@ class RegisterCourseTab(tk.Frame):
     def update_ui(self):
         """
          Updates the UI for the course and student dropdown to reflect the new data
+
+         The data is loaded on a worker thread and the dropdowns are filled once it is ready.
+        """
+        self.refresh_runner.submit(self.load_dropdown_data, self.show_dropdown_data,
+                                   on_error=lambda e: messagebox.showwarning("Refresh Error", str(e)))
+
+    def load_dropdown_data(self):
+        """
+        Loads the course and student names for the dropdowns. Runs on a worker thread, iterating the
+        registries' `as_list` copies, which the GUI thread replaces rather than changes.
+
+        Returns:
+            tuple: The list of course names and the list of student names.
+        """
+        return [course.course_name for course in courses], [student.name for student in students]
+
+    def show_dropdown_data(self, dropdown_data):
+        """
+        Fills the course and student dropdowns with the names returned by load_dropdown_data.
+
+        Args:
+            dropdown_data (tuple): The result of load_dropdown_data.
         """
-        self.course_dropdown['values'] = [course.course_name for course in courses]
-        self.student_dropdown['values'] = [student.name for student in students]
\ No newline at end of file
+        course_names, student_names = dropdown_data
+        self.course_dropdown['values'] = course_names
+        self.student_dropdown['values'] = student_names
\ No newline at end of file
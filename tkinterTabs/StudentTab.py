@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from classes.Course import *
-from crud.jsonCRUD import *
-from crud.databaseCRUD import *
+from crud.storageBackend import get_backend
 from shared import courses, students
+from tkinterTabs.Worker import TaskRunner
 
 class AddStudentTab(tk.Frame):
     def __init__(self, parent):
@@ -23,6 +23,7 @@ class AddStudentTab(tk.Frame):
             edit_name_input (tk.Entry): Edit name input
             edit_age_input (tk.Entry): Edit age input
             edit_email_input (tk.Entry): Edit email input
+            refresh_runner (TaskRunner): Loads the students off the main loop
         """
         super().__init__(parent)
         self.student_dropdown : ttk.Combobox = None
@@ -37,9 +38,13 @@ class AddStudentTab(tk.Frame):
         self.edit_name_input : tk.Entry = None
         self.edit_age_input : tk.Entry = None
         self.edit_email_input : tk.Entry = None
+        self.refresh_runner : TaskRunner = TaskRunner(self)
 
         self.init_ui()
 
+        # Load the dropdown data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the AddStudentTab. Sets up the layout and adds all the components
@@ -81,7 +86,7 @@ class AddStudentTab(tk.Frame):
         # Student Dropdown Label
         tk.Label(self, text="Select Student:").grid(row=7, column=0, padx=0, pady=5)
         # Student Dropdown
-        self.student_dropdown = ttk.Combobox(self, values=[student.name for student in students], state='readonly')
+        self.student_dropdown = ttk.Combobox(self, state='readonly')
         self.student_dropdown.grid(row=7, column=1, padx=0, pady=5)
         self.student_dropdown.bind("<<ComboboxSelected>>", self.on_select)
 
@@ -126,8 +131,7 @@ class AddStudentTab(tk.Frame):
 
             student : Student = Student(name, age, email, student_id, [])
 
-            # valid, errors = add_entry_json('Student', student)
-            valid, errors = add_student(student)
+            valid, errors = get_backend().add_student(student)
 
             if valid:
                 messagebox.showinfo("Success", f"Student {name} created successfully!")
@@ -153,20 +157,17 @@ class AddStudentTab(tk.Frame):
         try:
             student_id = self.student_var.get()
 
-            student : Student = next(student for student in students if student.student_id == student_id)
+            student : Student = students.get(student_id)
 
             for course_id in student.registered_courses:
-                course : Course = next(course for course in courses if course.course_id == course_id)
+                course : Course = courses.get(course_id)
                 valid, errors = course.unenroll_student(student)
-                # valid, errors = edit_entry_json('Course', course)
                 if not valid:
                     messagebox.showwarning("Input Error", "\n".join(errors))
                     return
-                courses.remove(course)
-                courses.append(course)
+                courses.replace(course)
 
-            # valid, errors = delete_entry_json('Student', student)
-            valid, errors = delete_student(student)
+            valid, errors = get_backend().delete_student(student)
 
             if valid:
                 messagebox.showinfo("Success", f"Student {student.name} has been removed successfully!")
@@ -194,22 +195,20 @@ class AddStudentTab(tk.Frame):
             new_email = self.edit_email_input.get()
 
             student_id = self.student_var.get()
-            student = next(student for student in students if student.student_id == student_id)
+            student = students.get(student_id)
 
             student.name = new_name
             student.age = new_age
             student._email = new_email
 
-            # valid, errors = edit_entry_json('Student', student)
-            valid, errors = edit_student(student)
+            valid, errors = get_backend().edit_student(student)
 
             if valid:
                 messagebox.showinfo("Success", f"Student {student.name} edited successfully!")
                 self.edit_name_input.delete(0, tk.END)
                 self.edit_age_input.delete(0, tk.END)
                 self.edit_email_input.delete(0, tk.END)
-                students.remove(student)
-                students.append(student)
+                students.replace(student)
                 self.update_ui()
             else:
                 messagebox.showwarning("Input Error", "\n".join(errors))
@@ -233,4 +232,11 @@ class AddStudentTab(tk.Frame):
         """
         Updated the UI for the instructor dropdown to relfect new data
         """
-        self.student_dropdown['values'] = [student.name for student in students]
\ No newline at end of file
+        self.student_dropdown['values'] = [student.name for student in students]
+
+    def load_data(self):
+        """
+        Loads the students on a worker thread, then fills the dropdown with them.
+        """
+        self.refresh_runner.submit(students.load, lambda _: self.update_ui(),
+                                   on_error=lambda e: messagebox.showwarning("Refresh Error", str(e)))
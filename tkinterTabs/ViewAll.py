@@ -6,6 +6,8 @@ from  crud.jsonCRUD import *
 import shared
 from shared import courses,instructors,students
 import importlib
+from searchIndex import SearchIndex
+from tkinterTabs.Worker import TaskRunner
 
 class ViewAllTab(tk.Frame):
     def __init__(self, parent):
@@ -20,18 +22,35 @@ class ViewAllTab(tk.Frame):
             students_data (list): List of students in a format that is compatible with table widget
             instructors_data (list): List of instructors in a format that is compatible with table widget
             courses_data (list): List of courses in a format that is compatible with table widget
+            search_indexes (dict): SearchIndex over the formatted data of each table
+            row_positions (dict): Position of each row in the data of each table, keyed by id, built on the first edit
+            search_var (tk.StringVar): Search query
+            search_delay (int): Milliseconds to wait after a keystroke before searching
+            search_runner (TaskRunner): Runs the searches off the main loop
+            refresh_runner (TaskRunner): Runs the data reloads off the main loop
         """
         super().__init__(parent)
         self.table : str = 'Student'
         self.courses : list = courses
         self.instructors : list = instructors
         self.students : list = students
-        self.students_data : list = self.fix_student_data()
-        self.instructors_data : list = self.fix_instructor_data()
-        self.courses_data : list = self.fix_course_data()
+        self.students_data : list = []
+        self.instructors_data : list = []
+        self.courses_data : list = []
+        self.search_indexes : dict = self.build_search_indexes([], [], [])
+        self.row_positions : dict = {}
+        self.search_var : tk.StringVar = None
+        self.search_delay : int = 200
+        self.search_runner : TaskRunner = TaskRunner(self)
+        self.refresh_runner : TaskRunner = TaskRunner(self)
+        for registry in (self.students, self.instructors, self.courses):
+            registry.subscribe(self.on_registry_changed)
 
         self.init_ui()
 
+        # Load the data in the background, so the window shows before it is loaded
+        self.load_data()
+
     def init_ui(self):
         """
         Initializes the UI of the ViewAllTab. Sets up the layout and adds all the components
@@ -40,11 +59,11 @@ class ViewAllTab(tk.Frame):
         tk.Label(self, text="View All", font=("Arial", 28)).pack(pady=10)
 
         # Search Var
-        search_var = tk.StringVar()
+        self.search_var = tk.StringVar()
         # Search Input
-        search_entry = tk.Entry(self, textvariable=search_var)
+        search_entry = tk.Entry(self, textvariable=self.search_var)
         search_entry.pack()
-        search_entry.bind('<KeyRelease>', lambda event: self.search_data(self.treeview, search_var.get()))
+        search_entry.bind('<KeyRelease>', lambda event: self.search_data(self.treeview, self.search_var.get()))
 
         # Treeview
         self.treeview = ttk.Treeview(self, show="headings", height=10)
@@ -111,6 +130,7 @@ class ViewAllTab(tk.Frame):
         """
         self.table = 'Course'
         headers = ["Course ID", "Course Name", "Instructor", "Enrolled Students"]
+        self.search_runner.cancel()
         self.update_tree_headers(headers)
         self.update_tree_data(self.courses_data)
 
@@ -120,6 +140,7 @@ class ViewAllTab(tk.Frame):
         """
         self.table = 'Student'
         headers = ["Student ID", "Student Name", "Student Age", "Student Email", "Registered Courses"]
+        self.search_runner.cancel()
         self.update_tree_headers(headers)
         self.update_tree_data(self.students_data)
 
@@ -129,21 +150,36 @@ class ViewAllTab(tk.Frame):
         """
         self.table = 'Instructor'
         headers = ["Instructor ID", "Instructor Name", "Instructor Age", "Instructor Email", "Assigned Courses"]
+        self.search_runner.cancel()
         self.update_tree_headers(headers)
         self.update_tree_data(self.instructors_data)
 
     def search_data(self, treeview, query):
         """
         Filters the data in the current table based on the search query entered by the user.
+
+        The search is debounced and runs on a worker thread; a newer keystroke supersedes it.
         """
-        query = query.lower()
         if treeview["columns"] == ("Course ID", "Course Name", "Instructor", "Enrolled Students"):
-            filtered_data = [row for row in self.courses_data if query in str(row).lower()]
+            search_index = self.search_indexes['Course']
         elif treeview["columns"] == ("Student ID", "Student Name", "Student Age", "Student Email", "Registered Courses"):
-            filtered_data = [row for row in self.students_data if query in str(row).lower()]
+            search_index = self.search_indexes['Student']
         elif treeview["columns"] == ("Instructor ID", "Instructor Name", "Instructor Age", "Instructor Email", "Assigned Courses"):
-            filtered_data = [row for row in self.instructors_data if query in str(row).lower()]
-        self.update_tree_data(filtered_data)
+            search_index = self.search_indexes['Instructor']
+        self.search_runner.submit(lambda: search_index.search(query), self.update_tree_data, delay=self.search_delay)
+
+    def build_search_indexes(self, students_data, instructors_data, courses_data):
+        """
+        Builds the search index of each table from its formatted data.
+
+        Returns:
+            dict: A SearchIndex per table.
+        """
+        return {
+            'Student': SearchIndex(students_data),
+            'Instructor': SearchIndex(instructors_data),
+            'Course': SearchIndex(courses_data),
+        }
 
     def export_csv(self):
         """
@@ -175,9 +211,81 @@ class ViewAllTab(tk.Frame):
         self.instructors = instructors
         self.courses = courses
 
-        self.students_data = self.fix_student_data()
-        self.instructors_data = self.fix_instructor_data()
-        self.courses_data = self.fix_course_data()
+        self.search_runner.cancel()
+        self.load_data()
+
+    def load_data(self):
+        """
+        Loads the data of every table and shows it, without blocking the main loop.
+
+        The entities not loaded yet are loaded on a worker thread; the fields shown are then copied on the
+        main loop, where the entities are changed, and formatted on a worker thread.
+        """
+        self.refresh_runner.submit(self.load_registries, self.format_table_data, on_error=self.show_refresh_error)
+
+    def load_registries(self):
+        """
+        Loads the entities of every table that were not loaded yet. Runs on a worker thread.
+        """
+        for registry in (self.students, self.instructors, self.courses):
+            registry.load()
+
+    def format_table_data(self, _=None):
+        """
+        Copies the data of every table and formats the copy on a worker thread, then shows it.
+        """
+        snapshot = self.snapshot_table_data()
+        self.refresh_runner.submit(lambda: self.load_table_data(snapshot), self.show_table_data,
+                                   on_error=self.show_refresh_error)
+
+    def show_refresh_error(self, error):
+        """
+        Warns the user that the data could not be refreshed.
+        """
+        messagebox.showwarning("Refresh Error", str(error))
+
+    def snapshot_table_data(self):
+        """
+        Copies the fields shown of every student, instructor and course, with their ids as tuples, so they can be
+        formatted on a worker thread while the entities keep changing. Runs on the main loop.
+
+        Returns:
+            tuple: The students, instructors and courses, each as a list of tuples.
+        """
+        students = [(student.student_id, student.name, student.age, student._email, tuple(student.registered_courses))
+                    for student in self.students]
+        instructors = [(instructor.instructor_id, instructor.name, instructor.age, instructor._email,
+                        tuple(instructor.assigned_courses)) for instructor in self.instructors]
+        courses = [(course.course_id, course.course_name, course.instructor_id, tuple(course.enrolled_students))
+                   for course in self.courses]
+        return students, instructors, courses
+
+    def load_table_data(self, snapshot):
+        """
+        Formats the data of every table and builds their search indexes. Runs on a worker thread.
+
+        Args:
+            snapshot (tuple): The result of snapshot_table_data.
+
+        Returns:
+            tuple: The students, instructors and courses data, and the search indexes.
+        """
+        students, instructors, courses = snapshot
+        students_data = self.fix_student_data(students, courses)
+        instructors_data = self.fix_instructor_data(instructors, courses)
+        courses_data = self.fix_course_data(courses, students, instructors)
+        search_indexes = self.build_search_indexes(students_data, instructors_data, courses_data)
+        return students_data, instructors_data, courses_data, search_indexes
+
+    def show_table_data(self, table_data):
+        """
+        Stores the data returned by load_table_data and refreshes the table.
+
+        Args:
+            table_data (tuple): The result of load_table_data.
+        """
+        self.students_data, self.instructors_data, self.courses_data, self.search_indexes = table_data
+        self.row_positions = {}
 
         if self.table == 'Student':
             self.update_tree_data(self.students_data)
@@ -186,65 +294,107 @@ class ViewAllTab(tk.Frame):
         elif self.table == 'Instructor':
             self.update_tree_data(self.instructors_data)
 
-    def fix_student_data(self):
+    def on_registry_changed(self, item, edited):
+        """
+        Keeps the tables in step with the registries. An edited student or instructor only has its row formatted
+        again and replaced, in the table data and its search index; any other change reloads the data.
+
+        Args:
+            item (object): The entity that changed, or None if its registry was cleared.
+            edited (bool): Whether the entity was edited in place rather than added or removed.
+        """
+        if edited and isinstance(item, Student):
+            table, format_rows = 'Student', self.fix_student_data
+            snapshot = (item.student_id, item.name, item.age, item._email, tuple(item.registered_courses))
+        elif edited and isinstance(item, Instructor):
+            table, format_rows = 'Instructor', self.fix_instructor_data
+            snapshot = (item.instructor_id, item.name, item.age, item._email, tuple(item.assigned_courses))
+        else:
+            self.load_data()
+            return
+
+        position = self.row_position(table, snapshot[0])
+        courses = [self.courses.get(course_id) for course_id in snapshot[4]]
+        if position is None or any(course is None for course in courses):
+            self.load_data()
+            return
+        courses = [(course.course_id, course.course_name, course.instructor_id, tuple(course.enrolled_students))
+                   for course in courses]
+        # The search index shares its rows with the table data, so both are updated
+        self.search_indexes[table].update_row(position, format_rows([snapshot], courses)[0])
+        if self.table == table:
+            self.search_data(self.treeview, self.search_var.get())
+
+    def row_position(self, table, id):
+        """
+        Returns the position of the row with the given id in the data of a table.
+
+        Args:
+            table (str): The table, e.g. 'Student'.
+            id (str): The id of the row, its first column.
+
+        Returns:
+            int: The position of the row, or None if there is no row with that id.
+        """
+        positions = self.row_positions.get(table)
+        if positions is None:
+            rows = self.search_indexes[table].rows
+            positions = self.row_positions[table] = {row[0]: position for position, row in enumerate(rows)}
+        return positions.get(id)
+
+    def fix_student_data(self, students, courses):
         """
         Formats the student data to be compatible with the table widget.
 
+        Args:
+            students (list): The students, as copied by snapshot_table_data.
+            courses (list): The courses, as copied by snapshot_table_data.
+
         Returns:
             list: A list of tuples containing formatted student data.
         """
+        course_names_by_id = {course[0]: course[1] for course in courses}
         rows = []
-        for student in self.students:
-            student_id = student.student_id
-            name = student.name
-            age = student.age
-            email = student._email
-            registered_courses = student.registered_courses
-            course_names = [
-                next(course.course_name for course in self.courses if course.course_id == course_id) 
-                for course_id in registered_courses
-            ] if registered_courses else ['No Courses']
+        for student_id, name, age, email, registered_courses in students:
+            course_names = [course_names_by_id[course_id] for course_id in registered_courses] if registered_courses else ['No Courses']
             rows.append((student_id, name, age, email, " ".join(course_names)))
         return rows
 
-    def fix_instructor_data(self):
+    def fix_instructor_data(self, instructors, courses):
         """
         Formats the instructor data to be compatible with the table widget.
 
+        Args:
+            instructors (list): The instructors, as copied by snapshot_table_data.
+            courses (list): The courses, as copied by snapshot_table_data.
+
         Returns:
             list: A list of tuples containing formatted instructor data.
         """
+        course_names_by_id = {course[0]: course[1] for course in courses}
         rows = []
-        for instructor in self.instructors:
-            instructor_id = instructor.instructor_id
-            name = instructor.name
-            age = instructor.age
-            email = instructor._email
-            assigned_courses = instructor.assigned_courses
-            course_names = [
-                next(course.course_name for course in self.courses if course.course_id == course_id)
-                for course_id in assigned_courses
-            ] if assigned_courses else ['No Courses']
+        for instructor_id, name, age, email, assigned_courses in instructors:
+            course_names = [course_names_by_id[course_id] for course_id in assigned_courses] if assigned_courses else ['No Courses']
             rows.append((instructor_id, name, age, email, " ".join(course_names)))
         return rows
 
-    def fix_course_data(self):
+    def fix_course_data(self, courses, students, instructors):
         """
         Formats the course data to be compatible with the table widget.
 
+        Args:
+            courses (list): The courses, as copied by snapshot_table_data.
+            students (list): The students, as copied by snapshot_table_data.
+            instructors (list): The instructors, as copied by snapshot_table_data.
+
         Returns:
             list: A list of tuples containing formatted course data.
         """
+        instructor_names_by_id = {instructor[0]: instructor[1] for instructor in instructors}
+        student_names_by_id = {student[0]: student[1] for student in students}
         rows = []
-        for course in self.courses:
-            course_id = course.course_id
-            course_name = course.course_name
-            instructor_id = course.instructor_id
-            instructor_name = list(filter(lambda instructor: instructor.instructor_id == instructor_id, self.instructors))[0].name if instructor_id else 'No Instructor'
-            enrolled_students = course.enrolled_students
-            student_names = [
-                next(student.name for student in self.students if student.student_id == student_id)
-                for student_id in enrolled_students
-            ] if enrolled_students else ['No Students']
+        for course_id, course_name, instructor_id, enrolled_students in courses:
+            instructor_name = instructor_names_by_id[instructor_id] if instructor_id else 'No Instructor'
+            student_names = [student_names_by_id[student_id] for student_id in enrolled_students] if enrolled_students else ['No Students']
             rows.append((course_id, course_name, instructor_name, " ".join(student_names)))
         return rows
\ No newline at end of file
@@ -0,0 +1,112 @@
+import tkinter as tk
+import threading
+import queue
+
+class TaskRunner:
+    def __init__(self, widget: tk.Misc, poll_interval: int = 50):
+        """
+        Initializes the TaskRunner, which runs work off the Tk main loop and posts the result back to it.
+
+        Tk widgets may only be touched from the main thread, so the work runs on a background thread
+        and the main loop polls for its result with after(). Every submit supersedes the previous one:
+        a task that has not started yet is skipped, and the result of one that is already running is dropped.
+
+        Attributes:
+            widget (tk.Misc): Widget whose main loop schedules the timers and polling
+            poll_interval (int): Milliseconds between two polls for finished tasks
+            generation (int): Number of the latest submitted task
+            timer (str): Id of the pending debounce timer
+            polling (bool): Whether the main loop is currently polling for results
+            outstanding (int): Number of tasks handed to the worker thread whose result was not polled yet
+            tasks (queue.Queue): Tasks waiting for the worker thread
+            results (queue.Queue): Results waiting for the main loop
+        """
+        self.widget : tk.Misc = widget
+        self.poll_interval : int = poll_interval
+        self.generation : int = 0
+        self.timer : str = None
+        self.polling : bool = False
+        self.outstanding : int = 0
+        self.tasks : queue.Queue = queue.Queue()
+        self.results : queue.Queue = queue.Queue()
+        self._thread : threading.Thread = None
+
+    def submit(self, function, callback, delay: int = 0, on_error=None):
+        """
+        Schedules `function` to run on the worker thread and `callback` to receive its result on the main loop.
+
+        Args:
+            function (callable): The work to run, taking no arguments.
+            callback (callable): Called on the main loop with the result of `function`.
+            delay (int): Milliseconds to wait for another submit before starting, used to debounce keystrokes.
+            on_error (callable): Called on the main loop with the exception if `function` raises.
+        """
+        self.generation += 1
+        if self.timer is not None:
+            self.widget.after_cancel(self.timer)
+        generation = self.generation
+        self.timer = self.widget.after(delay, lambda: self.start(generation, function, callback, on_error))
+
+    def cancel(self):
+        """
+        Supersedes every submitted task without starting a new one.
+        """
+        self.generation += 1
+        if self.timer is not None:
+            self.widget.after_cancel(self.timer)
+            self.timer = None
+
+    def start(self, generation: int, function, callback, on_error):
+        """
+        Hands a task to the worker thread and starts polling for its result.
+        """
+        self.timer = None
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.work, daemon=True)
+            self._thread.start()
+        self.outstanding += 1
+        self.tasks.put((generation, function, callback, on_error))
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_interval, self.poll)
+
+    def work(self):
+        """
+        Runs the queued tasks one at a time on the worker thread, skipping superseded ones.
+        """
+        while True:
+            generation, function, callback, on_error = self.tasks.get()
+            if generation != self.generation:
+                self.results.put(None)
+                continue
+            try:
+                self.results.put((generation, function(), None, callback, on_error))
+            except Exception as e:
+                self.results.put((generation, None, e, callback, on_error))
+
+    def poll(self):
+        """
+        Delivers finished results on the main loop and keeps polling while tasks are outstanding.
+        """
+        while True:
+            try:
+                finished = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.outstanding -= 1
+            if finished is None:
+                continue
+            generation, result, error, callback, on_error = finished
+            if generation != self.generation:
+                continue
+            if error is None:
+                callback(result)
+            elif on_error is not None:
+                on_error(error)
+            else:
+                raise error
+
+        if self.outstanding > 0:
+            self.widget.after(self.poll_interval, self.poll)
+        else:
+            self.polling = False